@@ -0,0 +1,115 @@
+"""Benchmark the static server against the exported site.
+
+Serves the export with `StaticServer` and measures requests per second over
+keep-alive connections for a page, its precompressed variant, a revalidation
+answered with 304, a hashed asset and an unknown path. Without an export in
+`.web/_static`, a synthetic site of the same shape is generated.
+
+Usage: python benchmarks/bench_serve.py [export_dir] [--seconds 3] [--connections 32]
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pcweb.build.compress import compress_export  # noqa: E402
+from pcweb.build.export import EXPORT_DIR  # noqa: E402
+from pcweb.build.serve import StaticServer  # noqa: E402
+
+
+def make_site(root: Path) -> Path:
+    (root / "_next" / "static" / "chunks").mkdir(parents=True)
+    (root / "index.html").write_text("<p>Reflex</p>" * 4_000)
+    (root / "404.html").write_text("<p>Not found</p>" * 200)
+    (root / "_next" / "static" / "chunks" / "main.js").write_text("let a=1;" * 20_000)
+    compress_export(root)
+    return root
+
+
+def first_asset(export_dir: Path) -> str:
+    for path in sorted((export_dir / "_next" / "static").rglob("*.js")):
+        return "/" + path.relative_to(export_dir).as_posix()
+    return "/404.html"
+
+
+async def _request(reader, writer, head: bytes) -> tuple[int, dict[str, str]]:
+    writer.write(head)
+    response = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1")
+    status_line, *lines = response.split("\r\n")
+    headers = {}
+    for line in lines:
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    await reader.readexactly(int(headers.get("content-length", 0)))
+    return int(status_line.split()[1]), headers
+
+
+async def bench(port: int, path: str, headers: dict, seconds: float, connections: int):
+    lines = [f"GET {path} HTTP/1.1", "Host: localhost"]
+    lines.extend(f"{name}: {value}" for name, value in headers.items())
+    head = ("\r\n".join(lines) + "\r\n\r\n").encode()
+    deadline = time.perf_counter() + seconds
+    statuses = set()
+
+    async def client() -> int:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        count = 0
+        while time.perf_counter() < deadline:
+            status, _ = await _request(reader, writer, head)
+            statuses.add(status)
+            count += 1
+        writer.close()
+        return count
+
+    start = time.perf_counter()
+    total = sum(await asyncio.gather(*(client() for _ in range(connections))))
+    elapsed = time.perf_counter() - start
+    return total / elapsed, statuses
+
+
+async def run(export_dir: Path, seconds: float, connections: int):
+    server = await StaticServer(export_dir).start("127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    _, index = await _request(reader, writer, b"GET / HTTP/1.1\r\nHost: x\r\n\r\n")
+    writer.close()
+
+    cases = [
+        ("page", "/", {}),
+        ("page, brotli", "/", {"Accept-Encoding": "br, gzip"}),
+        ("page, 304", "/", {"If-None-Match": index.get("etag", "")}),
+        ("hashed asset", first_asset(export_dir), {"Accept-Encoding": "gzip"}),
+        ("404", "/missing/page", {}),
+    ]
+    print(f"{connections} connections, {seconds:.0f} s per case")
+    for name, path, headers in cases:
+        rate, statuses = await bench(port, path, headers, seconds, connections)
+        codes = ",".join(str(status) for status in sorted(statuses))
+        print(f"{name:<14} {rate:10.0f} req/s  ({codes})")
+    server.close()
+    await server.wait_closed()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("export_dir", nargs="?", default=str(EXPORT_DIR))
+    parser.add_argument("--seconds", type=float, default=3)
+    parser.add_argument("--connections", type=int, default=32)
+    args = parser.parse_args()
+
+    export_dir = Path(args.export_dir)
+    with tempfile.TemporaryDirectory() as tmp:
+        if not export_dir.is_dir():
+            print(f"{export_dir} doesn't exist, serving a synthetic site.")
+            export_dir = make_site(Path(tmp))
+        asyncio.run(run(export_dir, args.seconds, args.connections))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Benchmark the binary state updates against the JSON ones.
+
+Replays a session of state updates like the site's, e.g. switching the forms
+demo or signing up for the newsletter, over one connection, and reports the
+bytes per update and the time to encode and decode one, for JSON as Reflex
+sends it and for the binary encoding.
+
+Usage: python benchmarks/bench_state_delta.py [--updates 10000]
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pcweb.state_delta import DeltaDecoder, DeltaEncoder  # noqa: E402
+
+
+def make_updates(rng: random.Random, count: int) -> list[dict]:
+    options = ["Account", "Privacy", "Payments", "Advanced"]
+    updates = []
+    for i in range(count):
+        kind = rng.random()
+        if kind < 0.6:
+            delta = {"state.forms_state": {"clicked": rng.choice(options)}}
+        elif kind < 0.9:
+            delta = {
+                "state.navbar_state": {
+                    "search_input": "reflex"[: rng.randrange(1, 7)],
+                    "enter": rng.random() < 0.5,
+                }
+            }
+        else:
+            delta = {
+                "state.index_state": {
+                    "email": f"user{i}@example.com",
+                    "signed_up": True,
+                    "show_confetti": True,
+                },
+                "state": {"is_hydrated": True},
+            }
+        updates.append({"delta": delta, "events": [], "final": True})
+    return updates
+
+
+def bench(name: str, encode, decode, updates: list[dict]):
+    start = time.perf_counter()
+    messages = [encode(update) for update in updates]
+    encoded = time.perf_counter() - start
+    start = time.perf_counter()
+    for message in messages:
+        decode(message)
+    decoded = time.perf_counter() - start
+    size = sum(len(message) for message in messages) / len(messages)
+    print(
+        f"{name:<8} {size:8.1f} bytes/update  "
+        f"encode {encoded / len(updates) * 1e6:6.2f} us  "
+        f"decode {decoded / len(updates) * 1e6:6.2f} us"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--updates", type=int, default=10_000)
+    args = parser.parse_args()
+
+    updates = make_updates(random.Random(0), args.updates)
+    print(f"{args.updates} updates over one connection")
+    bench(
+        "json",
+        lambda update: json.dumps(update).encode(),
+        json.loads,
+        updates,
+    )
+    encoder, decoder = DeltaEncoder(), DeltaDecoder()
+    bench("binary", encoder.encode, decoder.decode, updates)
+
+
+if __name__ == "__main__":
+    main()
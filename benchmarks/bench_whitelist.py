@@ -0,0 +1,78 @@
+"""Benchmark matching routes against the page whitelist.
+
+Compares the compiled PathMatcher against a linear `startswith` scan over the
+patterns, for 10k routes and 1k patterns.
+
+Usage: python benchmarks/bench_whitelist.py
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pcweb.whitelist import PathMatcher  # noqa: E402
+
+ROUTES = 10_000
+PATTERNS = 1_000
+
+
+def make_routes(rng: random.Random) -> list[str]:
+    return [
+        f"/docs/section-{rng.randrange(200)}/page-{i}/{rng.choice(['intro', 'api', 'faq'])}"
+        for i in range(ROUTES)
+    ]
+
+
+def make_patterns(rng: random.Random) -> list[str]:
+    prefixes = [f"/docs/section-{rng.randrange(5_000)}/" for _ in range(PATTERNS // 2)]
+    globs = [
+        f"/docs/section-{rng.randrange(5_000)}/*/intro" for _ in range(PATTERNS // 2)
+    ]
+    return prefixes + globs
+
+
+def linear_scan(prefixes: list[str], path: str) -> bool:
+    for prefix in prefixes:
+        if path.startswith(prefix):
+            return True
+    return False
+
+
+def bench(name: str, fn, routes: list[str]) -> float:
+    start = time.perf_counter()
+    matched = sum(fn(route) for route in routes)
+    elapsed = time.perf_counter() - start
+    per_route = elapsed / len(routes) * 1e9
+    print(
+        f"{name:<14} {elapsed * 1e3:8.2f} ms  {per_route:8.0f} ns/route  {matched} matched"
+    )
+    return elapsed
+
+
+def main():
+    rng = random.Random(0)
+    routes = make_routes(rng)
+    patterns = make_patterns(rng)
+    prefixes = patterns[: PATTERNS // 2]
+
+    start = time.perf_counter()
+    matcher = PathMatcher(patterns)
+    print(
+        f"compiled {PATTERNS} patterns in {(time.perf_counter() - start) * 1e3:.2f} ms"
+    )
+
+    scan = bench("linear scan", lambda path: linear_scan(prefixes, path), routes)
+    trie = bench("path trie", matcher.match, routes)
+    print(f"path trie is {scan / trie:.1f}x faster (and also matches the globs)")
+
+    # The trie's cost depends on the length of the path, not the pattern count.
+    for count in (10, 100, PATTERNS):
+        subset = patterns[: count // 2] + patterns[PATTERNS // 2 :][: count // 2]
+        bench(f"trie, {count} pats", PathMatcher(subset).match, routes)
+
+
+if __name__ == "__main__":
+    main()
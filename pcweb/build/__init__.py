@@ -0,0 +1 @@
+"""Build tooling for the pcweb site."""
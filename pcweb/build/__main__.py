@@ -0,0 +1,216 @@
+"""Command line entry point for the pcweb build tooling.
+
+Usage: python -m pcweb.build <command> [options]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from pcweb.build import manifest
+
+
+def _manifest(args: argparse.Namespace) -> int:
+    entries = manifest.scan_pages()
+    if args.check:
+        exists = manifest.MANIFEST_FILE.exists()
+        if not exists or list(manifest.load_manifest()) != entries:
+            print(
+                f"{manifest.MANIFEST_FILE} is out of date, "
+                "run `python -m pcweb.build manifest`."
+            )
+            return 1
+        return 0
+    manifest.write_manifest(entries)
+    print(f"Wrote {len(entries)} routes to {manifest.MANIFEST_FILE}.")
+    return 0
+
+
+def _ssg(args: argparse.Namespace) -> int:
+    from pcweb.build.export import EXPORT_DIR
+    from pcweb.build.ssg import export_static_pages
+
+    export_dir = Path(args.export_dir) if args.export_dir else EXPORT_DIR
+    if not export_dir.is_dir():
+        print(f"{export_dir} doesn't exist, run `reflex export` first.")
+        return 1
+    return 1 if export_static_pages(export_dir) else 0
+
+
+def _critical(args: argparse.Namespace) -> int:
+    from pcweb.build.critical import export_critical_css
+    from pcweb.build.export import EXPORT_DIR
+
+    export_dir = Path(args.export_dir) if args.export_dir else EXPORT_DIR
+    if not export_dir.is_dir():
+        print(f"{export_dir} doesn't exist, run `reflex export` first.")
+        return 1
+    export_critical_css(export_dir)
+    return 0
+
+
+def _compress(args: argparse.Namespace) -> int:
+    from pcweb.build.compress import COMPRESSION_MANIFEST, compress_export, encodings
+    from pcweb.build.export import EXPORT_DIR
+
+    export_dir = Path(args.export_dir) if args.export_dir else EXPORT_DIR
+    if not export_dir.is_dir():
+        print(f"{export_dir} doesn't exist, run `reflex export` first.")
+        return 1
+    manifest = compress_export(export_dir, args.workers)
+    total = sum(sizes["identity"] for sizes in manifest.values())
+    print(f"Compressed {len(manifest)} files ({total} bytes):")
+    for encoding in encodings():
+        size = sum(
+            sizes.get(encoding, sizes["identity"]) for sizes in manifest.values()
+        )
+        print(f"  {encoding}: {size} bytes ({total - size} saved)")
+    print(f"Wrote {export_dir / COMPRESSION_MANIFEST}.")
+    return 0
+
+
+def _serve(args: argparse.Namespace) -> int:
+    from pcweb.build.export import EXPORT_DIR
+    from pcweb.build.serve import serve
+
+    export_dir = Path(args.export_dir) if args.export_dir else EXPORT_DIR
+    if not export_dir.is_dir():
+        print(f"{export_dir} doesn't exist, run `reflex export` first.")
+        return 1
+    serve(export_dir, args.host, args.port)
+    return 0
+
+
+def _svg(args: argparse.Namespace) -> int:
+    from pcweb.build.assets import ASSETS_DIR, BUILD_DIR, build_output
+    from pcweb.pages.landing_page_components.logo import LOGO_SVG, optimized_logo
+
+    sizes = [("landing()", len(LOGO_SVG.encode()), len(optimized_logo().encode()))]
+    for path in sorted(ASSETS_DIR.rglob("*.svg")):
+        relative = path.relative_to(ASSETS_DIR)
+        if relative.parts[0] != BUILD_DIR:
+            sizes.append(
+                (relative.as_posix(), path.stat().st_size, len(build_output(path)))
+            )
+    for name, before, after in sizes:
+        print(f"{name}: {before} -> {after} bytes ({before - after} saved)")
+    before, after = sum(size[1] for size in sizes), sum(size[2] for size in sizes)
+    print(f"Total: {before} -> {after} bytes ({before - after} saved)")
+    return 0
+
+
+def _fonts(args: argparse.Namespace) -> int:
+    from pcweb.build.fonts import FONTS_CSS, vendor_fonts
+
+    count = vendor_fonts()
+    print(f"Wrote {count} font files and {FONTS_CSS}.")
+    return 0
+
+
+def _icons(args: argparse.Namespace) -> int:
+    from pcweb.build.icons import SPRITE_FILE, lucide_module, used_icons, write_sprite
+
+    names = used_icons()
+    size = write_sprite(names)
+    modules = sum(lucide_module(name).stat().st_size for name in names)
+    print(f"Wrote {len(names)} icons to {SPRITE_FILE}: {', '.join(names)}.")
+    print(
+        f"lucide-react modules: {modules} bytes -> sprite: {size} bytes "
+        f"({modules - size} saved)"
+    )
+    return 0
+
+
+def _states(args: argparse.Namespace) -> int:
+    from pcweb.build.states import app_states, default_sizes, event_plan, reflex_loads
+
+    sizes = default_sizes()
+    total = sum(sizes.values())
+    print(f"All states: {len(sizes)} ({total} bytes with default values)")
+    for state in app_states():
+        redis = reflex_loads(state)
+        for name in sorted(state.event_handlers):
+            plan = event_plan(state, name)
+            planned = sum(sizes[loaded] for loaded in plan["states"])
+            loaded = sum(sizes[loaded] for loaded in redis)
+            print(f"{state.get_full_name()}.{name}:")
+            print(f"  plan: {', '.join(plan['states'])} ({planned} bytes)")
+            if plan["computed_vars"]:
+                print(f"  computed vars: {', '.join(plan['computed_vars'])}")
+            if not plan["complete"]:
+                print("  the handler couldn't be analysed, so it loads every state")
+            print(f"  Reflex with Redis: {len(redis)} states ({loaded} bytes)")
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run a build command.
+
+    Args:
+        argv: The command line arguments.
+
+    Returns:
+        The exit code.
+    """
+    parser = argparse.ArgumentParser(prog="python -m pcweb.build")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    command = commands.add_parser("manifest", help="Regenerate the route manifest.")
+    command.add_argument(
+        "--check", action="store_true", help="Fail if the manifest is out of date."
+    )
+    command.set_defaults(run=_manifest)
+
+    command = commands.add_parser(
+        "ssg", help="Check the exported static pages and make them cacheable."
+    )
+    command.add_argument("--export-dir", help="The exported site to process.")
+    command.set_defaults(run=_ssg)
+
+    command = commands.add_parser(
+        "critical", help="Inline the critical CSS of the exported pages."
+    )
+    command.add_argument("--export-dir", help="The exported site to process.")
+    command.set_defaults(run=_critical)
+
+    command = commands.add_parser(
+        "compress", help="Write brotli and gzip variants of the exported files."
+    )
+    command.add_argument("--export-dir", help="The exported site to process.")
+    command.add_argument(
+        "--workers", type=int, help="How many processes to compress with."
+    )
+    command.set_defaults(run=_compress)
+
+    command = commands.add_parser("serve", help="Serve the exported site.")
+    command.add_argument("--export-dir", help="The exported site to serve.")
+    command.add_argument("--host", default="0.0.0.0", help="The interface to bind.")
+    command.add_argument("--port", type=int, default=3000, help="The port to bind.")
+    command.set_defaults(run=_serve)
+
+    command = commands.add_parser(
+        "svg", help="Report the bytes the SVG optimizer saves on each SVG."
+    )
+    command.set_defaults(run=_svg)
+
+    command = commands.add_parser(
+        "fonts", help="Download the fonts and subset them to the site's text."
+    )
+    command.set_defaults(run=_fonts)
+
+    command = commands.add_parser(
+        "icons", help="Write the sprite of the icons the site uses."
+    )
+    command.set_defaults(run=_icons)
+
+    command = commands.add_parser(
+        "states", help="Report the states each event has to load."
+    )
+    command.set_defaults(run=_states)
+
+    args = parser.parse_args(argv)
+    return args.run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,49 @@
+"""The pcweb app, with hooks that run once the pages have been compiled."""
+
+from typing import Callable
+
+import reflex as rx
+
+from pcweb.build.backend import is_backend_only
+
+# Functions to call after every successful compile, in registration order.
+_post_compile_hooks: list[Callable[[], None]] = []
+
+
+def on_compiled(hook: Callable[[], None]) -> Callable[[], None]:
+    """Register a function to run after the app has been compiled.
+
+    Registering a function again has no effect, so setup code that runs more
+    than once doesn't run its hook more than once.
+
+    Args:
+        hook: The function to call.
+
+    Returns:
+        The function, so this can be used as a decorator.
+    """
+    if hook not in _post_compile_hooks:
+        _post_compile_hooks.append(hook)
+    return hook
+
+
+class App(rx.App):
+    """A Reflex app that runs the pcweb build hooks after compiling."""
+
+    def compile_(self, *args, **kwargs):
+        """Compile the app, then run the registered post-compile hooks.
+
+        Backend-only workers have no pages, so they skip compiling entirely
+        rather than overwrite the compiled frontend with an empty one.
+
+        Args:
+            args: Positional arguments passed to the Reflex compiler.
+            kwargs: Keyword arguments passed to the Reflex compiler.
+        """
+        if is_backend_only():
+            return
+        super().compile_(*args, **kwargs)
+        if not self._should_compile():
+            return
+        for hook in _post_compile_hooks:
+            hook()
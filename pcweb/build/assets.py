@@ -0,0 +1,188 @@
+"""Fingerprint the files in assets/ so they can be cached forever.
+
+`asset("/Reflex.svg")` returns a URL with the content hash of the file in
+its name, e.g. `/_build/Reflex.3f2a9c1e.svg`. After each compile the files
+resolved in the build are copied there, optimizing SVGs on the way, and the
+copies no longer in the manifest are removed. When a file changes its URL
+changes too, so everything under `/_build/` is served as immutable. The
+copies are generated and can be deleted at any time.
+"""
+
+import hashlib
+import json
+from functools import lru_cache
+from pathlib import Path
+
+from reflex import constants
+
+from pcweb.build.atomic import ATOMIC_STYLESHEET
+from pcweb.build.export import add_headers
+from pcweb.build.manifest import PCWEB_ROOT
+from pcweb.build.svg import optimize
+
+# The assets of the app.
+ASSETS_DIR = PCWEB_ROOT.parent / constants.Dirs.APP_ASSETS
+
+# The directory of the fingerprinted copies, relative to the assets.
+BUILD_DIR = "_build"
+
+# The original URL of each fingerprinted asset, mapped to its hashed URL.
+ASSET_MANIFEST = ASSETS_DIR / BUILD_DIR / "manifest.json"
+
+# Fingerprinted files never change, so they can be cached for a year.
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# The assets resolved in this process, keyed by their original URL.
+_resolved: dict[str, str] = {}
+
+# The content of the fingerprinted files to write, keyed by their URL.
+_build_files: dict[str, bytes] = {}
+
+
+@lru_cache(maxsize=None)
+def file_digest(path: Path) -> str:
+    """Get a short hash of the content of a file.
+
+    Args:
+        path: The file.
+
+    Returns:
+        The first 8 hex digits of the SHA-256 of the file.
+    """
+    return hashlib.sha256(path.read_bytes()).hexdigest()[:8]
+
+
+@lru_cache(maxsize=None)
+def build_output(path: Path) -> bytes:
+    """Get the content an asset is served with.
+
+    Args:
+        path: The source file of the asset.
+
+    Returns:
+        The content of the file, optimized if it is an SVG.
+    """
+    if path.suffix == ".svg":
+        return optimize(path.read_text(encoding="utf-8")).encode()
+    return path.read_bytes()
+
+
+def asset(url: str) -> str:
+    """Get the fingerprinted URL of a file in assets/.
+
+    Args:
+        url: The URL the file is served at without fingerprinting, e.g.
+            "/logos/dark/reflex.svg".
+
+    Returns:
+        The URL of the fingerprinted copy of the file.
+
+    Raises:
+        FileNotFoundError: If the file is not in assets/.
+    """
+    source = ASSETS_DIR / url.lstrip("/")
+    if not source.is_file():
+        raise FileNotFoundError(f"There is no asset at {source}.")
+    _resolved[url] = _build_url(source.relative_to(ASSETS_DIR), build_output(source))
+    return _resolved[url]
+
+
+def svg_asset(name: str, markup: str) -> str:
+    """Serve SVG markup from a fingerprinted file instead of inlining it.
+
+    Args:
+        name: The name of the file, without the extension.
+        markup: The SVG markup.
+
+    Returns:
+        The URL of the file.
+    """
+    relative = Path("inline") / f"{name}.svg"
+    # Keyed like the URLs of the other assets, though no such file exists.
+    _resolved[f"/{relative.as_posix()}"] = _build_url(relative, markup.encode())
+    return _resolved[f"/{relative.as_posix()}"]
+
+
+def _build_url(relative: Path, content: bytes) -> str:
+    """Get the URL of a fingerprinted file, to write after the compile.
+
+    Args:
+        relative: The path of the file, relative to the assets.
+        content: The content of the file.
+
+    Returns:
+        The URL of the file.
+    """
+    digest = hashlib.sha256(content).hexdigest()[:8]
+    name = f"{relative.stem}.{digest}{relative.suffix}"
+    url = f"/{BUILD_DIR}/{(relative.parent / name).as_posix()}"
+    _build_files[url] = content
+    return url
+
+
+def write_build_files():
+    """Write the fingerprinted files resolved in this process."""
+    for url, content in _build_files.items():
+        target = ASSETS_DIR / url.lstrip("/")
+        if not target.exists():
+            # The name is the content hash, so an existing copy is up to date.
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(content)
+
+
+def prune_build_files(manifest: dict[str, str]):
+    """Remove the fingerprinted files that are no longer in the manifest.
+
+    Args:
+        manifest: The hashed URL of each asset, keyed by its original URL.
+    """
+    build_dir = ASSETS_DIR / BUILD_DIR
+    keep = {ASSET_MANIFEST} | {
+        ASSETS_DIR / url.lstrip("/") for url in manifest.values()
+    }
+    for path in list(build_dir.rglob("*")):
+        # The image variants are managed by pcweb/build/images.py.
+        if path.relative_to(build_dir).parts[0] == "images":
+            continue
+        if path.is_file() and path not in keep:
+            path.unlink()
+
+
+@lru_cache(maxsize=None)
+def sources_digest() -> str:
+    """Hash the source files in assets/, leaving out generated files.
+
+    Returns:
+        A hash of the path and content of every source asset.
+    """
+    digest = hashlib.sha256()
+    for path in sorted(ASSETS_DIR.rglob("*")):
+        relative = path.relative_to(ASSETS_DIR)
+        top = relative.parts[0]
+        generated = top.startswith("_") or top == ATOMIC_STYLESHEET
+        if path.is_file() and not generated:
+            digest.update(f"{relative.as_posix()}\0{file_digest(path)}\0".encode())
+    return digest.hexdigest()
+
+
+def write_asset_manifest():
+    """Write the fingerprinted files, the asset manifest and their headers.
+
+    Assets resolved by earlier builds are kept while their copy exists, since
+    pages restored from the build cache don't resolve their assets again. An
+    asset resolved again replaces its entry, and the copies left out of the
+    manifest are removed.
+    """
+    write_build_files()
+    manifest = json.loads(ASSET_MANIFEST.read_text()) if ASSET_MANIFEST.exists() else {}
+    manifest = {
+        url: hashed
+        for url, hashed in {**manifest, **_resolved}.items()
+        if (ASSETS_DIR / hashed.lstrip("/")).exists()
+    }
+    ASSET_MANIFEST.parent.mkdir(parents=True, exist_ok=True)
+    ASSET_MANIFEST.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    prune_build_files(manifest)
+    add_headers(
+        ASSETS_DIR, {f"/{BUILD_DIR}/*": {"Cache-Control": IMMUTABLE_CACHE_CONTROL}}
+    )
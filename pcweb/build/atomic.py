@@ -0,0 +1,169 @@
+"""Compile repeated inline style declarations to shared atomic CSS classes.
+
+Reflex renders the style props of every component as CSS-in-JS, so a
+declaration like `border="1px solid rgba(186, 199, 247, 0.12);"` is shipped in
+the JS of each page it appears on, and a class is generated for it at runtime
+on every element. Declarations with a plain string value that are used more
+than once are instead moved to a class named after their hash, and the
+classes are written to a single stylesheet.
+"""
+
+import hashlib
+import re
+from pathlib import Path
+from typing import Iterator
+
+import reflex as rx
+from reflex import constants
+from reflex.components.component import CustomComponent
+from reflex.utils import format
+
+# The stylesheet the atomic classes are written to, relative to the assets.
+ATOMIC_STYLESHEET = "atomic.css"
+
+# How many times a declaration must be used before it gets a class.
+MIN_USES = 2
+
+# Style keys that are plain CSS properties, rather than selectors.
+PROPERTY_PATTERN = re.compile(r"^[A-Za-z]+$")
+RULE_PATTERN = re.compile(r"^\.(?P<name>[\w-]+)\.[\w-]+ \{(?P<declaration>.*)\}$")
+
+
+def stylesheet_file() -> Path:
+    """Get the file the atomic stylesheet is written to.
+
+    Returns:
+        The stylesheet in the app's assets.
+    """
+    return Path(constants.Dirs.APP_ASSETS) / ATOMIC_STYLESHEET
+
+
+def declaration(key: str, value: str) -> str:
+    """Format a style prop as a CSS declaration.
+
+    Args:
+        key: The camel case style key, e.g. "boxShadow".
+        value: The value of the style prop.
+
+    Returns:
+        The CSS declaration, e.g. "box-shadow: none".
+    """
+    name = format.to_kebab_case(key)
+    if key[0].isupper():
+        # Vendor prefixes, e.g. "WebkitBackgroundClip".
+        name = f"-{name}"
+    return f"{name}: {value.strip().rstrip(';').strip()}"
+
+
+def class_name(css: str) -> str:
+    """Get the atomic class of a declaration.
+
+    Args:
+        css: The CSS declaration.
+
+    Returns:
+        The class name, stable across builds.
+    """
+    return f"a-{hashlib.sha1(css.encode()).hexdigest()[:8]}"
+
+
+def _atomic_items(component: rx.Component) -> Iterator[tuple[str, str]]:
+    """Get the style props of a component that can be made atomic."""
+    if not isinstance(component.style, dict):
+        return
+    if not isinstance(component.class_name, (str, type(None))):
+        return
+    for key, value in component.style.items():
+        if (
+            isinstance(value, str)
+            and PROPERTY_PATTERN.match(key)
+            and not any(char in value for char in "`{}")
+        ):
+            yield key, value
+
+
+def _walk(components: list[rx.Component]) -> Iterator[rx.Component]:
+    """Walk component trees, including the trees of memoized components."""
+    seen = set()
+    todo = list(components)
+    while todo:
+        node = todo.pop()
+        yield node
+        todo.extend(child for child in node.children if isinstance(child, rx.Component))
+        if isinstance(node, CustomComponent) and node.tag not in seen:
+            # Reflex caches the rendered tree, so this is the one compiled.
+            seen.add(node.tag)
+            todo.append(node.get_component(node))
+
+
+def atomize(components: list[rx.Component], min_uses: int = MIN_USES) -> dict:
+    """Move the repeated style declarations of components to atomic classes.
+
+    The components are modified in place.
+
+    Args:
+        components: The component trees of the pages.
+        min_uses: How many times a declaration must be used to get a class.
+
+    Returns:
+        The CSS declaration of each atomic class, keyed by class name.
+    """
+    nodes = list(_walk(components))
+    uses = {}
+    for node in nodes:
+        for key, value in _atomic_items(node):
+            css = declaration(key, value)
+            uses[css] = uses.get(css, 0) + 1
+
+    rules = {}
+    for node in nodes:
+        classes = []
+        for key, value in list(_atomic_items(node)):
+            css = declaration(key, value)
+            if uses[css] < min_uses:
+                continue
+            name = class_name(css)
+            rules[name] = css
+            classes.append(name)
+            del node.style[key]
+        if classes:
+            node.class_name = " ".join(filter(None, [node.class_name, *classes]))
+    return rules
+
+
+def read_stylesheet(path: Path) -> dict:
+    """Read the rules of an atomic stylesheet.
+
+    Args:
+        path: The stylesheet.
+
+    Returns:
+        The CSS declaration of each atomic class, keyed by class name.
+    """
+    rules = {}
+    lines = path.read_text().splitlines() if path.exists() else []
+    for line in lines:
+        match = RULE_PATTERN.match(line)
+        if match is not None:
+            rules[match.group("name")] = match.group("declaration").strip()
+    return rules
+
+
+def write_stylesheet(rules: dict, path: Path, keep_existing: bool = False):
+    """Write the atomic classes to a stylesheet.
+
+    The class is repeated in each selector so the rule outranks the styles
+    Reflex generates for the components, as the inline style it replaces did.
+
+    Args:
+        rules: The CSS declaration of each atomic class, keyed by class name.
+        path: The stylesheet to write.
+        keep_existing: Keep the rules already in the stylesheet, e.g. for the
+            pages restored from the build cache.
+    """
+    if keep_existing:
+        rules = {**read_stylesheet(path), **rules}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        "".join(f".{name}.{name} {{ {rules[name]} }}\n" for name in sorted(rules))
+    )
@@ -0,0 +1,64 @@
+"""Boot the app as a backend worker, without building any pages.
+
+Backend workers only serve events, so they need the states and models of the
+site but none of its component trees. With `PCWEB_BACKEND_ONLY=1` the app
+imports just the modules that define them and skips adding pages and
+compiling.
+"""
+
+import ast
+import importlib
+from functools import lru_cache
+
+from pcweb.build.config import env_flag
+from pcweb.build.manifest import PCWEB_ROOT
+
+BACKEND_ONLY_ENV_VAR = "PCWEB_BACKEND_ONLY"
+
+# The base classes of the objects a backend worker needs.
+BACKEND_BASES = ("State", "Model")
+
+
+def is_backend_only() -> bool:
+    """Check whether the app is running as a backend-only worker.
+
+    Returns:
+        Whether pages should be skipped.
+    """
+    return env_flag(BACKEND_ONLY_ENV_VAR)
+
+
+def _defines_backend_class(tree: ast.Module) -> bool:
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.ClassDef):
+            continue
+        for base in node.bases:
+            name = base.attr if isinstance(base, ast.Attribute) else getattr(base, "id", "")
+            if name.endswith(BACKEND_BASES):
+                return True
+    return False
+
+
+@lru_cache(maxsize=None)
+def state_modules() -> tuple[str, ...]:
+    """Find the modules that define states or models.
+
+    Returns:
+        The dotted names of the modules.
+    """
+    modules = []
+    for path in sorted(PCWEB_ROOT.rglob("*.py")):
+        source = path.read_text(encoding="utf-8")
+        # Skip parsing the modules that can't define one.
+        if not any(base in source for base in BACKEND_BASES):
+            continue
+        if _defines_backend_class(ast.parse(source)):
+            parts = path.relative_to(PCWEB_ROOT.parent).with_suffix("").parts
+            modules.append(".".join(parts).removesuffix(".__init__"))
+    return tuple(modules)
+
+
+def import_states():
+    """Import the modules that define the states and models of the site."""
+    for module in state_modules():
+        importlib.import_module(module)
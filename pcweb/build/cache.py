@@ -0,0 +1,464 @@
+"""A content-addressed cache of compiled pages.
+
+Each route is keyed on the source of its page module and every `pcweb.*`
+module it imports, directly or transitively. When the key of a route matches
+the previous build, the component tree is not built at all: a placeholder is
+compiled in its place and the cached page output is restored afterwards.
+
+A page also adds to the rest of the app: the components that wrap the app,
+like the Chakra providers, and the frontend packages it imports. These are
+stored with each page, and the placeholder adds them back.
+"""
+
+import ast
+import hashlib
+import importlib
+import inspect
+import json
+import re
+from functools import lru_cache
+from pathlib import Path
+
+from reflex import constants
+from reflex.compiler.utils import compile_custom_component
+from reflex.components.base.fragment import Fragment
+from reflex.components.component import Component
+from reflex.utils import console, imports
+from reflex.utils.imports import ImportVar
+
+from pcweb.build.assets import sources_digest
+from pcweb.build.config import env_flag
+from pcweb.build.manifest import MANIFEST_FILE, PCWEB_ROOT
+from pcweb.build.scheduler import FileScheduler
+from pcweb.route import Route
+
+# Where cached pages are stored between builds.
+CACHE_DIR = Path(".pcweb_cache")
+
+# The shared module Reflex writes the memoized stateful components to.
+STATEFUL_COMPONENTS = Path(constants.Dirs.WEB) / "utils" / "stateful_components.js"
+
+# The shared module Reflex writes the `rx.memo` components to.
+CUSTOM_COMPONENTS = Path(constants.Dirs.WEB) / "utils" / "components.js"
+
+# The modules Reflex doesn't know about that pages load lazily, see
+# `pcweb/components_webpage/lazy.py`.
+LAZY_COMPONENTS = Path(constants.Dirs.WEB) / "components" / "lazy"
+
+# The build options that change the compiled output of the pages.
+OUTPUT_FLAGS = ("PCWEB_ATOMIC_CSS", "PCWEB_EXTRACT_SVG")
+
+IMPORT_PATTERN = re.compile(
+    r'^import (?:(?P<default>[\w$]+)(?:, )?)?(?:\{(?P<names>[^}]*)\})?\s*(?:from )?"(?P<lib>[^"]+)"',
+)
+EXPORT_PATTERN = re.compile(r"^export (?:const|function) (?P<name>[\w$]+)", re.M)
+
+
+def module_file(name: str) -> Path | None:
+    """Get the source file of a pcweb module without importing it.
+
+    Args:
+        name: The dotted name of the module.
+
+    Returns:
+        The path to the source file, or None if it is not a pcweb module.
+    """
+    parts = name.split(".")
+    if parts[0] != "pcweb":
+        return None
+    base = PCWEB_ROOT.joinpath(*parts[1:])
+    for path in (base.with_suffix(".py"), base / "__init__.py"):
+        if path.is_file():
+            return path
+    return None
+
+
+def _imported_modules(name: str, path: Path) -> set[str]:
+    """Find the pcweb modules a module imports.
+
+    Imports nested in functions are included, since the page templates
+    import the navbar and footer lazily.
+
+    Args:
+        name: The dotted name of the module.
+        path: The source file of the module.
+
+    Returns:
+        The names of the imported pcweb modules.
+    """
+    package = name if path.name == "__init__.py" else name.rpartition(".")[0]
+    found = set()
+    for node in ast.walk(ast.parse(path.read_text(encoding="utf-8"))):
+        if isinstance(node, ast.Import):
+            found.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ""
+            if node.level:
+                parent = package.rsplit(".", node.level - 1)[0]
+                base = f"{parent}.{base}" if base else parent
+            found.add(base)
+            # The imported names may be submodules.
+            found.update(f"{base}.{alias.name}" for alias in node.names)
+
+    modules = set()
+    for module in found:
+        # Importing a module imports each of its parent packages too.
+        parts = module.split(".")
+        for i in range(1, len(parts) + 1):
+            parent = ".".join(parts[:i])
+            if module_file(parent) is not None:
+                modules.add(parent)
+    return modules
+
+
+def module_graph(name: str) -> set[str]:
+    """Get a module and every pcweb module it transitively imports.
+
+    Args:
+        name: The dotted name of the module.
+
+    Returns:
+        The names of the modules in the import graph.
+    """
+    seen = set()
+    # Importing a module imports each of its parent packages first.
+    parts = name.split(".")
+    todo = [".".join(parts[:i]) for i in range(1, len(parts) + 1)]
+    while todo:
+        module = todo.pop()
+        path = module_file(module)
+        if module in seen or path is None:
+            continue
+        seen.add(module)
+        todo.extend(_imported_modules(module, path))
+    return seen
+
+
+@lru_cache(maxsize=None)
+def _file_hash(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def route_module(route: Route) -> str:
+    """Get the name of the module that defines a route.
+
+    Args:
+        route: The route.
+
+    Returns:
+        The dotted name of the page module.
+    """
+    return inspect.getmodule(inspect.unwrap(route.component)).__name__
+
+
+def route_key(route: Route) -> str:
+    """Compute the cache key of a route.
+
+    Args:
+        route: The route.
+
+    Returns:
+        A hash of the route and the source of everything it imports.
+    """
+    digest = hashlib.sha256()
+    digest.update(constants.Reflex.VERSION.encode())
+    digest.update(f"{route.path}\0{route.title}".encode())
+    for flag in OUTPUT_FLAGS:
+        digest.update(f"\0{flag}={env_flag(flag)}".encode())
+    # Pages link to the assets through their fingerprinted URLs.
+    digest.update(sources_digest().encode())
+    # Pages link to each other through the paths in the manifest.
+    digest.update(_file_hash(MANIFEST_FILE).encode())
+    for module in sorted(module_graph(route_module(route))):
+        digest.update(f"\0{module}\0{_file_hash(module_file(module))}".encode())
+    return digest.hexdigest()
+
+
+def page_output(path: str) -> Path:
+    """Get the compiled page file for a route.
+
+    Args:
+        path: The path of the route.
+
+    Returns:
+        The page file Reflex writes for the route.
+    """
+    return Path(constants.Dirs.WEB_PAGES) / f"{path.strip('/') or 'index'}.js"
+
+
+def _split_module(code: str) -> tuple[list[str], dict[str, str]]:
+    """Split a compiled JS module into its import lines and exported blocks."""
+    first = EXPORT_PATTERN.search(code)
+    head = code[: first.start()] if first else code
+    body = code[first.start() :] if first else ""
+    starts = [m.start() for m in EXPORT_PATTERN.finditer(body)] + [len(body)]
+    blocks = {}
+    for start, end in zip(starts, starts[1:]):
+        block = body[start:end]
+        blocks[EXPORT_PATTERN.match(block).group("name")] = block
+    return head.splitlines(), blocks
+
+
+def merge_modules(previous: str, fresh: str) -> str:
+    """Merge two versions of a shared JS module.
+
+    Definitions in the fresh module win. Definitions that only exist in the
+    previous module are kept, since restored pages may still import them.
+
+    Args:
+        previous: The module from an earlier build.
+        fresh: The module from this build.
+
+    Returns:
+        The merged module.
+    """
+    old_head, old_blocks = _split_module(previous)
+    new_head, new_blocks = _split_module(fresh)
+
+    imports = {}
+    other = []
+    for line in new_head + old_head:
+        match = IMPORT_PATTERN.match(line)
+        if match is None:
+            if line not in other:
+                other.append(line)
+            continue
+        default, names = imports.setdefault(match.group("lib"), [None, []])
+        default = default or match.group("default")
+        for field in (match.group("names") or "").split(","):
+            if field.strip() and field.strip() not in names:
+                names.append(field.strip())
+        imports[match.group("lib")] = [default, names]
+
+    lines = [line for line in other if line.strip()]
+    for lib, (default, names) in imports.items():
+        bindings = ", ".join(
+            filter(None, [default, f"{{{', '.join(names)}}}" if names else None])
+        )
+        lines.append(
+            f'import {bindings} from "{lib}"' if bindings else f'import "{lib}"'
+        )
+
+    blocks = {**old_blocks, **new_blocks}
+    return "\n".join(lines) + "\n\n" + "".join(blocks.values())
+
+
+def _own_app_wrap_components(cls: type) -> dict[tuple[int, str], Component]:
+    """Get the app wrap components a component class adds itself.
+
+    Reflex caches the app wrap components of some classes and then adds
+    those of the children to the cached dict, so the cache is bypassed.
+    """
+    return inspect.unwrap(cls._get_app_wrap_components)()
+
+
+def _app_wrap_providers() -> dict[tuple[int, str], str]:
+    """Find the component class that adds each app wrap component.
+
+    Returns:
+        The import path of a class whose app wrap components include it,
+        e.g. "reflex.components.chakra.base:ChakraComponent", keyed by the
+        priority and name of the app wrap component.
+    """
+    providers = {}
+    todo = [Component]
+    while todo:
+        cls = todo.pop()
+        todo.extend(cls.__subclasses__())
+        if cls is not Component and "_get_app_wrap_components" in vars(cls):
+            for key in _own_app_wrap_components(cls):
+                providers.setdefault(key, f"{cls.__module__}:{cls.__qualname__}")
+    return providers
+
+
+def _load_class(path: str) -> type:
+    module, _, qualname = path.partition(":")
+    cls = importlib.import_module(module)
+    for name in qualname.split("."):
+        cls = getattr(cls, name)
+    return cls
+
+
+def page_contributions(page: Component) -> dict:
+    """Get what a compiled page adds to the app besides its own module.
+
+    Args:
+        page: The component tree of the page.
+
+    Returns:
+        The priority, name and provider class of each app wrap component of
+        the page, and the imports of the page and of the `rx.memo`
+        components it uses, which decide the frontend packages to install.
+    """
+    providers = _app_wrap_providers()
+    app_wraps = [
+        [priority, name, providers[(priority, name)]]
+        for priority, name in sorted(page._get_all_app_wrap_components())
+    ]
+    page_imports = page._get_all_imports()
+    for custom in page._get_all_custom_components():
+        page_imports = imports.merge_imports(
+            page_imports, compile_custom_component(custom)[1]
+        )
+    return {
+        "app_wraps": app_wraps,
+        "imports": {
+            lib: [field.dict() for field in fields]
+            for lib, fields in sorted(page_imports.items())
+        },
+    }
+
+
+class CachedPage(Fragment):
+    """The placeholder of a page restored from the cache."""
+
+    @classmethod
+    def create(cls, contributions: dict) -> Component:
+        """Create the placeholder of a page.
+
+        Args:
+            contributions: What the page adds to the app, as returned by
+                `page_contributions()`.
+
+        Returns:
+            The placeholder.
+        """
+        placeholder = super().create()
+        placeholder._contributions = contributions
+        return placeholder
+
+    def _get_imports(self) -> imports.ImportDict:
+        return {
+            lib: [ImportVar(**field) for field in fields]
+            for lib, fields in self._contributions["imports"].items()
+        }
+
+    def _get_all_app_wrap_components(self) -> dict[tuple[int, str], Component]:
+        app_wraps = {}
+        for priority, name, provider in self._contributions["app_wraps"]:
+            provided = _own_app_wrap_components(_load_class(provider))
+            app_wraps[(priority, name)] = provided[(priority, name)]
+        return app_wraps
+
+
+class PageCache:
+    """Reuse the compiled output of routes whose sources have not changed."""
+
+    def __init__(self, root: Path = CACHE_DIR):
+        """Load the cache index.
+
+        Args:
+            root: The directory the cache is stored in.
+        """
+        self.root = root
+        self.index_file = root / "index.json"
+        self.index = (
+            json.loads(self.index_file.read_text()) if self.index_file.exists() else {}
+        )
+        # The routes compiled in this build, mapped to their keys.
+        self.hits: dict[str, str] = {}
+        self.misses: dict[str, str] = {}
+        # The component trees of the missed routes, to store what they add.
+        self.trees: dict[str, Component] = {}
+
+    def _page(self, key: str) -> Path:
+        return self.root / "pages" / f"{key}.js"
+
+    def _contributions(self, key: str) -> Path:
+        return self.root / "pages" / f"{key}.json"
+
+    def is_fresh(self, route: Route) -> bool:
+        """Check whether a route can reuse its previously compiled page.
+
+        Args:
+            route: The route to check.
+
+        Returns:
+            Whether the cached page is up to date.
+        """
+        key = route_key(route)
+        cached = self._page(key).exists() and self._contributions(key).exists()
+        if self.index.get(route.path) == key and cached:
+            self.hits[route.path] = key
+            console.info(f"Page cache hit:  {route.path}")
+            return True
+        self.misses[route.path] = key
+        console.info(f"Page cache miss: {route.path}")
+        return False
+
+    def placeholder(self, route: Route) -> Component:
+        """Get the component to compile in place of a fresh route.
+
+        Args:
+            route: A route `is_fresh()` returned True for.
+
+        Returns:
+            A placeholder that adds what the cached page adds to the app.
+        """
+        contributions = self._contributions(self.hits[route.path])
+        return CachedPage.create(json.loads(contributions.read_text()))
+
+    def add_tree(self, route: Route, page: Component):
+        """Keep the component tree of a missed route until it is compiled.
+
+        Args:
+            route: The route.
+            page: The component tree the app compiles for it.
+        """
+        if route.path in self.misses:
+            self.trees[route.path] = page
+
+    def finalize(self):
+        """Restore cached pages and store the newly compiled ones."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        files = FileScheduler()
+        files.map(
+            lambda item: files.copy(self._page(item[1]), page_output(item[0])),
+            self.hits.items(),
+        )
+        compiled = {
+            path: key
+            for path, key in self.misses.items()
+            if path in self.trees and page_output(path).exists()
+        }
+        files.map(
+            lambda item: files.copy(page_output(item[0]), self._page(item[1])),
+            compiled.items(),
+        )
+        for path, key in compiled.items():
+            contributions = page_contributions(self.trees[path])
+            self._contributions(key).write_text(json.dumps(contributions))
+        self.index.update(compiled)
+
+        # Restored pages import shared components that only their own
+        # component trees would have produced, so keep the old definitions.
+        for shared in (STATEFUL_COMPONENTS, CUSTOM_COMPONENTS):
+            snapshot = self.root / shared.name
+            if not shared.exists():
+                continue
+            code = shared.read_text(encoding="utf-8")
+            if self.hits and snapshot.exists():
+                code = merge_modules(snapshot.read_text(encoding="utf-8"), code)
+                shared.write_text(code, encoding="utf-8")
+            snapshot.write_text(code, encoding="utf-8")
+
+        # Lazy modules are only written for the pages that were built, so restore
+        # the ones restored pages need and keep the fresh ones.
+        lazy_snapshot = self.root / LAZY_COMPONENTS.name
+        if lazy_snapshot.is_dir():
+            missing = [
+                path
+                for path in lazy_snapshot.iterdir()
+                if not (LAZY_COMPONENTS / path.name).exists()
+            ]
+            files.map(
+                lambda path: files.copy(path, LAZY_COMPONENTS / path.name), missing
+            )
+        if LAZY_COMPONENTS.is_dir():
+            files.map(
+                lambda path: files.copy(path, lazy_snapshot / path.name),
+                list(LAZY_COMPONENTS.iterdir()),
+            )
+
+        self.index_file.write_text(json.dumps(self.index, indent=2, sort_keys=True))
+        console.info(f"Page cache: {len(self.hits)} hits, {len(self.misses)} misses.")
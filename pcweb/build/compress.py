@@ -0,0 +1,135 @@
+"""Precompress the exported site.
+
+`python -m pcweb.build compress` writes a `.br` and a `.gz` sibling next to
+each compressible file of the export, across worker processes, and lists
+them in `_compressed.json` at the root of the export, so a static server can
+send the variant the client accepts instead of compressing each response.
+Variants that aren't smaller than the file are left out, and variants newer
+than their file are reused.
+
+Brotli needs the optional `brotli` package; without it, only gzip variants
+are written.
+"""
+
+import gzip
+import json
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# The manifest of the precompressed variants, at the root of the export.
+COMPRESSION_MANIFEST = "_compressed.json"
+
+# The types of files worth compressing. Images and fonts are compressed
+# already.
+COMPRESSIBLE_SUFFIXES = {
+    ".html",
+    ".css",
+    ".js",
+    ".mjs",
+    ".json",
+    ".map",
+    ".svg",
+    ".txt",
+    ".xml",
+    ".webmanifest",
+}
+
+# Files smaller than this fit in a packet anyway.
+MIN_SIZE = 1024
+
+# The suffix of the variant of each content encoding, in order of preference.
+SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+
+def encodings() -> list[str]:
+    """Get the content encodings that can be written.
+
+    Returns:
+        The encodings, in order of preference.
+    """
+    return [encoding for encoding in SUFFIXES if encoding != "br" or brotli]
+
+
+def _encode(data: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(data, quality=11)
+    # A fixed mtime keeps the output the same across builds.
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def compress_file(path: Path) -> dict[str, int]:
+    """Write the precompressed variants of a file.
+
+    Args:
+        path: The file to compress.
+
+    Returns:
+        The size of each variant that is smaller than the file, keyed by
+        content encoding.
+    """
+    data = None
+    sizes = {}
+    for encoding in encodings():
+        variant = path.with_name(path.name + SUFFIXES[encoding])
+        if variant.exists() and variant.stat().st_mtime >= path.stat().st_mtime:
+            size = variant.stat().st_size
+        else:
+            data = path.read_bytes() if data is None else data
+            compressed = _encode(data, encoding)
+            size = len(compressed)
+            if size < len(data):
+                variant.write_bytes(compressed)
+        if size < path.stat().st_size:
+            sizes[encoding] = size
+        elif variant.exists():
+            variant.unlink()
+    return sizes
+
+
+def compressible_files(export_dir: Path) -> list[Path]:
+    """Find the files of the export worth compressing.
+
+    Args:
+        export_dir: The exported site.
+
+    Returns:
+        The files, sorted.
+    """
+    return sorted(
+        path
+        for path in export_dir.rglob("*")
+        if path.suffix in COMPRESSIBLE_SUFFIXES
+        and path.name != COMPRESSION_MANIFEST
+        and path.is_file()
+        and path.stat().st_size >= MIN_SIZE
+    )
+
+
+def compress_export(export_dir: Path, workers: int | None = None) -> dict:
+    """Precompress the exported site and write the manifest of the variants.
+
+    Args:
+        export_dir: The exported site.
+        workers: How many processes to compress with, one per core by default.
+
+    Returns:
+        The manifest: for the URL of each compressed file, its size and the
+        size of each of its variants, keyed by content encoding.
+    """
+    files = compressible_files(export_dir)
+    with ProcessPoolExecutor(workers) as pool:
+        variants = list(pool.map(compress_file, files, chunksize=16))
+    manifest = {}
+    for path, sizes in zip(files, variants):
+        if sizes:
+            url = "/" + path.relative_to(export_dir).as_posix()
+            manifest[url] = {"identity": path.stat().st_size, **sizes}
+    (export_dir / COMPRESSION_MANIFEST).write_text(
+        json.dumps(manifest, indent=2, sort_keys=True)
+    )
+    return manifest
@@ -0,0 +1,33 @@
+"""Environment knobs for the pcweb build tooling."""
+
+import os
+
+
+def env_flag(name: str, default: bool = False) -> bool:
+    """Read a boolean flag from the environment.
+
+    Args:
+        name: The name of the environment variable.
+        default: The value to use when the variable is unset.
+
+    Returns:
+        Whether the flag is enabled.
+    """
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def env_int(name: str, default: int) -> int:
+    """Read an integer from the environment.
+
+    Args:
+        name: The name of the environment variable.
+        default: The value to use when the variable is unset or empty.
+
+    Returns:
+        The integer value.
+    """
+    value = os.environ.get(name, "").strip()
+    return int(value) if value else default
@@ -0,0 +1,253 @@
+"""Inline the critical CSS of each exported page and defer the rest.
+
+The exported pages block their first paint on the global stylesheet, which
+holds the app style, the theme and Tailwind. For each page this stage finds
+the elements at the top of its prerendered HTML, inlines the rules that can
+apply to them in a `<style>` and loads the full stylesheets without blocking.
+
+Rules are matched on the tag, classes and id of the last compound of their
+selectors, which keeps a few rules that don't apply but never drops one that
+does. Run it after `reflex export` with `python -m pcweb.build critical`.
+"""
+
+import re
+from html.parser import HTMLParser
+from pathlib import Path
+
+from reflex.utils import console
+
+from pcweb.build.export import html_file
+from pcweb.build.manifest import load_manifest
+
+# How many elements from the top of the body count as above the fold.
+FOLD_ELEMENTS = 250
+
+# Classes that are added to the page at runtime, e.g. for the color mode.
+RUNTIME_CLASSES = {"dark", "light", "dark-theme", "light-theme"}
+
+# At-rules whose block holds rules, rather than declarations.
+GROUPING_RULES = ("@media", "@supports", "@layer", "@container", "@document")
+
+# The marker of the inlined critical CSS, so a page is only processed once.
+CRITICAL_ATTRIBUTE = "data-critical-css"
+
+COMMENT_PATTERN = re.compile(r"/\*.*?\*/", re.S)
+STYLESHEET_PATTERN = re.compile(r"<link\b[^>]*\brel=\"stylesheet\"[^>]*>")
+HREF_PATTERN = re.compile(r'\bhref="(?P<href>[^"]+)"')
+COMBINATOR_PATTERN = re.compile(r"\s*(?<!\\)[>+~]\s*|(?<!\\)\s+")
+# Escaped characters are part of a name, e.g. the `md\:flex` and `w-1\/2`
+# classes of Tailwind, so none of the syntax below matches them.
+FUNCTION_PATTERN = re.compile(r"(?<!\\):{1,2}[\w-]+\([^()]*\)")
+PSEUDO_PATTERN = re.compile(r"(?<!\\):{1,2}[\w-]+")
+ATTRIBUTE_PATTERN = re.compile(r"(?<!\\)\[[^\]]*\]")
+NAME = r"(?:[\w-]|\\[0-9a-fA-F]{1,6} ?|\\.)+"
+CLASS_PATTERN = re.compile(rf"(?<!\\)\.({NAME})")
+ID_PATTERN = re.compile(rf"(?<!\\)#({NAME})")
+ESCAPE_PATTERN = re.compile(r"\\([0-9a-fA-F]{1,6}) ?|\\(.)")
+
+
+def _unescape(name: str) -> str:
+    """Get the name a CSS identifier with escapes stands for, e.g. `md:flex`."""
+    return ESCAPE_PATTERN.sub(
+        lambda match: (
+            chr(int(match.group(1), 16)) if match.group(1) else match.group(2)
+        ),
+        name,
+    )
+
+
+class Fold(HTMLParser):
+    """Collect the tags, classes and ids at the top of a page."""
+
+    def __init__(self, limit: int = FOLD_ELEMENTS):
+        """Create an empty fold.
+
+        Args:
+            limit: How many elements of the body to collect.
+        """
+        super().__init__()
+        self.limit = limit
+        self.count = 0
+        self.in_body = False
+        self.tags = {"html", "body"}
+        self.classes = set(RUNTIME_CLASSES)
+        self.ids = set()
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]):
+        """Collect an element.
+
+        Args:
+            tag: The tag of the element.
+            attrs: The attributes of the element.
+        """
+        if tag == "body":
+            self.in_body = True
+        if tag in ("html", "body") or (self.in_body and self.count < self.limit):
+            self.count += tag not in ("html", "body")
+            self.tags.add(tag)
+            attributes = dict(attrs)
+            self.classes.update((attributes.get("class") or "").split())
+            if attributes.get("id"):
+                self.ids.add(attributes["id"])
+
+    def matches(self, selector: str) -> bool:
+        """Check whether a selector may match an element in the fold.
+
+        Args:
+            selector: A single CSS selector.
+
+        Returns:
+            Whether the last compound of the selector may match.
+        """
+        compound = COMBINATOR_PATTERN.split(selector.strip())[-1]
+        # The arguments of :not(), :is() etc. don't have to match.
+        while FUNCTION_PATTERN.search(compound):
+            compound = FUNCTION_PATTERN.sub("", compound)
+        compound = ATTRIBUTE_PATTERN.sub("", PSEUDO_PATTERN.sub("", compound))
+        tag = re.match(r"[a-zA-Z][\w-]*", compound)
+        if tag is not None and tag.group(0).lower() not in self.tags:
+            return False
+        classes = [_unescape(name) for name in CLASS_PATTERN.findall(compound)]
+        ids = [_unescape(name) for name in ID_PATTERN.findall(compound)]
+        return all(name in self.classes for name in classes) and all(
+            name in self.ids for name in ids
+        )
+
+
+def parse_css(css: str) -> list[tuple[str, str | list]]:
+    """Split a stylesheet into its top-level rules.
+
+    Args:
+        css: The stylesheet.
+
+    Returns:
+        The prelude and block of each rule. The block of a grouping at-rule,
+        e.g. `@media`, is the list of its rules. Statements like `@import`
+        have no block.
+    """
+    css = COMMENT_PATTERN.sub("", css)
+    rules = []
+    start = depth = 0
+    block_start = None
+    quote = None
+    for i, char in enumerate(css):
+        if quote is not None:
+            quote = None if char == quote and css[i - 1] != "\\" else quote
+        elif char in "\"'":
+            quote = char
+        elif char == "{":
+            if depth == 0:
+                block_start = i
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                prelude = css[start:block_start].strip()
+                block = css[block_start + 1 : i]
+                if prelude.startswith(GROUPING_RULES):
+                    block = parse_css(block)
+                rules.append((prelude, block))
+                start = i + 1
+        elif char == ";" and depth == 0:
+            rules.append((css[start:i].strip(), ""))
+            start = i + 1
+    return rules
+
+
+def _serialize(rules: list[tuple[str, str | list]]) -> str:
+    parts = []
+    for prelude, block in rules:
+        if isinstance(block, list):
+            parts.append(f"{prelude}{{{_serialize(block)}}}")
+        elif block or not prelude.startswith("@"):
+            parts.append(f"{prelude}{{{block}}}")
+        else:
+            parts.append(f"{prelude};")
+    return "".join(parts)
+
+
+def critical_rules(
+    rules: list[tuple[str, str | list]], fold: Fold
+) -> list[tuple[str, str | list]]:
+    """Keep the rules that may apply to the fold.
+
+    Args:
+        rules: The parsed stylesheet.
+        fold: The elements above the fold.
+
+    Returns:
+        The critical rules.
+    """
+    critical = []
+    for prelude, block in rules:
+        if isinstance(block, list):
+            inner = critical_rules(block, fold)
+            if inner:
+                critical.append((prelude, inner))
+        elif prelude.startswith("@"):
+            # Font faces, keyframes and imports are needed as they are.
+            critical.append((prelude, block))
+        elif any(fold.matches(selector) for selector in prelude.split(",")):
+            critical.append((prelude, block))
+    return critical
+
+
+def inline_critical_css(export_dir: Path, page: Path) -> tuple[int, int] | None:
+    """Inline the critical CSS of an exported page and defer its stylesheets.
+
+    Args:
+        export_dir: The exported site.
+        page: The HTML file of the page.
+
+    Returns:
+        The size of the inlined CSS and of the deferred stylesheets, or None
+        if the page has no local stylesheets or was already processed.
+    """
+    html = page.read_text(encoding="utf-8")
+    if CRITICAL_ATTRIBUTE in html:
+        return None
+    links = [
+        link
+        for link in STYLESHEET_PATTERN.findall(html)
+        if (export_dir / HREF_PATTERN.search(link).group("href").lstrip("/")).exists()
+    ]
+    if not links:
+        return None
+
+    fold = Fold()
+    fold.feed(html)
+    css = "".join(
+        (export_dir / HREF_PATTERN.search(link).group("href").lstrip("/")).read_text(
+            encoding="utf-8"
+        )
+        for link in links
+    )
+    critical = _serialize(critical_rules(parse_css(css), fold))
+
+    for i, link in enumerate(links):
+        # A print stylesheet doesn't block rendering; switch it on once loaded.
+        deferred = link.replace(
+            'rel="stylesheet"',
+            'rel="stylesheet" media="print" onload="this.media=\'all\'"',
+        )
+        # Without JavaScript the onload never runs, so load it as it was.
+        deferred += f"<noscript>{link}</noscript>"
+        if i == 0:
+            deferred = f"<style {CRITICAL_ATTRIBUTE}>{critical}</style>{deferred}"
+        html = html.replace(link, deferred, 1)
+    page.write_text(html, encoding="utf-8")
+    return len(critical.encode()), len(css.encode())
+
+
+def export_critical_css(export_dir: Path):
+    """Inline the critical CSS of every exported page.
+
+    Args:
+        export_dir: The exported site.
+    """
+    for entry in load_manifest():
+        page = html_file(export_dir, entry["path"])
+        sizes = inline_critical_css(export_dir, page) if page.exists() else None
+        if sizes is not None:
+            critical, total = sizes
+            console.info(f"{entry['path']}: inlined {critical} of {total} bytes of CSS")
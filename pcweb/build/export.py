@@ -0,0 +1,77 @@
+"""Helpers for the stages that post-process the exported site.
+
+`reflex export` leaves the static site in `.web/_static` (and zips it into
+`frontend.zip`). The export stages run on that directory, e.g.
+`python -m pcweb.build ssg`, before it is deployed.
+"""
+
+from pathlib import Path
+
+from reflex import constants
+
+# The directory `reflex export` writes the static site to.
+EXPORT_DIR = Path(constants.Dirs.WEB) / constants.Dirs.STATIC
+
+# The file static hosts read extra response headers from.
+HEADERS_FILE = "_headers"
+
+# The file static hosts read redirects from.
+REDIRECTS_FILE = "_redirects"
+
+
+def html_file(export_dir: Path, path: str) -> Path:
+    """Get the exported HTML file of a route.
+
+    Args:
+        export_dir: The exported site.
+        path: The path of the route.
+
+    Returns:
+        The HTML file of the route.
+    """
+    name = path.strip("/") or "index"
+    for candidate in (export_dir / f"{name}.html", export_dir / name / "index.html"):
+        if candidate.exists():
+            return candidate
+    return export_dir / f"{name}.html"
+
+
+def read_headers(export_dir: Path) -> dict[str, dict[str, str]]:
+    """Read the extra response headers of the exported site.
+
+    Args:
+        export_dir: The exported site.
+
+    Returns:
+        The headers to send, keyed by path pattern.
+    """
+    rules = {}
+    headers = None
+    path = export_dir / HEADERS_FILE
+    lines = path.read_text().splitlines() if path.exists() else []
+    for line in lines:
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        if not line[0].isspace():
+            headers = rules.setdefault(line.strip(), {})
+        elif headers is not None:
+            name, _, value = line.strip().partition(":")
+            headers[name.strip()] = value.strip()
+    return rules
+
+
+def add_headers(export_dir: Path, rules: dict[str, dict[str, str]]):
+    """Add response headers to the exported site.
+
+    Args:
+        export_dir: The exported site.
+        rules: The headers to send, keyed by path pattern.
+    """
+    merged = read_headers(export_dir)
+    for pattern, headers in rules.items():
+        merged.setdefault(pattern, {}).update(headers)
+    lines = []
+    for pattern, headers in merged.items():
+        lines.append(pattern)
+        lines.extend(f"  {name}: {value}" for name, value in headers.items())
+    (export_dir / HEADERS_FILE).write_text("\n".join(lines) + "\n")
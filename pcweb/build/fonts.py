@@ -0,0 +1,317 @@
+"""Self-hosted fonts, subset to the characters the site uses.
+
+`python -m pcweb.build fonts` downloads the upright and italic faces of
+`styles.SANS` and `styles.MONO` in the weights the site uses from Google
+Fonts, subsets them to the characters in the site's sources and writes them
+to `assets/fonts/` with a stylesheet of `@font-face` rules. Commit the
+output: once it exists, the app loads its fonts from there instead of from
+Google Fonts, and preloads them.
+
+Subsetting needs the optional `fonttools` and `brotli` packages.
+"""
+
+import ast
+import hashlib
+import io
+import json
+import re
+import urllib.error
+import urllib.parse
+import urllib.request
+
+import reflex as rx
+from reflex.utils import console
+
+from pcweb import styles
+from pcweb.build.assets import ASSETS_DIR
+from pcweb.build.manifest import PCWEB_ROOT
+
+try:
+    from fontTools import subset
+    from fontTools.ttLib import TTFont
+except ImportError:
+    subset = None
+
+# Where the vendored fonts are written.
+FONTS_DIR = ASSETS_DIR / "fonts"
+FONTS_CSS = FONTS_DIR / "fonts.css"
+FONTS_MANIFEST = FONTS_DIR / "fonts.json"
+
+GOOGLE_FONTS_CSS = "https://fonts.googleapis.com/css2"
+
+# Google Fonts only serves WOFF2 files split by script to browsers it knows.
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+# The scripts to keep of the ones Google Fonts splits the faces into.
+SCRIPTS = ("latin", "latin-ext")
+
+# The props and style keys that set a font weight.
+WEIGHT_PROPS = {"font_weight", "font-weight", "weight"}
+
+# The numeric weight of the named weights of CSS and Radix.
+WEIGHT_NAMES = {
+    "light": 300,
+    "normal": 400,
+    "regular": 400,
+    "medium": 500,
+    "semibold": 600,
+    "bold": 700,
+    "extrabold": 800,
+    "black": 900,
+}
+
+FACE_PATTERN = re.compile(
+    r"/\* (?P<script>[\w-]+) \*/\s*@font-face \{(?P<body>[^}]*)\}"
+)
+DESCRIPTOR_PATTERN = re.compile(r"([\w-]+):\s*([^;]+);")
+URL_PATTERN = re.compile(r"url\((?P<url>[^)]+)\)")
+
+
+def font_families() -> list[str]:
+    """Get the font families the styles use.
+
+    Returns:
+        The first family of `styles.SANS` and of `styles.MONO`.
+    """
+    return [stack.split(",")[0].strip() for stack in (styles.SANS, styles.MONO)]
+
+
+def _weight(value: object) -> int | None:
+    """Get the numeric weight of a CSS or Radix font weight, e.g. "medium"."""
+    if isinstance(value, str) and value.lower() in WEIGHT_NAMES:
+        return WEIGHT_NAMES[value.lower()]
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def font_weights() -> list[int]:
+    """Get the font weights the site uses.
+
+    Returns:
+        The regular weight, the weights in `fonts.font_weights` and every
+        literal weight in the site's sources, passed as a `font_weight` or
+        `weight` prop or given to `font_weight` in a style dict.
+    """
+    weights = {400} | {int(weight) for weight in styles.font_weights.values()}
+    for path in PCWEB_ROOT.rglob("*.py"):
+        for node in ast.walk(ast.parse(path.read_text(encoding="utf-8"))):
+            if isinstance(node, ast.keyword) and node.arg in WEIGHT_PROPS:
+                values = [node.value]
+            elif isinstance(node, ast.Dict):
+                values = [
+                    value
+                    for key, value in zip(node.keys, node.values)
+                    if isinstance(key, ast.Constant) and key.value in WEIGHT_PROPS
+                ]
+            else:
+                continue
+            for value in values:
+                if isinstance(value, ast.Constant):
+                    weight = _weight(value.value)
+                    if weight is not None:
+                        weights.add(weight)
+    return sorted(weights)
+
+
+def site_characters() -> str:
+    """Get the characters the site's text can contain.
+
+    Returns:
+        The printable ASCII characters and every character in a string
+        literal in the site's sources.
+    """
+    characters = {chr(code) for code in range(0x20, 0x7F)}
+    for path in PCWEB_ROOT.rglob("*.py"):
+        for node in ast.walk(ast.parse(path.read_text(encoding="utf-8"))):
+            if isinstance(node, ast.Constant) and isinstance(node.value, str):
+                characters.update(char for char in node.value if char.isprintable())
+    return "".join(sorted(characters))
+
+
+def _fetch(url: str) -> bytes:
+    request = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
+    with urllib.request.urlopen(request, timeout=30) as response:
+        return response.read()
+
+
+def font_faces(family: str, weight: int) -> list[dict[str, str]]:
+    """Get the Google Fonts faces of a family in a weight.
+
+    The italic faces are included, since emphasized text, e.g. in the docs'
+    markdown, can be in any weight.
+
+    Args:
+        family: The font family.
+        weight: The font weight.
+
+    Returns:
+        The descriptors of each upright and italic face, with the script it
+        covers. Empty if the family doesn't come in the weight.
+    """
+    for axes in (f"ital,wght@0,{weight};1,{weight}", f"wght@{weight}"):
+        query = urllib.parse.urlencode({"family": f"{family}:{axes}"}, safe=",;@")
+        try:
+            css = _fetch(f"{GOOGLE_FONTS_CSS}?{query}").decode()
+            break
+        except urllib.error.HTTPError as error:
+            if error.code != 400:
+                raise
+            # Google Fonts rejects styles and weights a family doesn't have.
+    else:
+        return []
+    faces = []
+    for match in FACE_PATTERN.finditer(css):
+        face = dict(DESCRIPTOR_PATTERN.findall(match.group("body")))
+        face["script"] = match.group("script")
+        face["url"] = URL_PATTERN.search(face["src"]).group("url")
+        faces.append(face)
+    return faces
+
+
+def subset_font(data: bytes, characters: str) -> bytes | None:
+    """Subset a font to characters.
+
+    Args:
+        data: The font file.
+        characters: The characters to keep.
+
+    Returns:
+        The subset as WOFF2, or None if the font has none of the characters.
+    """
+    font = TTFont(io.BytesIO(data))
+    covered = set(font.getBestCmap() or {})
+    unicodes = [ord(char) for char in characters if ord(char) in covered]
+    if not unicodes:
+        return None
+    options = subset.Options()
+    options.flavor = "woff2"
+    options.layout_features = ["*"]
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=unicodes)
+    subsetter.subset(font)
+    output = io.BytesIO()
+    font.save(output)
+    return output.getvalue()
+
+
+def _font_face(face: dict[str, str], url: str) -> str:
+    return "\n".join(
+        [
+            "@font-face {",
+            f"  font-family: {face['font-family']};",
+            f"  font-style: {face['font-style']};",
+            f"  font-weight: {face['font-weight']};",
+            "  font-display: swap;",
+            f"  src: url({url}) format('woff2');",
+            f"  unicode-range: {face['unicode-range']};",
+            "}",
+        ]
+    )
+
+
+def _vendor_file(family: str, face: dict[str, str], characters: str) -> str | None:
+    """Download and subset the file of a face.
+
+    Args:
+        family: The font family.
+        face: The descriptors of the face.
+        characters: The characters to keep.
+
+    Returns:
+        The name of the vendored file, or None if it would be empty.
+    """
+    data = subset_font(_fetch(face["url"]), characters)
+    if data is None:
+        return None
+    digest = hashlib.sha256(face["url"].encode()).hexdigest()[:8]
+    slug = family.lower().replace(" ", "-")
+    name = f"{slug}-{face['script']}-{digest}.woff2"
+    (FONTS_DIR / name).write_bytes(data)
+    console.info(f"{name}: {len(data)} bytes")
+    return name
+
+
+def vendor_fonts() -> int:
+    """Download and subset the fonts and write their stylesheet.
+
+    Returns:
+        The number of font files written.
+
+    Raises:
+        RuntimeError: If fontTools is not installed.
+    """
+    if subset is None:
+        raise RuntimeError("Install fonttools and brotli to subset the fonts.")
+    characters = site_characters()
+    FONTS_DIR.mkdir(parents=True, exist_ok=True)
+
+    rules = []
+    # The vendored file of each downloaded font, or None if it is empty once
+    # subset. Variable fonts serve every weight from the same file.
+    files: dict[str, str | None] = {}
+    preload = []
+    for family in font_families():
+        for weight in font_weights():
+            faces = font_faces(family, weight)
+            if not faces:
+                console.warn(f"{family} doesn't come in weight {weight}.")
+            for face in faces:
+                if face["script"] not in SCRIPTS:
+                    continue
+                if face["url"] not in files:
+                    files[face["url"]] = _vendor_file(family, face, characters)
+                if files[face["url"]] is None:
+                    continue
+                url = f"/fonts/{files[face['url']]}"
+                rules.append(_font_face(face, url))
+                # Italics are rarely in the first paint, so they aren't preloaded.
+                upright = face["font-style"] == "normal"
+                if face["script"] == SCRIPTS[0] and upright and url not in preload:
+                    preload.append(url)
+
+    FONTS_CSS.write_text("\n\n".join(rules) + "\n")
+    FONTS_MANIFEST.write_text(json.dumps({"preload": preload}, indent=2))
+    return len([name for name in files.values() if name is not None])
+
+
+def font_stylesheets(stylesheets: list[str]) -> list[str]:
+    """Load the vendored fonts instead of Google Fonts, if they exist.
+
+    Args:
+        stylesheets: The stylesheets of the app.
+
+    Returns:
+        The stylesheets to use.
+    """
+    if not FONTS_CSS.exists():
+        return stylesheets
+    return [
+        stylesheet
+        for stylesheet in stylesheets
+        if not stylesheet.startswith(GOOGLE_FONTS_CSS)
+    ] + [f"/{FONTS_CSS.relative_to(ASSETS_DIR).as_posix()}"]
+
+
+def font_preloads() -> list[rx.Component]:
+    """Preload the vendored fonts the first paint needs.
+
+    Returns:
+        A preload link for the main file of each vendored family.
+    """
+    if not FONTS_MANIFEST.exists():
+        return []
+    return [
+        rx.el.link(
+            rel="preload",
+            href=url,
+            type="font/woff2",
+            cross_origin="anonymous",
+            custom_attrs={"as": "font"},
+        )
+        for url in json.loads(FONTS_MANIFEST.read_text())["preload"]
+    ]
@@ -0,0 +1,190 @@
+"""An SVG sprite of the Lucide icons the site uses.
+
+`python -m pcweb.build icons` finds the icon names passed to `icon()` and
+`rx.icon()` in the site's sources, reads their shapes from the installed
+`lucide-react` package and writes them as `<symbol>`s to a single sprite in
+`assets/icons/`. Commit the sprite: `icon()` from
+`pcweb/components_webpage/icon.py` draws the icons in it with a `<use>`
+reference instead of importing them from `lucide-react`, and falls back to
+`rx.icon()` for the others.
+"""
+
+import ast
+import re
+from functools import lru_cache
+from pathlib import Path
+
+from reflex import constants
+
+from pcweb.build.assets import ASSETS_DIR
+from pcweb.build.manifest import PCWEB_ROOT
+
+# The sprite of the icons the site uses.
+SPRITE_URL = "/icons/sprite.svg"
+SPRITE_FILE = ASSETS_DIR / SPRITE_URL.lstrip("/")
+
+# The icon modules of the lucide-react package installed by `reflex init`.
+LUCIDE_ICONS_DIR = (
+    Path(constants.Dirs.WEB)
+    / "node_modules"
+    / "lucide-react"
+    / "dist"
+    / "esm"
+    / "icons"
+)
+
+# The functions that draw an icon by name.
+ICON_FUNCTIONS = {"icon"}
+
+# The attributes Lucide draws every icon with.
+VIEW_BOX = "0 0 24 24"
+
+NODE_PATTERN = re.compile(r'\[\s*"(?P<tag>\w+)",\s*\{(?P<attrs>[^}]*)\}\s*\]')
+ATTRIBUTE_PATTERN = re.compile(r'"?(?P<name>[\w-]+)"?:\s*"(?P<value>[^"]*)"')
+SYMBOL_PATTERN = re.compile(r'<symbol id="(?P<name>[\w-]+)"')
+
+
+def icon_name(tag: str) -> str:
+    """Get the Lucide name of an icon.
+
+    Args:
+        tag: The tag of the icon as passed to `rx.icon()`, e.g. "chevron_down".
+
+    Returns:
+        The kebab case name, e.g. "chevron-down".
+    """
+    return re.sub(r"([a-z0-9])([A-Z])", r"\1-\2", tag).replace("_", "-").lower()
+
+
+def _is_icon_call(node: ast.Call) -> bool:
+    func = node.func
+    if isinstance(func, ast.Attribute):
+        return func.attr in ICON_FUNCTIONS
+    return isinstance(func, ast.Name) and func.id in ICON_FUNCTIONS
+
+
+def _tag_argument(node: ast.Call) -> ast.expr | None:
+    if node.args:
+        return node.args[0]
+    return next((kw.value for kw in node.keywords if kw.arg == "tag"), None)
+
+
+def _module_icons(tree: ast.Module) -> set[str]:
+    """Get the icons drawn in a module.
+
+    Icons whose tag is a parameter of the function drawing them, e.g.
+    `def item(text, tag): return icon(tag)`, are resolved from the literal
+    arguments of the calls to that function in the same module.
+    """
+    names = set()
+    # The position of each parameter passed on as a tag, keyed by function.
+    forwarded: dict[str, tuple[int, str]] = {}
+    for function in ast.walk(tree):
+        if not isinstance(function, ast.FunctionDef):
+            continue
+        parameters = [arg.arg for arg in function.args.args]
+        for node in ast.walk(function):
+            if isinstance(node, ast.Call) and _is_icon_call(node):
+                tag = _tag_argument(node)
+                if isinstance(tag, ast.Name) and tag.id in parameters:
+                    forwarded[function.name] = (parameters.index(tag.id), tag.id)
+
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        arguments = []
+        if _is_icon_call(node):
+            arguments.append(_tag_argument(node))
+        if isinstance(node.func, ast.Name) and node.func.id in forwarded:
+            index, parameter = forwarded[node.func.id]
+            if index < len(node.args):
+                arguments.append(node.args[index])
+            arguments.extend(kw.value for kw in node.keywords if kw.arg == parameter)
+        for argument in arguments:
+            if isinstance(argument, ast.Constant) and isinstance(argument.value, str):
+                names.add(icon_name(argument.value))
+    return names
+
+
+def used_icons(root: Path = PCWEB_ROOT) -> list[str]:
+    """Find the icons the site's sources draw.
+
+    Args:
+        root: The sources to scan.
+
+    Returns:
+        The sorted Lucide names of the icons.
+    """
+    names = set()
+    for path in root.rglob("*.py"):
+        names |= _module_icons(ast.parse(path.read_text(encoding="utf-8")))
+    return sorted(names)
+
+
+def lucide_module(name: str) -> Path:
+    """Get the lucide-react module of an icon.
+
+    Args:
+        name: The Lucide name of the icon.
+
+    Returns:
+        The path of the module.
+    """
+    return LUCIDE_ICONS_DIR / f"{name}.js"
+
+
+def icon_symbol(name: str) -> str:
+    """Read the shapes of an icon from lucide-react as an SVG symbol.
+
+    Args:
+        name: The Lucide name of the icon.
+
+    Returns:
+        The `<symbol>` of the icon.
+
+    Raises:
+        FileNotFoundError: If lucide-react doesn't have the icon.
+    """
+    module = lucide_module(name)
+    if not module.exists():
+        raise FileNotFoundError(
+            f"There is no Lucide icon at {module}, run `reflex init` to install it."
+        )
+    shapes = []
+    for node in NODE_PATTERN.finditer(module.read_text(encoding="utf-8")):
+        attributes = "".join(
+            f' {match.group("name")}="{match.group("value")}"'
+            for match in ATTRIBUTE_PATTERN.finditer(node.group("attrs"))
+            if match.group("name") != "key"
+        )
+        shapes.append(f"<{node.group('tag')}{attributes}/>")
+    return f'<symbol id="{name}" viewBox="{VIEW_BOX}">{"".join(shapes)}</symbol>'
+
+
+def write_sprite(names: list[str]) -> int:
+    """Write the sprite of icons.
+
+    Args:
+        names: The Lucide names of the icons.
+
+    Returns:
+        The size of the sprite in bytes.
+    """
+    symbols = "".join(icon_symbol(name) for name in names)
+    sprite = f'<svg xmlns="http://www.w3.org/2000/svg">{symbols}</svg>\n'
+    SPRITE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    SPRITE_FILE.write_text(sprite, encoding="utf-8")
+    sprite_icons.cache_clear()
+    return len(sprite.encode())
+
+
+@lru_cache(maxsize=None)
+def sprite_icons() -> frozenset[str]:
+    """Get the icons in the sprite.
+
+    Returns:
+        The Lucide names of the icons, or none if there is no sprite.
+    """
+    if not SPRITE_FILE.exists():
+        return frozenset()
+    return frozenset(SYMBOL_PATTERN.findall(SPRITE_FILE.read_text(encoding="utf-8")))
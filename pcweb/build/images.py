@@ -0,0 +1,138 @@
+"""Resized WebP and AVIF variants of the raster images in assets/.
+
+Pages ask for the variants of an image with `image_variants()`, which only
+computes their URLs. Once the app is compiled, `generate_image_variants()`
+encodes the variants that aren't cached yet across worker processes and
+copies them next to the other fingerprinted assets. Variants are cached in
+`.pcweb_cache/images/`, keyed by the hash of the source image.
+
+Pillow is optional: without it, images are served as they are.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
+from reflex.utils import console
+
+from pcweb.build.assets import ASSETS_DIR, BUILD_DIR, file_digest
+from pcweb.build.cache import CACHE_DIR
+from pcweb.build.scheduler import FileScheduler
+
+try:
+    from PIL import Image, features
+except ImportError:
+    Image = None
+
+# The widths to generate, in pixels. Images are never scaled up.
+WIDTHS = (320, 640, 960, 1280, 1920)
+
+# The formats to generate, in order of preference.
+FORMATS = ("avif", "webp")
+
+# The encoder quality of each format.
+QUALITY = {"avif": 50, "webp": 75}
+
+# The image types that get variants.
+RASTER_SUFFIXES = {".png", ".jpg", ".jpeg", ".webp"}
+
+# Where generated variants are kept between builds.
+IMAGES_CACHE = CACHE_DIR / "images"
+
+# The variants used by the pages of this build, keyed by file name.
+_requested: dict[str, tuple[Path, int, str]] = {}
+
+
+@lru_cache(maxsize=None)
+def supported_formats() -> tuple[str, ...]:
+    """Get the formats the installed Pillow can encode.
+
+    Returns:
+        The supported formats, or none if Pillow is not installed.
+    """
+    if Image is None:
+        return ()
+    return tuple(fmt for fmt in FORMATS if features.check(fmt))
+
+
+@lru_cache(maxsize=None)
+def _width(path: Path) -> int:
+    with Image.open(path) as image:
+        return image.width
+
+
+def image_variants(url: str) -> dict[str, list[tuple[str, int]]]:
+    """Get the resized variants of an image in assets/.
+
+    Args:
+        url: The URL the image is served at, e.g. "/reflex_banner.png".
+
+    Returns:
+        The URL and width of each variant, keyed by format. Empty if the
+        image is not a raster image or no format can be encoded.
+    """
+    source = ASSETS_DIR / url.lstrip("/")
+    formats = supported_formats()
+    if not formats or source.suffix.lower() not in RASTER_SUFFIXES:
+        return {}
+    full_width = _width(source)
+    widths = sorted({width for width in WIDTHS if width < full_width} | {full_width})
+    digest = file_digest(source)
+    variants = {}
+    for fmt in formats:
+        for width in widths:
+            name = f"{source.stem}.{digest}-{width}w.{fmt}"
+            _requested[name] = (source, width, fmt)
+            variants.setdefault(fmt, []).append((f"/{BUILD_DIR}/images/{name}", width))
+    return variants
+
+
+def _encode(job: tuple[Path, int, str, Path]):
+    """Encode a variant of an image.
+
+    Args:
+        job: The source image, the width and format of the variant, and the
+            file to write it to.
+    """
+    source, width, fmt, target = job
+    with Image.open(source) as image:
+        transparent = "A" in image.getbands() or "transparency" in image.info
+        image = image.convert("RGBA" if transparent else "RGB")
+        height = max(1, round(image.height * width / image.width))
+        image = image.resize((width, height), Image.LANCZOS)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file, so an interrupted build leaves no
+        # partial variant in the cache.
+        partial = target.with_suffix(".partial")
+        image.save(partial, fmt.upper(), quality=QUALITY[fmt])
+        partial.replace(target)
+
+
+def generate_image_variants(workers: int | None = None):
+    """Generate the variants used in this build and copy them to the assets.
+
+    Args:
+        workers: How many processes to encode with, one per core by default.
+    """
+    if not _requested:
+        return
+    jobs = [
+        (source, width, fmt, IMAGES_CACHE / name)
+        for name, (source, width, fmt) in _requested.items()
+        if not (IMAGES_CACHE / name).exists()
+    ]
+    if jobs:
+        with ProcessPoolExecutor(workers) as pool:
+            list(pool.map(_encode, jobs))
+    console.info(
+        f"Image variants: {len(jobs)} generated, "
+        f"{len(_requested) - len(jobs)} cached."
+    )
+
+    output = ASSETS_DIR / BUILD_DIR / "images"
+    output.mkdir(parents=True, exist_ok=True)
+    files = FileScheduler()
+    files.map(
+        lambda name: files.copy(IMAGES_CACHE / name, output / name),
+        [name for name in _requested if not (output / name).exists()],
+    )
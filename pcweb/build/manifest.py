@@ -0,0 +1,97 @@
+"""The route manifest: which module and attribute defines each page.
+
+The manifest is generated by reading the page modules statically, so the
+routes of the site can be listed, filtered and looked up without importing
+any page. Regenerate it after adding, moving or renaming a page with
+`python -m pcweb.build manifest`.
+"""
+
+import ast
+import json
+from functools import lru_cache
+from pathlib import Path
+
+# The root of the pcweb package.
+PCWEB_ROOT = Path(__file__).resolve().parent.parent
+
+# The directory the page modules live in.
+PAGES_DIR = PCWEB_ROOT / "pages"
+
+# The generated manifest.
+MANIFEST_FILE = PAGES_DIR / "manifest.json"
+
+
+def _literal(node: ast.expr | None) -> str | None:
+    return node.value if isinstance(node, ast.Constant) else None
+
+
+def _page_decorator(function: ast.FunctionDef) -> ast.Call | None:
+    """Get the `@webpage(...)` decorator of a function, if it has one."""
+    for decorator in function.decorator_list:
+        if not isinstance(decorator, ast.Call):
+            continue
+        func = decorator.func
+        name = func.attr if isinstance(func, ast.Attribute) else getattr(func, "id", "")
+        if name == "webpage":
+            return decorator
+    return None
+
+
+def scan_pages(pages_dir: Path = PAGES_DIR) -> list[dict]:
+    """Find the routes defined in the page modules.
+
+    Args:
+        pages_dir: The directory of the page modules.
+
+    Returns:
+        The manifest entries, sorted by path.
+    """
+    entries = []
+    for path in sorted(pages_dir.rglob("*.py")):
+        module = ".".join(path.relative_to(PCWEB_ROOT.parent).with_suffix("").parts)
+        tree = ast.parse(path.read_text(encoding="utf-8"))
+        for node in tree.body:
+            if not isinstance(node, ast.FunctionDef):
+                continue
+            decorator = _page_decorator(node)
+            if decorator is None:
+                continue
+            args = {kw.arg: kw.value for kw in decorator.keywords}
+            args.update(zip(("path", "title"), decorator.args))
+            entry = {"path": _literal(args.get("path")), "module": module}
+            entry["attr"] = node.name
+            if "title" in args:
+                entry["title"] = _literal(args["title"])
+            if _literal(args.get("static")):
+                entry["static"] = True
+            entries.append(entry)
+    return sorted(entries, key=lambda entry: entry["path"])
+
+
+def write_manifest(entries: list[dict], path: Path = MANIFEST_FILE):
+    """Write the route manifest.
+
+    Args:
+        entries: The manifest entries.
+        path: The file to write.
+    """
+    text = json.dumps(entries, indent=2, ensure_ascii=False)
+    path.write_text(text + "\n", encoding="utf-8")
+
+
+@lru_cache(maxsize=None)
+def load_manifest(path: Path = MANIFEST_FILE) -> tuple[dict, ...]:
+    """Load the route manifest.
+
+    If the manifest doesn't exist, the pages next to it are scanned instead,
+    without writing it, so loading the routes never changes the source tree.
+
+    Args:
+        path: The manifest file.
+
+    Returns:
+        The manifest entries.
+    """
+    if not path.exists():
+        return tuple(scan_pages(path.parent))
+    return tuple(json.loads(path.read_text(encoding="utf-8")))
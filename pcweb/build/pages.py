@@ -0,0 +1,89 @@
+"""Add the site's routes to the app."""
+
+import contextlib
+import os
+from pathlib import Path
+
+import reflex as rx
+from reflex.utils import format
+
+from pcweb.build.app import on_compiled
+from pcweb.build.atomic import (
+    ATOMIC_STYLESHEET,
+    atomize,
+    stylesheet_file,
+    write_stylesheet,
+)
+from pcweb.build.cache import PageCache
+from pcweb.build.config import env_flag, env_int
+from pcweb.build.parallel import use_compile_workers
+from pcweb.build.profiler import BuildProfiler
+from pcweb.build.ssg import check_static
+from pcweb.route import Route
+
+
+def add_routes(app: rx.App, routes: list[Route]):
+    """Add routes to the app.
+
+    Set `PCWEB_BUILD_CACHE=1` to reuse the compiled output of routes whose
+    sources have not changed since the last build, and `PCWEB_COMPILE_WORKERS`
+    to compile the pages across that many processes (0 for one per core).
+    Set `PCWEB_PROFILE` to a directory to write a profile of each route's
+    build there, and `PCWEB_ATOMIC_CSS=1` to move repeated inline style
+    declarations to shared classes in one stylesheet.
+
+    Pages marked as static are checked to not depend on backend state.
+
+    Routes are added in path order, so the app's pages and the compiled
+    output do not depend on the order the page modules were imported in.
+
+    Args:
+        app: The app to add the routes to.
+        routes: The routes of the site.
+    """
+    cache = PageCache() if env_flag("PCWEB_BUILD_CACHE") else None
+    workers = env_int("PCWEB_COMPILE_WORKERS", -1)
+    if workers >= 0:
+        use_compile_workers(workers)
+    profile_dir = os.environ.get("PCWEB_PROFILE")
+    profiler = BuildProfiler(Path(profile_dir)) if profile_dir else None
+
+    atomic_css = env_flag("PCWEB_ATOMIC_CSS")
+
+    pages = []
+    for route in sorted(routes, key=lambda route: route.path):
+        component = route.component
+        if cache is not None and cache.is_fresh(route):
+            # The cached page is restored over this once the app is compiled.
+            pages.append((route, cache.placeholder(route)))
+            continue
+        if profiler is not None:
+            component = profiler.construct(route)
+        elif route.static or atomic_css:
+            component = route.component()
+        if route.static and isinstance(component, rx.Component):
+            check_static(route, component)
+        pages.append((route, component))
+
+    if atomic_css:
+        trees = [page for _, page in pages if isinstance(page, rx.Component)]
+        write_stylesheet(atomize(trees), stylesheet_file(), cache is not None)
+        app.stylesheets.append(f"/{ATOMIC_STYLESHEET}")
+
+    for route, component in pages:
+        measured = profiler.measure(route.path, "add_page") if profiler else None
+        with measured or contextlib.nullcontext():
+            app.add_page(
+                component,
+                route.path,
+                route.title,
+                # image="/previews/index_preview.png",
+            )
+        if cache is not None:
+            cache.add_tree(route, app.pages[format.format_route(route.path, False)])
+
+    if profiler is not None:
+        profiler.write()
+
+    if cache is not None:
+        on_compiled(cache.finalize)
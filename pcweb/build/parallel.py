@@ -0,0 +1,31 @@
+"""Compile pages across a pool of worker processes.
+
+Only rendering the component trees to JS runs in the pool. The trees are
+still built one page at a time in the parent process, before Reflex starts
+the pool, so the time spent constructing components doesn't shrink with more
+workers.
+"""
+
+import os
+import platform
+
+
+def use_compile_workers(workers: int):
+    """Have Reflex compile the pages of the app across a worker pool.
+
+    Reflex renders each page to JS in an executor. By default that is a
+    thread pool, which keeps the whole compile on one core. Where `fork` is
+    available, switch it to a process pool so each worker renders pages on
+    its own core from the component trees built by the parent.
+
+    The environment variables Reflex reads are only set if they are unset, so
+    a pool configured for Reflex directly is left as it is.
+
+    Args:
+        workers: The number of workers, or 0 for one per core.
+    """
+    workers = workers or os.cpu_count() or 1
+    if platform.system() in ("Linux", "Darwin"):
+        os.environ.setdefault("REFLEX_COMPILE_PROCESSES", str(workers))
+    else:
+        os.environ.setdefault("REFLEX_COMPILE_THREADS", str(workers))
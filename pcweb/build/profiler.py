@@ -0,0 +1,122 @@
+"""Measure how long each route takes to build.
+
+For each route the profiler records the wall time and memory spent building
+its component tree and adding it to the app, and the number of components in
+the tree. The results are written as a JSON report and as collapsed stacks,
+which flamegraph tools such as `flamegraph.pl` or speedscope can render.
+"""
+
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+import reflex as rx
+from reflex.utils import console
+
+from pcweb.route import Route
+
+
+def count_nodes(component: rx.Component) -> int:
+    """Count the components in a tree.
+
+    Args:
+        component: The root of the tree.
+
+    Returns:
+        The number of components in the tree.
+    """
+    count = 0
+    todo = [component]
+    while todo:
+        node = todo.pop()
+        count += 1
+        todo.extend(
+            child for child in node.children if isinstance(child, rx.Component)
+        )
+    return count
+
+
+def _seconds(route: dict) -> float:
+    """Get the total time spent on a route across all its phases."""
+    return sum(phase["seconds"] for phase in route.values() if isinstance(phase, dict))
+
+
+class BuildProfiler:
+    """Record the cost of building each route."""
+
+    def __init__(self, output_dir: Path):
+        """Start tracing memory allocations.
+
+        Args:
+            output_dir: The directory to write the reports to.
+        """
+        self.output_dir = output_dir
+        # The measurements of each route, keyed by path.
+        self.routes: dict[str, dict] = {}
+        tracemalloc.start()
+
+    @contextmanager
+    def measure(self, path: str, phase: str) -> Iterator[None]:
+        """Measure a phase of building a route.
+
+        Args:
+            path: The path of the route.
+            phase: The name of the phase, e.g. "construct".
+
+        Yields:
+            Nothing, the phase runs inside the context.
+        """
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            after, peak = tracemalloc.get_traced_memory()
+            self.routes.setdefault(path, {"path": path})[phase] = {
+                "seconds": seconds,
+                "allocated_bytes": after - before,
+                "peak_bytes": peak - before,
+            }
+
+    def construct(self, route: Route) -> rx.Component:
+        """Build the component tree of a route.
+
+        Args:
+            route: The route to build.
+
+        Returns:
+            The component tree.
+        """
+        with self.measure(route.path, "construct"):
+            component = route.component()
+        self.routes[route.path]["nodes"] = count_nodes(component)
+        return component
+
+    def write(self):
+        """Write the JSON report and the collapsed stacks."""
+        tracemalloc.stop()
+        routes = sorted(self.routes.values(), key=_seconds, reverse=True)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        report = self.output_dir / "build-profile.json"
+        report.write_text(json.dumps({"routes": routes}, indent=2))
+
+        # One frame per route and phase, weighted by microseconds.
+        stacks = [
+            f"pcweb;{route['path']};{phase} {round(value['seconds'] * 1e6)}"
+            for route in routes
+            for phase, value in route.items()
+            if isinstance(value, dict)
+        ]
+        (self.output_dir / "build-profile.folded").write_text("\n".join(stacks) + "\n")
+
+        console.info(f"Wrote the build profile to {report}. Slowest routes:")
+        for route in routes[:5]:
+            console.info(
+                f"  {route['path']}: {_seconds(route):.3f}s, "
+                f"{route.get('nodes', '?')} components"
+            )
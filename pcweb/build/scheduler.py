@@ -0,0 +1,144 @@
+"""Bound the files pcweb's own build steps hold open at once.
+
+The page cache and the image variants copy a file per route or image, and
+those copies go through a `FileScheduler`, which holds a slot per open file
+and works through its tasks in bounded batches. The number of slots defaults
+to half of the process limit.
+
+Only the copies made by pcweb are bounded. Reflex, Next and Node open their
+own files, so a Node build that runs out of file descriptors, e.g. EMFILE on
+Windows, isn't fixed by this.
+"""
+
+import shutil
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, TypeVar
+
+from pcweb.build.config import env_int
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# The default stdio handle limit of the Windows C runtime.
+WINDOWS_MAX_OPEN_FILES = 512
+
+
+def max_open_files() -> int:
+    """Get how many files the build may hold open at once.
+
+    Set `PCWEB_MAX_OPEN_FILES` to override the limit.
+
+    Returns:
+        The number of file handles to allow.
+    """
+    if sys.platform == "win32":
+        limit = WINDOWS_MAX_OPEN_FILES
+    else:
+        import resource
+
+        limit, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+        if limit == resource.RLIM_INFINITY:
+            limit = 4096
+    # Leave room for the handles held by Reflex, sockets and the interpreter.
+    return max(env_int("PCWEB_MAX_OPEN_FILES", limit // 2), 1)
+
+
+class FileScheduler:
+    """Read and write build artifacts under a bound on open files."""
+
+    def __init__(self, max_open: int | None = None, concurrency: int | None = None):
+        """Create the scheduler.
+
+        Args:
+            max_open: The number of files that may be open at once.
+            concurrency: The number of worker threads, `PCWEB_BUILD_CONCURRENCY`
+                by default.
+        """
+        self.max_open = max_open or max_open_files()
+        self.concurrency = min(
+            concurrency or env_int("PCWEB_BUILD_CONCURRENCY", 8), self.max_open
+        )
+        self._free = self.max_open
+        self._lock = threading.Condition()
+
+    @contextmanager
+    def open(self, path: Path, mode: str = "rb", handles: int = 1) -> Iterator:
+        """Open a file once a handle slot is free.
+
+        Args:
+            path: The file to open.
+            mode: The mode to open the file in.
+            handles: The number of slots to hold, for callers that open more
+                files while this one is open.
+
+        Yields:
+            The open file.
+        """
+        handles = min(handles, self.max_open)
+        # Take all the slots at once, so two callers can't each hold half.
+        with self._lock:
+            self._lock.wait_for(lambda: self._free >= handles)
+            self._free -= handles
+        try:
+            with open(path, mode) as file:
+                yield file
+        finally:
+            with self._lock:
+                self._free += handles
+                self._lock.notify_all()
+
+    def read(self, path: Path) -> bytes:
+        """Read a file.
+
+        Args:
+            path: The file to read.
+
+        Returns:
+            The contents of the file.
+        """
+        with self.open(path) as file:
+            return file.read()
+
+    def write(self, path: Path, data: bytes):
+        """Write a file, creating its parent directories.
+
+        Args:
+            path: The file to write.
+            data: The contents of the file.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self.open(path, "wb") as file:
+            file.write(data)
+
+    def copy(self, src: Path, dest: Path):
+        """Copy a file, holding a slot for both ends of the copy.
+
+        Args:
+            src: The file to copy.
+            dest: Where to copy it to.
+        """
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        with self.open(src, handles=2) as source, open(dest, "wb") as target:
+            shutil.copyfileobj(source, target)
+
+    def map(self, fn: Callable[[T], R], items: Iterable[T]) -> list[R]:
+        """Apply a function to each item, a bounded batch at a time.
+
+        Args:
+            fn: The function to apply.
+            items: The items to apply it to.
+
+        Returns:
+            The results, in the order of the items.
+        """
+        items = list(items)
+        results = []
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            for start in range(0, len(items), self.max_open):
+                batch = items[start : start + self.max_open]
+                results.extend(executor.map(fn, batch))
+        return results
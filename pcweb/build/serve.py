@@ -0,0 +1,331 @@
+"""Serve the exported site without Node.
+
+`python -m pcweb.build serve` serves the output of `reflex export` over
+HTTP/1.1 with keep-alive on asyncio. File bodies are sent with `sendfile`,
+so they are copied from the page cache to the socket by the kernel. The
+server sends the precompressed variant of a file the client accepts, answers
+`If-None-Match` from ETags, adds the headers of `_headers` and marks hashed
+assets as immutable. It follows `_redirects`, and answers unknown paths with
+the exported 404 page.
+
+It serves the static frontend only: run the backend with `reflex run
+--backend-only` next to it.
+"""
+
+import asyncio
+import email.utils
+import json
+import mimetypes
+import time
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+from reflex.utils import console
+
+from pcweb.build.assets import BUILD_DIR, IMMUTABLE_CACHE_CONTROL
+from pcweb.build.compress import COMPRESSION_MANIFEST, SUFFIXES
+from pcweb.build.export import REDIRECTS_FILE, html_file, read_headers
+
+# The URL prefixes of files whose name changes with their content.
+IMMUTABLE_PREFIXES = ("/_next/static/", f"/{BUILD_DIR}/")
+
+# How long an idle keep-alive connection is kept open, in seconds.
+KEEP_ALIVE_TIMEOUT = 5
+
+# The largest request head accepted, in bytes.
+MAX_HEAD_SIZE = 16 * 1024
+
+REASONS = {
+    200: "OK",
+    301: "Moved Permanently",
+    302: "Found",
+    304: "Not Modified",
+    307: "Temporary Redirect",
+    308: "Permanent Redirect",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+}
+
+
+def accepted_encodings(header: str) -> set[str]:
+    """Parse an `Accept-Encoding` header.
+
+    Args:
+        header: The header value, e.g. "gzip, deflate, br;q=0.9".
+
+    Returns:
+        The content encodings the client accepts.
+    """
+    accepted = set()
+    for item in header.split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = params.strip().removeprefix("q=")
+        if coding and quality not in ("0", "0.0", "0.00", "0.000"):
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+def etag(path: Path) -> str:
+    """Get the ETag of a file.
+
+    Args:
+        path: The file.
+
+    Returns:
+        A strong ETag of the size and modification time of the file.
+    """
+    stat = path.stat()
+    return f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+
+
+class StaticServer:
+    """Serve an exported site."""
+
+    def __init__(self, export_dir: Path):
+        """Load the headers, redirects and compressed variants of the site.
+
+        Args:
+            export_dir: The exported site.
+        """
+        self.export_dir = export_dir.resolve()
+        self.headers = read_headers(self.export_dir)
+        redirects = self.export_dir / REDIRECTS_FILE
+        self.redirects = {}
+        for line in redirects.read_text().splitlines() if redirects.exists() else []:
+            parts = line.split()
+            if len(parts) >= 2 and not parts[0].startswith("#"):
+                status = int(parts[2]) if len(parts) > 2 else 301
+                if status in REASONS:
+                    self.redirects[parts[0]] = (parts[1], status)
+        manifest = self.export_dir / COMPRESSION_MANIFEST
+        self.compressed = json.loads(manifest.read_text()) if manifest.exists() else {}
+        # The file and headers of each path found; the export doesn't change.
+        self._files: dict[str, tuple[Path, dict[str, str]]] = {}
+
+    def resolve(self, path: str) -> tuple[Path, dict[str, str]] | None:
+        """Find the file and headers of a URL path.
+
+        Args:
+            path: The decoded URL path.
+
+        Returns:
+            The file and its response headers, or None if there is no file.
+        """
+        if path in self._files:
+            return self._files[path]
+        file = self.export_dir / path.lstrip("/")
+        if not file.is_file():
+            file = html_file(self.export_dir, path)
+        try:
+            inside = file.resolve().is_relative_to(self.export_dir)
+        except OSError:
+            inside = False
+        if not inside or not file.is_file():
+            return None
+
+        url = "/" + file.relative_to(self.export_dir).as_posix()
+        content_type, _ = mimetypes.guess_type(file.name)
+        content_type = content_type or "application/octet-stream"
+        if content_type.startswith("text/") or content_type in (
+            "application/javascript",
+            "application/json",
+            "image/svg+xml",
+        ):
+            content_type += "; charset=utf-8"
+        headers = {"Content-Type": content_type}
+        if url.startswith(IMMUTABLE_PREFIXES):
+            headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        for pattern, extra in self.headers.items():
+            if pattern == path or (
+                pattern.endswith("*") and path.startswith(pattern[:-1])
+            ):
+                headers.update(extra)
+        if url in self.compressed:
+            headers["Vary"] = "Accept-Encoding"
+        self._files[path] = (file, headers)
+        return self._files[path]
+
+    def variant(self, file: Path, accept_encoding: str) -> tuple[Path, str | None]:
+        """Pick the precompressed variant of a file the client accepts.
+
+        Args:
+            file: The file to send.
+            accept_encoding: The `Accept-Encoding` header of the request.
+
+        Returns:
+            The file to send and its content encoding, if it is compressed.
+        """
+        sizes = self.compressed.get("/" + file.relative_to(self.export_dir).as_posix())
+        if sizes and accept_encoding:
+            accepted = accepted_encodings(accept_encoding)
+            for encoding, suffix in SUFFIXES.items():
+                if encoding in sizes and encoding in accepted:
+                    return file.with_name(file.name + suffix), encoding
+        return file, None
+
+    async def respond(
+        self,
+        writer: asyncio.StreamWriter,
+        method: str,
+        target: str,
+        request_headers: dict[str, str],
+    ):
+        """Send the response to a request.
+
+        Args:
+            writer: The connection.
+            method: The request method.
+            target: The request target.
+            request_headers: The request headers, with lowercase names.
+        """
+        if method not in ("GET", "HEAD"):
+            await self.send(writer, 405, {"Allow": "GET, HEAD"})
+            return
+        path = unquote(urlsplit(target).path) or "/"
+        if path in self.redirects:
+            location, status = self.redirects[path]
+            await self.send(writer, status, {"Location": location})
+            return
+
+        resolved = self.resolve(path)
+        status = 200
+        if resolved is None:
+            resolved = self.resolve("/404")
+            status = 404
+        if resolved is None:
+            body = b"Not Found" if method == "GET" else b""
+            await self.send(writer, 404, {"Content-Type": "text/plain"}, body)
+            return
+        file, headers = resolved
+        file, encoding = self.variant(file, request_headers.get("accept-encoding", ""))
+        headers = {**headers, "ETag": etag(file)}
+        if encoding is not None:
+            headers["Content-Encoding"] = encoding
+
+        match = request_headers.get("if-none-match")
+        if status == 200 and match is not None:
+            tags = {tag.strip().removeprefix("W/") for tag in match.split(",")}
+            if "*" in tags or headers["ETag"] in tags:
+                await self.send(writer, 304, headers)
+                return
+
+        size = file.stat().st_size
+        await self.send(writer, status, {**headers, "Content-Length": str(size)})
+        if method == "GET":
+            with file.open("rb") as body:
+                await asyncio.get_running_loop().sendfile(
+                    writer.transport, body, 0, size
+                )
+
+    async def send(
+        self,
+        writer: asyncio.StreamWriter,
+        status: int,
+        headers: dict[str, str],
+        body: bytes = b"",
+    ):
+        """Send a response head, and a body held in memory.
+
+        Args:
+            writer: The connection.
+            status: The response status.
+            headers: The response headers.
+            body: The response body.
+        """
+        head = {"Date": _date(), "Server": "pcweb", **headers}
+        if "Content-Length" not in head and status != 304:
+            head["Content-Length"] = str(len(body))
+        lines = [f"HTTP/1.1 {status} {REASONS[status]}"]
+        lines.extend(f"{name}: {value}" for name, value in head.items())
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+        await writer.drain()
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve the requests of a connection until it is closed.
+
+        Args:
+            reader: The incoming stream.
+            writer: The outgoing stream.
+        """
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(
+                        reader.readuntil(b"\r\n\r\n"), KEEP_ALIVE_TIMEOUT
+                    )
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError):
+                    break
+                except asyncio.LimitOverrunError:
+                    await self.send(writer, 400, {"Connection": "close"})
+                    break
+                request_line, *lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, target, version = request_line.split(" ")
+                except ValueError:
+                    await self.send(writer, 400, {"Connection": "close"})
+                    break
+                headers = {}
+                for line in lines:
+                    name, _, value = line.partition(":")
+                    if name:
+                        headers[name.strip().lower()] = value.strip()
+                await self.respond(writer, method, target, headers)
+                connection = headers.get("connection", "").lower()
+                if (
+                    connection == "close"
+                    or method not in ("GET", "HEAD")
+                    or (version == "HTTP/1.0" and connection != "keep-alive")
+                ):
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host: str, port: int) -> asyncio.Server:
+        """Start listening.
+
+        Args:
+            host: The interface to listen on.
+            port: The port to listen on, or 0 for any free port.
+
+        Returns:
+            The server.
+        """
+        return await asyncio.start_server(
+            self.handle, host, port, limit=MAX_HEAD_SIZE, reuse_address=True
+        )
+
+
+_last_date = (0, "")
+
+
+def _date() -> str:
+    """Get the `Date` header, formatted once per second."""
+    global _last_date
+    now = int(time.time())
+    if _last_date[0] != now:
+        _last_date = (now, email.utils.formatdate(now, usegmt=True))
+    return _last_date[1]
+
+
+def serve(export_dir: Path, host: str = "0.0.0.0", port: int = 3000):
+    """Serve an exported site until interrupted.
+
+    Args:
+        export_dir: The exported site.
+        host: The interface to listen on.
+        port: The port to listen on.
+    """
+
+    async def run():
+        server = await StaticServer(export_dir).start(host, port)
+        console.info(f"Serving {export_dir} on http://{host}:{port}")
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,114 @@
+"""Static pages: routes whose content depends on no backend state.
+
+The export already renders every page to HTML, but a page only reads the same
+before and after hydration if nothing in it comes from backend state or only
+renders in the browser. Pages marked `static=True` are checked for that when
+they are built, which leaves the shared navbar and footer as the only parts
+that hydrate from the backend. Their exported HTML is then checked to be fully
+rendered and can be cached by a CDN like any other static file.
+"""
+
+import re
+from pathlib import Path
+
+import reflex as rx
+from reflex.components.component import NoSSRComponent
+from reflex.utils import console
+
+from pcweb.build.export import add_headers, html_file
+from pcweb.build.manifest import load_manifest
+from pcweb.route import Route
+
+# How long CDNs may serve the HTML of a static page before revalidating it.
+STATIC_CACHE_CONTROL = "public, max-age=0, s-maxage=3600, stale-while-revalidate=86400"
+
+# The element the pages are rendered into.
+ROOT_PATTERN = re.compile(r'<div id="__next">(.*)</div>', re.S)
+TAG_PATTERN = re.compile(r"<[^>]+>")
+
+
+def island_states() -> set[str]:
+    """Get the states a static page may use.
+
+    Returns:
+        The full names of the states of the navbar and footer, and of the
+        root state for the router data.
+    """
+    from pcweb.components_webpage.footer import IndexState
+    from pcweb.components_webpage.navbar.navbar import NavbarState
+
+    return {
+        rx.State.get_full_name(),
+        NavbarState.get_full_name(),
+        IndexState.get_full_name(),
+    }
+
+
+def check_static(route: Route, component: rx.Component):
+    """Check that a page marked as static renders the same without a backend.
+
+    Args:
+        route: The route of the page.
+        component: The component tree of the page.
+
+    Raises:
+        ValueError: If the page uses backend state or client-only components.
+    """
+    allowed = island_states()
+    problems = set()
+    todo = [component]
+    while todo:
+        node = todo.pop()
+        if isinstance(node, NoSSRComponent):
+            problems.add(f"{type(node).__name__} only renders in the browser")
+        for var in node._get_vars():
+            state = var._var_data.state if var._var_data else ""
+            if state and state not in allowed:
+                problems.add(f"{var._var_full_name} comes from {state}")
+        todo.extend(child for child in node.children if isinstance(child, rx.Component))
+    if problems:
+        raise ValueError(
+            f"The page at {route.path} is marked static, but "
+            + "; ".join(sorted(problems))
+        )
+
+
+def rendered_text(html: str) -> str:
+    """Get the text rendered into the page root of an exported page.
+
+    Args:
+        html: The exported HTML.
+
+    Returns:
+        The visible text of the page, without markup.
+    """
+    match = ROOT_PATTERN.search(html)
+    return TAG_PATTERN.sub(" ", match.group(1)).strip() if match else ""
+
+
+def export_static_pages(export_dir: Path) -> int:
+    """Check the static pages of the exported site and mark them cacheable.
+
+    Args:
+        export_dir: The exported site.
+
+    Returns:
+        The number of static pages that aren't rendered in the HTML.
+    """
+    rules = {}
+    failures = 0
+    for entry in load_manifest():
+        if not entry.get("static"):
+            continue
+        page = html_file(export_dir, entry["path"])
+        if not page.exists():
+            # Pages left out by the whitelist aren't exported.
+            continue
+        if not rendered_text(page.read_text(encoding="utf-8")):
+            console.error(f"{entry['path']} is static but {page} has no content.")
+            failures += 1
+            continue
+        rules[entry["path"]] = {"Cache-Control": STATIC_CACHE_CONTROL}
+        console.info(f"Static page {entry['path']}: {page.stat().st_size} bytes")
+    add_headers(export_dir, rules)
+    return failures
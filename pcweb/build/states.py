@@ -0,0 +1,356 @@
+"""Work out which states each event needs, and measure what events load.
+
+An event only needs its own state, the states it asks for with
+`self.get_state()`, and the substates whose computed vars depend on a var it
+sets. The parents of each are needed too, since a state is always loaded with
+its parents. `event_plan()` finds them from the source of the event handler,
+without running it, so a state store can load just those states instead of
+the whole tree.
+
+With `PCWEB_STATE_METRICS=1` the backend logs the bytes of the states loaded
+for each event next to the bytes of its plan.
+"""
+
+import ast
+import inspect
+import textwrap
+from collections import defaultdict
+from functools import lru_cache
+from typing import Callable, Type
+
+import dill
+import reflex as rx
+from reflex.event import Event
+from reflex.middleware import Middleware
+from reflex.state import BaseState, StateUpdate
+from reflex.utils import console
+
+from pcweb.build.backend import import_states
+from pcweb.build.config import env_flag
+
+STATE_METRICS_ENV_VAR = "PCWEB_STATE_METRICS"
+
+# The methods that change a var in place, e.g. `self.items.append(item)`.
+MUTATING_METHODS = {
+    "add",
+    "append",
+    "clear",
+    "discard",
+    "extend",
+    "insert",
+    "pop",
+    "popitem",
+    "remove",
+    "reverse",
+    "setdefault",
+    "sort",
+    "update",
+}
+
+# The bytes loaded by each event, and how often it ran, keyed by event name.
+event_metrics: dict[str, dict[str, int]] = defaultdict(
+    lambda: {"events": 0, "loaded": 0, "planned": 0}
+)
+
+
+def app_states() -> list[Type[BaseState]]:
+    """Get the states the site defines.
+
+    Returns:
+        The states, parents first.
+    """
+    import_states()
+    states = []
+    todo = [rx.State]
+    while todo:
+        state = todo.pop(0)
+        if state.__module__.startswith("pcweb."):
+            states.append(state)
+        todo.extend(sorted(state.class_subclasses, key=lambda s: s.get_full_name()))
+    return states
+
+
+def _lineage(state: Type[BaseState]) -> list[Type[BaseState]]:
+    """Get a state and its parents, root first."""
+    states = []
+    while state is not None:
+        states.insert(0, state)
+        state = state.get_parent_state()
+    return states
+
+
+def _subtree(state: Type[BaseState]) -> list[Type[BaseState]]:
+    """Get a state and all its substates."""
+    states = [state]
+    for substate in states:
+        states.extend(substate.get_substates())
+    return states
+
+
+def _resolve(node: ast.expr, namespace: dict) -> object:
+    """Resolve a name like `FormsState` or `forms.FormsState` in a namespace."""
+    if isinstance(node, ast.Name):
+        return namespace.get(node.id)
+    if isinstance(node, ast.Attribute):
+        return getattr(_resolve(node.value, namespace), node.attr, None)
+    return None
+
+
+def _is_self(node: ast.expr) -> bool:
+    return isinstance(node, ast.Name) and node.id == "self"
+
+
+def _self_attribute(node: ast.expr) -> str | None:
+    """Get `x` from `self.x`, or from `self.x[...]` and `self.x.y`."""
+    while isinstance(node, (ast.Subscript, ast.Attribute)):
+        if isinstance(node, ast.Attribute) and _is_self(node.value):
+            return node.attr
+        node = node.value
+    return None
+
+
+def _handler_function(state: Type[BaseState], name: str) -> Callable | None:
+    handler = state.event_handlers.get(name)
+    if handler is not None:
+        return handler.fn
+    function = inspect.getattr_static(state, name, None)
+    return function if inspect.isfunction(function) else None
+
+
+def handler_access(state: Type[BaseState], name: str) -> dict:
+    """Find the vars an event handler reads and sets, and the states it gets.
+
+    The methods the handler calls on `self` are followed.
+
+    Args:
+        state: The state the handler is defined on.
+        name: The name of the handler.
+
+    Returns:
+        The names of the vars read and set, the states passed to
+        `self.get_state()`, and whether the analysis is complete. It isn't if
+        the source of a method is unavailable or a state can't be resolved.
+    """
+    access = {"reads": set(), "writes": set(), "states": set(), "complete": True}
+    todo, seen = [name], set()
+    while todo:
+        name = todo.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+        function = _handler_function(state, name)
+        if function is None:
+            access["complete"] = False
+            continue
+        if function.__module__.startswith("reflex."):
+            if name.startswith("set_") and name[4:] in state.base_vars:
+                # The setter Reflex generates for a var.
+                access["writes"].add(name[4:])
+            elif name == "reset":
+                access["writes"].update(state.base_vars)
+            elif name != "get_state":
+                access["complete"] = False
+            continue
+        try:
+            tree = ast.parse(textwrap.dedent(inspect.getsource(function)))
+        except (OSError, TypeError):
+            access["complete"] = False
+            continue
+
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute):
+                method = node.func
+                if _is_self(method.value) and method.attr == "get_state":
+                    other = _resolve(node.args[0], function.__globals__)
+                    if isinstance(other, type) and issubclass(other, BaseState):
+                        access["states"].add(other)
+                    else:
+                        access["complete"] = False
+                elif method.attr in MUTATING_METHODS:
+                    var = _self_attribute(method.value)
+                    if var is not None:
+                        access["writes"].add(var)
+            elif isinstance(node, (ast.Attribute, ast.Subscript)):
+                var = _self_attribute(node)
+                if var is None:
+                    continue
+                if isinstance(node.ctx, (ast.Store, ast.Del)):
+                    access["writes"].add(var)
+                elif _handler_function(state, var) is not None:
+                    todo.append(var)
+                else:
+                    access["reads"].add(var)
+
+    for key in ("reads", "writes"):
+        access[key] = {
+            var for var in access[key] if var in state.vars or var in state.backend_vars
+        }
+    return access
+
+
+def _dependent_substates(state: Type[BaseState], vars: set[str]) -> list:
+    """Get the substates with computed vars that depend on vars of a state."""
+    dependents = [
+        state.get_class_substate((state.get_name(), name))
+        for name in state._always_dirty_substates
+    ]
+    todo = [(state, var) for var in vars]
+    while todo:
+        parent, var = todo.pop()
+        for name in parent._substate_var_dependencies[var]:
+            substate = parent.get_class_substate((parent.get_name(), name))
+            dependents.append(substate)
+            todo.append((substate, var))
+    return dependents
+
+
+@lru_cache(maxsize=None)
+def event_plan(state: Type[BaseState], name: str) -> dict:
+    """Plan which states an event has to load.
+
+    Args:
+        state: The state the event handler is defined on.
+        name: The name of the handler.
+
+    Returns:
+        The full names of the states to load, parents first, and of the
+        computed vars the event can change.
+    """
+    access = handler_access(state, name)
+    # The vars that may change in each state to load.
+    changes = {}
+    if not access["complete"]:
+        # Without knowing what the handler touches, load the whole tree.
+        for loaded in _subtree(_lineage(state)[0]):
+            changes[loaded] = set(loaded.vars)
+    else:
+        changes.update((loaded, set()) for loaded in _lineage(state))
+        for loaded in [state, *_dependent_substates(state, access["writes"])]:
+            changes[loaded] = access["writes"]
+        for other in access["states"]:
+            # Any var of another state may change, so load all its dependents.
+            for loaded in _lineage(other):
+                changes.setdefault(loaded, set())
+            for loaded in [other, *_dependent_substates(other, set(other.vars))]:
+                changes[loaded] = set(other.vars)
+
+    computed = set()
+    for loaded, changed in changes.items():
+        computed.update(
+            f"{loaded.get_full_name()}.{var}"
+            for var in loaded._always_dirty_computed_vars.union(
+                *(loaded._computed_var_dependencies[var] for var in changed)
+            )
+        )
+    return {
+        "states": [loaded.get_full_name() for loaded in changes],
+        "computed_vars": sorted(computed),
+        "complete": access["complete"],
+    }
+
+
+def reflex_loads(state: Type[BaseState]) -> list[str]:
+    """Get the states Reflex's Redis state manager loads for an event.
+
+    It loads the state of the event with all its substates, and the parents
+    of the state with the substates they could mark dirty.
+
+    Args:
+        state: The state the event handler is defined on.
+
+    Returns:
+        The full names of the states, parents first.
+    """
+    load = []
+    for parent in _lineage(state)[:-1]:
+        load.append(parent)
+        for substate in parent._potentially_dirty_substates():
+            load.extend(_subtree(substate))
+    load.extend(_subtree(state))
+    return list(dict.fromkeys(loaded.get_full_name() for loaded in load))
+
+
+def state_size(state: BaseState) -> int:
+    """Get the bytes a state is stored in, without its parent and substates.
+
+    Args:
+        state: The state instance.
+
+    Returns:
+        The size of the state as Reflex's Redis state manager pickles it.
+    """
+    return len(dill.dumps(state, byref=True))
+
+
+def default_sizes() -> dict[str, int]:
+    """Get the size of each state of the site with its default values.
+
+    Returns:
+        The size of each state, keyed by full name.
+    """
+    import_states()
+    root = rx.State(_reflex_internal_init=True)
+    sizes = {}
+    todo = [root]
+    while todo:
+        state = todo.pop()
+        sizes[state.get_full_name()] = state_size(state)
+        todo.extend(state.substates.values())
+    return sizes
+
+
+class StateMetricsMiddleware(Middleware):
+    """Log the bytes of the states loaded for each event."""
+
+    async def preprocess(
+        self, app: rx.App, state: BaseState, event: Event
+    ) -> StateUpdate | None:
+        """Measure the states loaded for an event.
+
+        Args:
+            app: The app.
+            state: The root of the loaded states.
+            event: The event to measure.
+
+        Returns:
+            None, the event is processed as usual.
+        """
+        path, _, name = event.name.rpartition(".")
+        try:
+            planned = set(
+                event_plan(type(state).get_class_substate(path), name)["states"]
+            )
+        except ValueError:
+            # Not an event of a state, e.g. a client side event.
+            return None
+
+        loaded = planned_bytes = count = 0
+        todo = [state]
+        while todo:
+            current = todo.pop()
+            size = state_size(current)
+            loaded += size
+            count += 1
+            if current.get_full_name() in planned:
+                planned_bytes += size
+            todo.extend(current.substates.values())
+
+        metrics = event_metrics[event.name]
+        metrics["events"] += 1
+        metrics["loaded"] += loaded
+        metrics["planned"] += planned_bytes
+        console.info(
+            f"State metrics: {event.name} loaded {count} states ({loaded} bytes), "
+            f"its plan needs {len(planned)} ({planned_bytes} bytes)."
+        )
+        return None
+
+
+def add_state_metrics(app: rx.App):
+    """Measure the states loaded for each event if `PCWEB_STATE_METRICS` is set.
+
+    Args:
+        app: The app to measure.
+    """
+    if env_flag(STATE_METRICS_ENV_VAR):
+        app.add_middleware(StateMetricsMiddleware())
@@ -0,0 +1,306 @@
+"""Optimize SVG markup at build time.
+
+The optimizer rounds coordinates to a precision that fits the size of the
+viewBox, draws paths that are repeated with the same data once in `<defs>` and
+references them with `<use>`, and removes definitions, e.g. filters and
+gradients, that nothing refers to. It only depends on the standard library.
+"""
+
+import math
+import re
+import xml.etree.ElementTree as ET
+
+SVG_NS = "http://www.w3.org/2000/svg"
+XLINK_NS = "http://www.w3.org/1999/xlink"
+
+# How many decimals to keep in coordinates if the SVG has no viewBox.
+PRECISION = 2
+
+# Coordinates are rounded to at most a thousandth of the size of the viewBox,
+# e.g. to 2 decimals in a 24 wide icon and 3 in a 1 wide one.
+VIEWBOX_DIGITS = 3
+
+# The attributes whose numbers are coordinates or lengths. Transforms are
+# left alone, since they may scale small numbers up.
+NUMERIC_ATTRIBUTES = {
+    "d",
+    "points",
+    "viewBox",
+    "x",
+    "y",
+    "x1",
+    "y1",
+    "x2",
+    "y2",
+    "cx",
+    "cy",
+    "fx",
+    "fy",
+    "r",
+    "rx",
+    "ry",
+    "width",
+    "height",
+    "stroke-width",
+}
+
+NUMBER_PATTERN = re.compile(r"-?(?:\d+\.\d*|\.\d+|\d+)(?:[eE][-+]?\d+)?")
+# A path command and its parameters. The exponent `e` is not a command.
+PATH_SEGMENT_PATTERN = re.compile(r"([MmZzLlHhVvCcSsQqTtAa])([^MmZzLlHhVvCcSsQqTtAa]*)")
+PATH_SEPARATOR_PATTERN = re.compile(r"[\s,]*")
+# The parameters of an arc, of which the fourth and fifth are one digit flags
+# that need no separator, e.g. `a2 2 0 012-2`.
+ARC_PARAMETERS = 7
+ARC_FLAGS = {3, 4}
+REFERENCE_PATTERN = re.compile(r"url\(#([^)]+)\)|^#(.+)$")
+UNQUOTED_ATTRIBUTE_PATTERN = re.compile(r'(\s[\w:-]+)\s*=\s*([^\s"\'>]+)')
+TAG_PATTERN = re.compile(r"<[^!?/][^>]*>")
+
+ET.register_namespace("", SVG_NS)
+ET.register_namespace("xlink", XLINK_NS)
+
+
+def _tag(name: str) -> str:
+    return f"{{{SVG_NS}}}{name}"
+
+
+def normalize(markup: str) -> str:
+    """Quote unquoted attribute values, which browsers allow but XML doesn't.
+
+    Args:
+        markup: The SVG markup.
+
+    Returns:
+        The markup as well-formed XML.
+    """
+
+    def quote(tag: re.Match) -> str:
+        return UNQUOTED_ATTRIBUTE_PATTERN.sub(r'\1="\2"', tag.group(0))
+
+    return TAG_PATTERN.sub(quote, markup.strip())
+
+
+def format_number(number: str, precision: int = PRECISION) -> str:
+    """Round a number and drop the zeros it doesn't need.
+
+    Args:
+        number: The number as written in the SVG.
+        precision: How many decimals to keep.
+
+    Returns:
+        The shortest form of the rounded number.
+    """
+    text = f"{round(float(number), precision):.{precision}f}"
+    if "." in text:
+        text = text.rstrip("0").rstrip(".")
+    return "0" if text == "-0" else text
+
+
+def round_numbers(value: str, precision: int = PRECISION) -> str:
+    """Round every number in an attribute value.
+
+    Args:
+        value: The attribute value, e.g. path data.
+        precision: How many decimals to keep.
+
+    Returns:
+        The value with rounded numbers.
+    """
+
+    def replace(match: re.Match) -> str:
+        text = format_number(match.group(0), precision)
+        # A number written right after another one is separated from it by
+        # its sign or leading point, e.g. `1-.5` or `1.5.5`. If rounding drops
+        # that, a space has to separate them instead.
+        previous = value[match.start() - 1 : match.start()]
+        if (previous.isdigit() or previous == ".") and not text.startswith("-"):
+            return f" {text}"
+        return text
+
+    return NUMBER_PATTERN.sub(replace, value)
+
+
+def _join_numbers(numbers: list[str]) -> str:
+    """Write numbers with the separators they need, e.g. `1 2-3`."""
+    text = ""
+    for number in numbers:
+        if text and (text[-1].isdigit() or text[-1] == ".") and number[0] != "-":
+            text += " "
+        text += number
+    return text
+
+
+def round_path(data: str, precision: int = PRECISION) -> str:
+    """Round the numbers in path data, leaving the flags of arcs as they are.
+
+    Args:
+        data: The `d` attribute of a path.
+        precision: How many decimals to keep.
+
+    Returns:
+        The path data with rounded numbers, or as it is if it can't be read.
+    """
+    commands = []
+    for match in PATH_SEGMENT_PATTERN.finditer(data.strip()):
+        command, parameters = match.groups()
+        if command not in "Aa":
+            numbers = [
+                format_number(number, precision)
+                for number in NUMBER_PATTERN.findall(parameters)
+            ]
+            commands.append(command + _join_numbers(numbers))
+            continue
+        numbers = []
+        position = 0
+        while True:
+            position = PATH_SEPARATOR_PATTERN.match(parameters, position).end()
+            if position == len(parameters):
+                break
+            if len(numbers) % ARC_PARAMETERS in ARC_FLAGS:
+                if parameters[position] not in "01":
+                    return data
+                numbers.append(parameters[position])
+                position += 1
+                continue
+            number = NUMBER_PATTERN.match(parameters, position)
+            if number is None:
+                return data
+            numbers.append(format_number(number.group(0), precision))
+            position = number.end()
+        commands.append(command + _join_numbers(numbers))
+    return "".join(commands)
+
+
+def viewbox_precision(root: ET.Element) -> int:
+    """Get how many decimals to keep in the coordinates of an SVG.
+
+    Args:
+        root: The SVG element.
+
+    Returns:
+        The decimals that keep coordinates to at most a thousandth of the
+        size of the viewBox, or `PRECISION` if the SVG has no viewBox.
+    """
+    try:
+        _, _, width, height = (
+            float(number) for number in NUMBER_PATTERN.findall(root.get("viewBox", ""))
+        )
+    except ValueError:
+        return PRECISION
+    size = max(width, height)
+    if size <= 0:
+        return PRECISION
+    return max(0, VIEWBOX_DIGITS - math.floor(math.log10(size)))
+
+
+def _defs(root: ET.Element) -> ET.Element:
+    """Get the `<defs>` of an SVG, adding it if it doesn't exist."""
+    defs = root.find(_tag("defs"))
+    if defs is None:
+        defs = ET.Element(_tag("defs"))
+        root.insert(0, defs)
+    return defs
+
+
+def share_paths(root: ET.Element, id_prefix: str) -> int:
+    """Define the paths that are drawn more than once a single time.
+
+    Each copy is replaced by a `<use>` of the definition, which keeps the
+    attributes of the copy, e.g. its fill or stroke.
+
+    Args:
+        root: The SVG element.
+        id_prefix: The prefix of the ids given to the shared paths, which
+            must be unique in the document the SVG is inlined in.
+
+    Returns:
+        The number of paths replaced.
+    """
+    parents = {child: parent for parent in root.iter() for child in parent}
+    paths = {}
+    for path in root.iter(_tag("path")):
+        if parents[path].tag != _tag("defs") and path.get("d"):
+            paths.setdefault(path.get("d"), []).append(path)
+
+    replaced = 0
+    for copies in paths.values():
+        if len(copies) < 2:
+            continue
+        shared_id = f"{id_prefix}{len(_defs(root).findall(_tag('path')))}"
+        ET.SubElement(_defs(root), _tag("path"), id=shared_id, d=copies[0].get("d"))
+        for path in copies:
+            path.tag = _tag("use")
+            del path.attrib["d"]
+            path.set("href", f"#{shared_id}")
+            replaced += 1
+    return replaced
+
+
+def _references(root: ET.Element) -> set[str]:
+    """Get the ids referenced anywhere in an SVG."""
+    references = set()
+    for element in root.iter():
+        for value in element.attrib.values():
+            for match in REFERENCE_PATTERN.finditer(value):
+                references.add(match.group(1) or match.group(2))
+    return references
+
+
+def remove_unused_defs(root: ET.Element) -> int:
+    """Remove the definitions that nothing refers to.
+
+    Args:
+        root: The SVG element.
+
+    Returns:
+        The number of definitions removed.
+    """
+    removed = 0
+    for defs in list(root.iter(_tag("defs"))):
+        # Removing a definition may leave the ones it referred to unused.
+        while True:
+            references = _references(root)
+            unused = [child for child in defs if child.get("id") not in references]
+            if not unused:
+                break
+            for child in unused:
+                defs.remove(child)
+            removed += len(unused)
+    for parent in list(root.iter()):
+        for defs in parent.findall(_tag("defs")):
+            if len(defs) == 0:
+                parent.remove(defs)
+    return removed
+
+
+def optimize(
+    markup: str, precision: int | None = None, id_prefix: str = "shared-path-"
+) -> str:
+    """Optimize SVG markup.
+
+    Args:
+        markup: The SVG markup.
+        precision: How many decimals to keep in coordinates, by default
+            from the size of the viewBox.
+        id_prefix: The prefix of the ids given to shared paths.
+
+    Returns:
+        The optimized markup.
+    """
+    root = ET.fromstring(normalize(markup))
+    if precision is None:
+        precision = viewbox_precision(root)
+    for element in root.iter():
+        for name, value in element.attrib.items():
+            if name == "d":
+                element.set(name, round_path(value, precision))
+            elif name in NUMERIC_ATTRIBUTES:
+                element.set(name, round_numbers(value, precision))
+        # Drop the whitespace between tags.
+        if element.text is not None and not element.text.strip():
+            element.text = None
+        if element.tail is not None and not element.tail.strip():
+            element.tail = None
+    share_paths(root, id_prefix)
+    remove_unused_defs(root)
+    return ET.tostring(root, encoding="unicode")
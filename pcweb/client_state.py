@@ -0,0 +1,152 @@
+"""UI state that lives in the browser.
+
+Toggles like the navbar's banner only change the page, so sending an event to
+the backend to flip them costs a round trip and a state load for nothing. A
+`ClientStateVar` is held in React state instead, shared by every component
+that reads it, and its setters run in the browser:
+
+    banner = ClientStateVar("banner", True)
+
+    rx.cond(banner.value, rx.box(..., on_click=banner.toggle()))
+
+The value starts from its default on every page load. It is only sent to the
+backend if the var is declared with a `sync` event handler, which every setter
+then also calls with the new value:
+
+    category = ClientStateVar(
+        "category", "All", sync=NavbarState.set_current_category
+    )
+"""
+
+import json
+import re
+from typing import Any
+
+from reflex import constants
+from reflex.event import EventChain, EventHandler
+from reflex.utils import format
+from reflex.utils.imports import ImportVar
+from reflex.vars import BaseVar, Var, VarData
+
+# The event the setters dispatch, so every component reading a var updates.
+CHANGE_EVENT = "client-state"
+
+NAME_PATTERN = re.compile(r"^[A-Za-z_]\w*$")
+
+
+class ClientStateVar:
+    """A state var held in the browser."""
+
+    def __init__(
+        self, name: str, default: Any = None, sync: EventHandler | None = None
+    ):
+        """Declare a client state var.
+
+        Args:
+            name: The name of the var, unique across the site.
+            default: The value of the var on page load, as JSON.
+            sync: An event handler taking the new value, to also send it to
+                the backend whenever it changes.
+
+        Raises:
+            ValueError: If the name is not a valid identifier.
+        """
+        if not NAME_PATTERN.match(name):
+            raise ValueError(f"Invalid client state var name: {name!r}.")
+        self.name = name
+        self.default = default
+        self.sync = sync
+        self._ref = f'refs["_client_state_{name}"]'
+        self._identifier = f"client_state_{name}"
+
+    def _var_data(self) -> VarData:
+        """Get the hooks that keep a component's copy of the value up to date."""
+        setter = f"set_{self._identifier}"
+        state = (
+            f"const [{self._identifier}, {setter}] = "
+            f"useState(() => {self._ref} ?? {json.dumps(self.default)})"
+        )
+        subscribe = "\n".join(
+            [
+                "useEffect(() => {",
+                "  const update = (event) => "
+                f'event.detail === "{self.name}" && {setter}({self._ref})',
+                f'  window.addEventListener("{CHANGE_EVENT}", update)',
+                f'  return () => window.removeEventListener("{CHANGE_EVENT}", update)',
+                "}, [])",
+            ]
+        )
+        return VarData(
+            imports={
+                "react": [
+                    ImportVar(tag="useState", install=False),
+                    ImportVar(tag="useEffect", install=False),
+                ],
+                f"/{constants.Dirs.STATE_PATH}": [ImportVar(tag="refs")],
+            },
+            hooks={state: None, subscribe: None},
+        )
+
+    @property
+    def value(self) -> Var:
+        """The value of the var, to use in props and `rx.cond`."""
+        return BaseVar(
+            _var_name=self._identifier,
+            _var_type=type(self.default) if self.default is not None else Any,
+            _var_data=self._var_data(),
+        )
+
+    def _setter(self, value: str, args: str = "") -> Var:
+        """Create an event handler that sets the var in the browser.
+
+        Args:
+            value: The JavaScript expression of the new value.
+            args: The parameters of the handler.
+
+        Returns:
+            The handler, to pass to an event trigger.
+        """
+        statements = [
+            f"{self._ref} = {value}",
+            f'window.dispatchEvent(new CustomEvent("{CHANGE_EVENT}", '
+            f'{{detail: "{self.name}"}}))',
+        ]
+        state_imports = [ImportVar(tag="refs")]
+        if self.sync is not None:
+            # `addEvents` is in scope in every component with an event trigger.
+            event = self.sync(BaseVar(_var_name=self._ref, _var_type=Any))
+            statements.append(f"addEvents([{format.format_event(event)}])")
+            state_imports.append(ImportVar(tag="Event"))
+        # An expression body: Reflex strips the braces around memoized handlers.
+        return BaseVar(
+            _var_name=f"({args}) => ({', '.join(statements)})",
+            _var_type=EventChain,
+            _var_data=VarData(imports={f"/{constants.Dirs.STATE_PATH}": state_imports}),
+        )
+
+    def set_value(self, value: Any) -> Var:
+        """Set the var to a value.
+
+        Args:
+            value: The new value, as JSON.
+
+        Returns:
+            The event handler.
+        """
+        return self._setter(json.dumps(value))
+
+    def set_from_event(self) -> Var:
+        """Set the var to the first argument of the event trigger.
+
+        Returns:
+            The event handler, e.g. for `on_open_change`.
+        """
+        return self._setter("value", "value")
+
+    def toggle(self) -> Var:
+        """Flip a boolean var.
+
+        Returns:
+            The event handler.
+        """
+        return self._setter(f"!({self._ref} ?? {json.dumps(self.default)})")
@@ -1,6 +1,8 @@
 import reflex as rx
 from reflex.style import toggle_color_mode
 
+from pcweb.components_webpage.icon import icon
+
 button_style = {
     "border_radius": "50px",
     "border": f"1px solid {rx.color('mauve', 4)}",
@@ -14,8 +16,8 @@ button_style = {
 def dark_switch() -> rx.Component:
     return rx.flex(
         rx.color_mode.icon(
-            light_component=rx.icon("sun", color=rx.color("mauve", 9)),
-            dark_component=rx.icon("moon", color=rx.color("mauve", 9)),
+            light_component=icon("sun", color=rx.color("mauve", 9)),
+            dark_component=icon("moon", color=rx.color("mauve", 9)),
         ),
         on_click=toggle_color_mode,
         _hover={"cursor": "pointer"},
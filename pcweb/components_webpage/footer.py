@@ -8,8 +8,9 @@ from email_validator import EmailNotValidError, validate_email
 from sqlmodel import Field
 
 from pcweb import constants, styles
+from pcweb.build.assets import asset
 from pcweb.components_webpage.logo import logo
-from pcweb.pages.index import index
+from pcweb.pages import page_path
 
 footer_item_style = {
     "font_family": styles.SANS,
@@ -156,9 +157,6 @@ def news_letter():
 
 
 def links():
-    from pcweb.pages.changelog import changelog
-    from pcweb.pages.faq import faq
-
     return rx.hstack(
         rx.desktop_only(
             logo(
@@ -167,10 +165,10 @@ def links():
         ),
         rx.vstack(
             rx.text("Site"),  # , color="#E8E8F4"
-            rx.link("Home", href=index.path, style=footer_item_style),
+            rx.link("Home", href=page_path("index"), style=footer_item_style),
             rx.link(
                 "Changelog",
-                href=changelog.path,
+                href=page_path("changelog"),
                 style=footer_item_style,
             ),
             align_items="start",
@@ -184,7 +182,7 @@ def links():
                 rx.text("Resources"),
                 rx.link(
                     "FAQ",
-                    href=faq.path,
+                    href=page_path("faq"),
                     style=footer_item_style,
                 ),
                 rx.link(
@@ -228,7 +226,7 @@ def footer(style=footer_style):
                 rx.hstack(
                     rx.link(
                         rx.image(
-                            src="/companies/light/github.svg",
+                            src=asset("/companies/light/github.svg"),
                             alt="A link to Reflex's Github",
                             height="1.5em",
                         ),
@@ -236,7 +234,7 @@ def footer(style=footer_style):
                     ),
                     rx.link(
                         rx.image(
-                            src="/companies/light/linkedin.svg",
+                            src=asset("/companies/light/linkedin.svg"),
                             alt="A link to Reflex's Linkedin",
                             height="1.5em",
                         ),
@@ -244,7 +242,7 @@ def footer(style=footer_style):
                     ),
                     rx.link(
                         rx.image(
-                            src="/companies/light/yc.svg",
+                            src=asset("/companies/light/yc.svg"),
                             alt="A link to Reflex's YC profile",
                             height="1.5em",
                         ),
@@ -252,7 +250,7 @@ def footer(style=footer_style):
                     ),
                     rx.link(
                         rx.image(
-                            src="/companies/light/twitter.svg",
+                            src=asset("/companies/light/twitter.svg"),
                             alt="A link to Reflex's Twitter",
                             height="1.5em",
                         ),
@@ -260,7 +258,7 @@ def footer(style=footer_style):
                     ),
                     rx.link(
                         rx.image(
-                            src="/companies/light/discord.svg",
+                            src=asset("/companies/light/discord.svg"),
                             alt="A link to Reflex's Discord",
                             height="1.5em",
                         ),
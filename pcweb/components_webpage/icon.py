@@ -0,0 +1,57 @@
+"""Lucide icons drawn from the site's icon sprite."""
+
+import reflex as rx
+from reflex.components.el.element import Element
+from reflex.vars import Var
+
+from pcweb.build.assets import asset
+from pcweb.build.icons import SPRITE_URL, VIEW_BOX, icon_name, sprite_icons
+
+
+class Use(Element):
+    """An SVG `<use>` element."""
+
+    tag = "use"
+
+    # The URL of the element to draw.
+    href: Var[str]
+
+
+def icon(tag: str, size: int = 24, **props) -> rx.Component:
+    """Draw a Lucide icon.
+
+    Icons in the sprite written by `python -m pcweb.build icons` are drawn
+    from it, others with `rx.icon()`.
+
+    Args:
+        tag: The name of the icon, e.g. "chevron_down".
+        size: The width and height of the icon in pixels.
+        props: The props to apply to the icon.
+
+    Returns:
+        The icon component.
+    """
+    name = icon_name(tag)
+    if name not in sprite_icons():
+        return rx.icon(tag=tag, size=size, **props)
+    # Add to the classes and attributes the caller passes rather than
+    # replacing them.
+    class_names = props.pop("class_name", [])
+    if isinstance(class_names, str):
+        class_names = [class_names]
+    return rx.el.svg(
+        Use.create(href=f"{asset(SPRITE_URL)}#{name}"),
+        class_name=" ".join([f"lucide lucide-{name}", *class_names]),
+        custom_attrs={
+            "viewBox": VIEW_BOX,
+            "width": str(size),
+            "height": str(size),
+            "fill": "none",
+            "stroke": "currentColor",
+            "strokeWidth": "2",
+            "strokeLinecap": "round",
+            "strokeLinejoin": "round",
+            **props.pop("custom_attrs", {}),
+        },
+        **props,
+    )
@@ -0,0 +1,38 @@
+"""An image that only downloads the resolution the viewport needs."""
+
+import reflex as rx
+
+from pcweb.build.assets import asset
+from pcweb.build.images import image_variants
+
+
+def responsive_image(src: str, sizes: str = "100vw", **props) -> rx.Component:
+    """Create a responsive image.
+
+    Raster images are served as resized AVIF and WebP variants, and the
+    browser picks the smallest that fills the rendered size. Other images,
+    e.g. SVGs, are served from their fingerprinted file.
+
+    Args:
+        src: The URL of the image in assets/, e.g. "/reflex_banner.png".
+        sizes: The rendered width of the image, as a `sizes` attribute.
+        props: The props to apply to the image.
+
+    Returns:
+        The image component.
+    """
+    image = rx.image(src=asset(src), **props)
+    variants = image_variants(src)
+    if not variants:
+        return image
+    return rx.el.picture(
+        *[
+            rx.el.source(
+                type=f"image/{fmt}",
+                src_set=", ".join(f"{url} {width}w" for url, width in urls),
+                sizes=sizes,
+            )
+            for fmt, urls in variants.items()
+        ],
+        image,
+    )
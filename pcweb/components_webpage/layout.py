@@ -0,0 +1,46 @@
+"""The navbar and footer that the webpage template puts around every page.
+
+They are memoized components, so Reflex compiles them once into the app's
+shared components module and every page imports them from there instead of
+carrying its own copy of the layout.
+"""
+
+import reflex as rx
+from reflex.components.component import evaluate_style_namespaces
+
+from pcweb import styles
+from pcweb.components_webpage.footer import footer
+from pcweb.components_webpage.navbar import navbar
+from pcweb.components_webpage.sidebar import sb
+
+
+def _with_app_style(component: rx.Component) -> rx.Component:
+    """Apply the app style, which Reflex only adds to the pages themselves.
+
+    Args:
+        component: The component to style.
+
+    Returns:
+        The styled component.
+    """
+    return component._add_style_recursive(evaluate_style_namespaces(styles.BASE_STYLE))
+
+
+@rx.memo
+def site_navbar() -> rx.Component:
+    """The navbar of the site.
+
+    Returns:
+        The navbar.
+    """
+    return _with_app_style(navbar(sidebar=sb))
+
+
+@rx.memo
+def site_footer() -> rx.Component:
+    """The footer of the site.
+
+    Returns:
+        The footer.
+    """
+    return _with_app_style(footer())
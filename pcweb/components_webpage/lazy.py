@@ -0,0 +1,132 @@
+"""Components that are loaded from their own module when they first render.
+
+Reflex compiles a page and everything in it into one module, so the page
+loads the code of every branch of an `rx.match` even if only one is shown.
+`lazy()` renders a `next/dynamic` import of a module of its own in
+`.web/components/lazy/` instead, which Next splits into a separate chunk that
+is fetched the first time the component renders:
+
+    rx.match(
+        demo.value,
+        ("Dashboard", lazy(dashboard(), "dashboard_demo")),
+        forms(),
+    )
+
+`prefetch()` fetches the chunk ahead of time, e.g. when a tab is hovered.
+Lazy components are only rendered in the browser. The modules are written by
+`write_lazy_modules()` once the app has been compiled, so building a page
+doesn't write to `.web/`.
+"""
+
+import re
+
+import reflex as rx
+from reflex import constants
+from reflex.compiler.compiler import _compile_page
+from reflex.components.component import NoSSRComponent
+from reflex.event import EventChain
+from reflex.utils import format, imports
+from reflex.utils.imports import ImportVar
+from reflex.vars import BaseVar, Var
+
+from pcweb.build.cache import LAZY_COMPONENTS
+
+NAME_PATTERN = re.compile(r"^[a-z][a-z0-9_]*$")
+
+# The component compiled into each lazy module, keyed by module.
+_branches: dict[str, rx.Component] = {}
+
+
+class LazyComponent(NoSSRComponent):
+    """A component imported from its own module on first render."""
+
+    is_default = True
+
+    def _branch(self) -> rx.Component:
+        return _branches[self.library]
+
+    def _get_imports(self) -> imports.ImportDict:
+        # The packages the module imports still have to be installed, but the
+        # page must not import them.
+        packages = {
+            library: [ImportVar(tag=None, render=False)]
+            for library, fields in self._branch()._get_all_imports().items()
+            if any(field.install for field in fields)
+        }
+        return imports.merge_imports(packages, super()._get_imports())
+
+    def _get_all_app_wrap_components(self) -> dict[tuple[int, str], rx.Component]:
+        return {
+            **super()._get_all_app_wrap_components(),
+            **self._branch()._get_all_app_wrap_components(),
+        }
+
+    def _get_all_custom_components(self, seen: set[str] | None = None) -> set:
+        return super()._get_all_custom_components(seen) | (
+            self._branch()._get_all_custom_components(seen)
+        )
+
+
+def module_library(name: str) -> str:
+    """Get the import path of a lazy module.
+
+    Args:
+        name: The name of the module.
+
+    Returns:
+        The path the page imports the module from.
+    """
+    return f"/{LAZY_COMPONENTS.relative_to(constants.Dirs.WEB).as_posix()}/{name}"
+
+
+def lazy(component: rx.Component, name: str) -> rx.Component:
+    """Load a component from its own module the first time it renders.
+
+    Args:
+        component: The component to load lazily.
+        name: The name of its module, unique across the site, e.g.
+            "dashboard_demo".
+
+    Returns:
+        The component that imports the module.
+
+    Raises:
+        ValueError: If the name is not a lowercase identifier.
+    """
+    from pcweb.components_webpage.layout import _with_app_style
+
+    if not NAME_PATTERN.match(name):
+        raise ValueError(f"Invalid lazy module name: {name!r}.")
+    library = module_library(name)
+    _branches[library] = _with_app_style(component)
+    placeholder = LazyComponent.create()
+    placeholder.library = library
+    placeholder.tag = f"Lazy{format.to_title_case(name)}"
+    return placeholder
+
+
+def write_lazy_modules():
+    """Compile the lazy components of the built pages into their modules.
+
+    Modules that are up to date are left alone, so Next doesn't rebuild them.
+    """
+    for library, component in _branches.items():
+        code = _compile_page(component, None)
+        module = LAZY_COMPONENTS / f"{library.rpartition('/')[2]}.js"
+        if not module.exists() or module.read_text(encoding="utf-8") != code:
+            module.parent.mkdir(parents=True, exist_ok=True)
+            module.write_text(code, encoding="utf-8")
+
+
+def prefetch(name: str) -> Var:
+    """Fetch a lazy module before its component renders.
+
+    Args:
+        name: The name of the module.
+
+    Returns:
+        An event handler that starts loading the module.
+    """
+    return BaseVar(
+        _var_name=f"() => import('{module_library(name)}')", _var_type=EventChain
+    )
@@ -2,7 +2,7 @@
 
 import reflex as rx
 
-from pcweb import styles
+from pcweb.components_webpage.image import responsive_image
 
 
 def logo(**style_props):
@@ -12,13 +12,13 @@ def logo(**style_props):
         style_props: The style properties to apply to the component.
     """
     return rx.color_mode_cond(
-        rx.image(
-            src=styles.NAVBAR_LOGO,
+        responsive_image(
+            "/Reflex.svg",
             alt="The Reflex logo.",
             **style_props,
         ),
-        rx.image(
-            src=styles.LOGO_URL,
+        responsive_image(
+            "/Reflex_white.svg",
             alt="The Reflex logo.",
             **style_props,
         ),
@@ -32,9 +32,6 @@ def navbar_logo(**style_props):
         style_props: The style properties to apply to the component.
     """
     return rx.link(
-        rx.image(
-            src=styles.NAVBAR_LOGO,
-            **style_props,
-        ),
+        responsive_image("/Reflex.svg", **style_props),
         href="/",
     )
@@ -1,5 +1,7 @@
 import reflex as rx
 
+from pcweb.build.assets import asset
+
 from .style import button_style
 
 
@@ -7,7 +9,7 @@ def discord() -> rx.Component:
     return rx.link(
         rx.flex(
             rx.image(
-                src="/companies/light/discord.svg",
+                src=asset("/companies/light/discord.svg"),
             ),
             padding="7px",
             style=button_style,
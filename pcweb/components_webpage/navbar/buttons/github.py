@@ -1,5 +1,7 @@
 import reflex as rx
 
+from pcweb.components_webpage.icon import icon
+
 from .style import button_style
 
 
@@ -13,7 +15,7 @@ def shorten_to_k(number):
 def github_desktop() -> rx.Component:
     return rx.link(
         rx.flex(
-            rx.icon(
+            icon(
                 "github",
                 color=rx.color("mauve", 9),
             ),
@@ -38,7 +40,7 @@ def github_desktop() -> rx.Component:
 def github_mobile() -> rx.Component:
     return rx.link(
         rx.flex(
-            rx.icon(
+            icon(
                 "github",
                 color="#6f6d78",
             ),
@@ -1,5 +1,7 @@
 import reflex as rx
 
+from pcweb.components_webpage.icon import icon
+
 from .style import button_style
 
 
@@ -37,7 +39,7 @@ def sidebar_button(sidebar) -> rx.Component:
     return rx.flex(
         sidebar_drawer(
             sidebar,
-            rx.icon(
+            icon(
                 "menu",
                 color="#6f6d78",
             ),
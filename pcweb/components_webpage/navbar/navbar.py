@@ -3,9 +3,11 @@
 import reflex as rx
 
 from pcweb import constants
+from pcweb.build.assets import asset
+from pcweb.client_state import ClientStateVar
 from pcweb.components_webpage.dark_switch import dark_switch
-from pcweb.pages.changelog import changelog
-from pcweb.pages.faq import faq
+from pcweb.components_webpage.icon import icon
+from pcweb.pages import page_path
 
 from .buttons.discord import discord
 from .buttons.github import github
@@ -15,35 +17,24 @@ from .buttons.sidebar import sidebar_button
 class NavbarState(rx.State):
     """The state for the navbar component."""
 
-    # Whether the sidebar is open.
-    sidebar_open: bool = False
-
     search_input: str = ""
 
     enter: bool = False
 
-    banner: bool = True
-
-    ai_chat: bool = True
-
     current_category = "All"
 
-    def toggle_banner(self):
-        self.banner = not self.banner
-
-    def toggle_sidebar(self):
-        self.sidebar_open = not self.sidebar_open
-
-    def toggle_ai_chat(self):
-        self.ai_chat = not self.ai_chat
-
     def update_category(self, tag):
         self.current_category = tag
 
 
+# The navbar's toggles only change the page, so they are kept in the browser.
+# The sidebar drawer keeps whether it is open itself.
+banner_open = ClientStateVar("navbar_banner", True)
+
+
 def banner():
     return rx.cond(
-        NavbarState.banner,
+        banner_open.value,
         rx.box(
             rx.hstack(
                 rx.text(
@@ -62,10 +53,10 @@ def banner():
                     text_align="center",
                     width="100%",
                 ),
-                rx.icon(
+                icon(
                     tag="x",
                     z_index=1000,
-                    on_click=NavbarState.toggle_banner,
+                    on_click=banner_open.toggle(),
                 ),
                 width="100%",
                 align_items="center",
@@ -88,10 +79,10 @@ def resource_header(text):
     )
 
 
-def resources_item(text, url, icon):
+def resources_item(text, url, tag):
     return rx.link(
         rx.flex(
-            rx.icon(icon, size=20, color=rx.color("mauve", 9)),
+            icon(tag, size=20, color=rx.color("mauve", 9)),
             rx.text(text, color=rx.color("mauve", 9)),
             wrap="nowrap",
             spacing="2",
@@ -105,7 +96,7 @@ def resources_section(style):
         rx.hover_card.trigger(
             rx.flex(
                 rx.text("Resources", style=style),
-                rx.icon(tag="chevron_down", size=18, style=style),
+                icon(tag="chevron_down", size=18, style=style),
                 align_items="center",
                 _hover={
                     "cursor": "pointer",
@@ -128,7 +119,7 @@ def resources_section(style):
                         constants.CONTRIBUTING_URL,
                         "file-json-2",
                     ),
-                    resources_item("Changelog", changelog.path, "list-checks"),
+                    resources_item("Changelog", page_path("changelog"), "list-checks"),
                     direction="column",
                     align_items="start",
                     padding_left="20px",
@@ -142,7 +133,7 @@ def resources_section(style):
                         constants.ROADMAP_URL,
                         "map-pinned",
                     ),
-                    resources_item("FAQ", faq.path, "list-todo"),
+                    resources_item("FAQ", page_path("faq"), "list-todo"),
                     direction="column",
                     align_items="start",
                     padding_top="20px",
@@ -182,8 +173,8 @@ def navigation_section():
 
     return rx.box(
         rx.flex(
-            rx.link("FAQ", href=faq.path, style=section_style),
-            rx.link("ChangeLog", href=changelog.path, style=section_style),
+            rx.link("FAQ", href=page_path("faq"), style=section_style),
+            rx.link("ChangeLog", href=page_path("changelog"), style=section_style),
             resources_section(style=section_style),
             spacing="5",
         ),
@@ -234,13 +225,13 @@ def navbar(sidebar: rx.Component = None) -> rx.Component:
                 rx.box(
                     rx.color_mode_cond(
                         rx.image(
-                            src="/logos/light/reflex.svg",
+                            src=asset("/logos/light/reflex.svg"),
                             alt="Reflex Logo",
                             height="20px",
                             justify="start",
                         ),
                         rx.image(
-                            src="/logos/dark/reflex.svg",
+                            src=asset("/logos/dark/reflex.svg"),
                             alt="Reflex Logo",
                             height="20px",
                             justify="start",
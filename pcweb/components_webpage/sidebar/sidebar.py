@@ -5,8 +5,7 @@ from __future__ import annotations
 import reflex as rx
 
 from pcweb import constants
-from pcweb.pages.changelog import changelog
-from pcweb.pages.faq import faq
+from pcweb.pages import page_path
 
 
 def sidebar(url=None, width: str = "100%") -> rx.Component:
@@ -18,7 +17,7 @@ def sidebar(url=None, width: str = "100%") -> rx.Component:
     }
 
     return rx.vstack(
-        rx.link("Changelog", href=changelog.path, style=section_style),
+        rx.link("Changelog", href=page_path("changelog"), style=section_style),
         rx.link(
             "Roadmap",
             href=constants.ROADMAP_URL,
@@ -29,7 +28,7 @@ def sidebar(url=None, width: str = "100%") -> rx.Component:
             href=constants.CONTRIBUTING_URL,
             style=section_style,
         ),
-        rx.link("FAQ", href=faq.path, style=section_style),
+        rx.link("FAQ", href=page_path("faq"), style=section_style),
         spacing="5",
         width="100%",
         height="100%",
@@ -1,10 +1,61 @@
+"""The pages of the site.
+
+Pages are listed in the route manifest and only imported when a route is
+requested, so a build or process only pays for the pages it uses.
+"""
+
+import importlib
+from typing import Callable
+
+from pcweb.build.manifest import load_manifest
 from pcweb.route import Route
 
-from .changelog import changelog  # noqa
-from .faq import faq  # noqa
-from .index import index  # noqa
-from .page404 import page404  # noqa
 
-routes = [
-    *[r for r in locals().values() if isinstance(r, Route)],
-]
+def _load(entry: dict) -> Route:
+    return getattr(importlib.import_module(entry["module"]), entry["attr"])
+
+
+def get_routes(include: Callable[[str], bool] | None = None) -> list[Route]:
+    """Import the pages of the site.
+
+    Args:
+        include: Only import the pages whose path this returns True for.
+
+    Returns:
+        The routes of the imported pages.
+    """
+    return [
+        _load(entry)
+        for entry in load_manifest()
+        if include is None or include(entry["path"])
+    ]
+
+
+def get_route(path: str) -> Route:
+    """Import the page at a path.
+
+    Args:
+        path: The path of the page.
+
+    Returns:
+        The route of the page.
+    """
+    for entry in load_manifest():
+        if entry["path"] == path:
+            return _load(entry)
+    raise KeyError(f"No page is registered at {path!r}.")
+
+
+def page_path(name: str) -> str:
+    """Get the path of a page without importing it.
+
+    Args:
+        name: The name of the page function, e.g. "faq".
+
+    Returns:
+        The path of the page.
+    """
+    for entry in load_manifest():
+        if entry["attr"] == name:
+            return entry["path"]
+    raise KeyError(f"No page is named {name!r}.")
@@ -1,6 +1,7 @@
 import reflex as rx
 
 from pcweb import constants, styles
+from pcweb.components_webpage.icon import icon
 from pcweb.components_webpage.logo import logo
 from pcweb.templates.webpage import webpage
 
@@ -13,7 +14,7 @@ def change(date, title, description, points, link):
             ),
             rx.hstack(
                 rx.hstack(
-                    rx.icon(tag="copy", size=18, color="#6C6C81"),
+                    icon(tag="copy", size=18, color="#6C6C81"),
                     rx.text(title, font_weight=styles.BOLD_WEIGHT),
                 ),
                 rx.tablet_and_desktop(
@@ -22,7 +23,7 @@ def change(date, title, description, points, link):
                 ),
                 rx.link(
                     rx.button(
-                        rx.icon(tag="github", size=18),
+                        icon(tag="github", size=18),
                         "Full Notes ->",
                         color="#A2A2B9",
                         padding_x="1em",
@@ -95,7 +96,7 @@ def changelog_content():
     )
 
 
-@webpage(path="/changelog", title="Changelog · Reflex")
+@webpage(path="/changelog", title="Changelog · Reflex", static=True)
 def changelog():
     return rx.center(
         rx.box(
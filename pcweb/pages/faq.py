@@ -171,7 +171,7 @@ def mobile_view():
     )
 
 
-@webpage(path="/faq", title="Frequently Asked Questions · Reflex")
+@webpage(path="/faq", title="Frequently Asked Questions · Reflex", static=True)
 def faq():
     return rx.container(
         rx.vstack(
@@ -1,6 +1,10 @@
 import reflex as rx
 
 from pcweb import styles
+from pcweb.build.assets import asset
+from pcweb.client_state import ClientStateVar
+from pcweb.components_webpage.icon import icon
+from pcweb.components_webpage.lazy import lazy, prefetch
 from pcweb.templates import webpage
 
 from .demos_on_landing_page.auth.auth import auth
@@ -39,17 +43,15 @@ def container(*children, **kwargs):
     )
 
 
-class DemoState(rx.State):
-    demo = "Auth"
-
-    def set_demo(self, demo):
-        self.demo = demo
+# The selected demo. Switching demos only changes the page, so it is
+# selected in the browser without an event to the backend.
+demo = ClientStateVar("landing_demo", "Auth")
 
 
 def config_button():
     return rx.menu.root(
         rx.menu.trigger(
-            rx.button(rx.icon("ellipsis"), variant="soft"),
+            rx.button(icon("ellipsis"), variant="soft"),
         ),
         rx.menu.content(
             rx.menu.item("Share", shortcut="⌘ E"),
@@ -73,18 +75,28 @@ def config_button():
     )
 
 
+# The lazy module of each demo. The demo shown on load is left out: it is the
+# default branch of the match and ships with the page.
+LAZY_DEMOS = {"Forms": "forms_demo", "Dashboard": "dashboard_demo"}
+
+
 def example_button(text):
+    props = {}
+    if text in LAZY_DEMOS:
+        # Start loading the demo as soon as the pointer is over its button.
+        props["on_mouse_enter"] = prefetch(LAZY_DEMOS[text])
     return rx.button(
         rx.text(text),
         border_radius="8px;",
         border="1px solid rgba(186, 199, 247, 0.12);",
         background=rx.cond(
-            DemoState.demo == text,
+            demo.value == text,
             rx.color("violet", 10),
             rx.color("violet", 8),
         ),
         backdrop_filter="blur(2px);",
-        on_click=lambda: DemoState.set_demo(text),
+        on_click=demo.set_value(text),
+        **props,
     )
 
 
@@ -117,11 +129,10 @@ def demos():
         ),
         rx.box(
             rx.match(
-                DemoState.demo,
-                ("Forms", forms()),
-                ("Dashboard", dashboard()),
-                ("Auth", auth()),
-                forms(),
+                demo.value,
+                ("Forms", lazy(forms(), LAZY_DEMOS["Forms"])),
+                ("Dashboard", lazy(dashboard(), LAZY_DEMOS["Dashboard"])),
+                auth(),
             ),
             border_radius="10px;",
             border="1px solid #2F2B37;",
@@ -196,7 +207,9 @@ def open_source_badge() -> rx.Component:
 def github_button() -> rx.Component:
     return rx.button(
         rx.flex(
-            rx.image(src="/companies/light/github.svg", height="20px", width="20px"),
+            rx.image(
+                src=asset("/companies/light/github.svg"), height="20px", width="20px"
+            ),
             rx.center(
                 "Github",
                 color="#FFFFFF",
@@ -3,38 +3,54 @@
 import reflex as rx
 
 from pcweb import styles
-from pcweb.pages import page404, routes
+from pcweb.build.app import App, on_compiled
+from pcweb.build.assets import write_asset_manifest
+from pcweb.build.backend import import_states, is_backend_only
+from pcweb.build.fonts import font_preloads, font_stylesheets
+from pcweb.build.images import generate_image_variants
+from pcweb.build.pages import add_routes
+from pcweb.build.states import add_state_metrics
+from pcweb.components_webpage.lazy import write_lazy_modules
+from pcweb.pages import get_route, get_routes
+from pcweb.redirects import add_redirects
+from pcweb.state_delta import add_binary_deltas
 from pcweb.whitelist import _check_whitelisted_path
 
-# This number discovered by trial and error on Windows 11 w/ Node 18, any
-# higher and the prod build fails with EMFILE error.
-WINDOWS_MAX_ROUTES = 125
-
+# Define the states and models before creating the app.
+import_states()
 
 # Create the app.
-app = rx.App(
+app = App(
     style=styles.BASE_STYLE,
-    stylesheets=styles.STYLESHEETS,
+    stylesheets=font_stylesheets(styles.STYLESHEETS),
+    head_components=font_preloads(),
     theme=rx.theme(has_background=True, radius="large", accent_color="violet"),
 )
 
-# Add the pages to the app.
-for route in routes:
-    if _check_whitelisted_path(route.path):
-        app.add_page(
-            route.component,
-            route.path,
-            route.title,
-            # image="/previews/index_preview.png",
-        )
-
 # Add redirects
-redirects = [
-    ("/docs", "/docs/getting-started/introduction"),
-    ("/docs/getting-started", "/docs/getting-started/introduction"),
-]
+add_redirects(app)
+
+# Log the bytes of the states each event loads, with PCWEB_STATE_METRICS=1.
+add_state_metrics(app)
+
+# Send binary state updates to the clients that ask, with PCWEB_BINARY_DELTAS=1.
+add_binary_deltas(app)
+
+# Generate the image variants and list the fingerprinted assets once the
+# pages have resolved them.
+on_compiled(generate_image_variants)
+on_compiled(write_asset_manifest)
+
+# Write the modules of the lazy components the pages render.
+on_compiled(write_lazy_modules)
 
-for source, target in redirects:
-    app.add_page(lambda: rx.fragment(), route=source, on_load=rx.redirect(target))
+# Backend workers only serve events, so they don't build any pages.
+if not is_backend_only():
+    # Add the pages to the app.
+    add_routes(app, get_routes(include=_check_whitelisted_path))
 
-app.add_custom_404_page(page404.component)
+    app.add_custom_404_page(get_route("/404").component)
+else:
+    # The pages enable the state of the app, so without any it has to be
+    # enabled explicitly to serve events.
+    app.enable_state()
@@ -0,0 +1,94 @@
+"""Redirects from old paths to their new location.
+
+Redirects are answered with a real HTTP redirect instead of a page: the
+backend serves them directly, and a static redirect map is written for
+whatever serves the exported frontend. Servers that don't read the map, like
+`next start` and the dev server, get a page for each old path that redirects
+in the browser, without a state or a websocket round trip.
+"""
+
+import json
+from pathlib import Path
+
+import reflex as rx
+from reflex import constants
+from starlette.responses import RedirectResponse
+
+from pcweb.build import export
+from pcweb.build.app import on_compiled
+from pcweb.build.backend import is_backend_only
+
+# The paths to redirect, and where to redirect them to.
+REDIRECTS = [
+    ("/docs", "/docs/getting-started/introduction"),
+    ("/docs/getting-started", "/docs/getting-started/introduction"),
+]
+
+# A permanent redirect that keeps the request method.
+REDIRECT_STATUS = 308
+
+# The static redirect map, in the `_redirects` format understood by most
+# static hosts. It is copied to the root of the exported site.
+REDIRECTS_FILE = Path(constants.Dirs.APP_ASSETS) / export.REDIRECTS_FILE
+
+
+def _redirect_to(target: str):
+    async def redirect() -> RedirectResponse:
+        return RedirectResponse(target, status_code=REDIRECT_STATUS)
+
+    return redirect
+
+
+def redirect_page(target: str) -> rx.Component:
+    """Create a page that redirects to another path in the browser.
+
+    Args:
+        target: The path to redirect to.
+
+    Returns:
+        The page, which replaces itself with the target when it is navigated
+        to on the client.
+    """
+    return rx.script(f"window.location.replace({json.dumps(target)})")
+
+
+def write_redirect_map():
+    """Write the static redirect map for the exported site."""
+    lines = [f"{source} {target} {REDIRECT_STATUS}" for source, target in REDIRECTS]
+    REDIRECTS_FILE.write_text("\n".join(lines) + "\n")
+
+
+def add_redirects(app: rx.App):
+    """Serve the redirects from the backend and write the static redirect map.
+
+    Unless the app is a backend-only worker, each old path also gets a page
+    that redirects in the browser, for the servers that don't read the map.
+
+    Args:
+        app: The app to add the redirects to.
+    """
+    sources = {source for source, _ in REDIRECTS}
+    # A route registered earlier at an old path would answer it instead, like
+    # FastAPI's API docs at /docs.
+    app.api.router.routes = [
+        route
+        for route in app.api.router.routes
+        if getattr(route, "path", None) not in sources
+    ]
+    for source, target in REDIRECTS:
+        app.api.add_api_route(
+            source,
+            _redirect_to(target),
+            methods=["GET", "HEAD"],
+            include_in_schema=False,
+        )
+    on_compiled(write_redirect_map)
+    if is_backend_only():
+        return
+    for source, target in REDIRECTS:
+        app.add_page(
+            redirect_page(target),
+            route=source,
+            # Loading the page redirects before any JS runs.
+            meta=[{"http_equiv": "refresh", "content": f"0; url={target}"}],
+        )
@@ -19,6 +19,10 @@ class Route(Base):
     # The component to render for the route.
     component: Callable[[], rx.Component]
 
+    # Whether the page is static: its content doesn't depend on any backend
+    # state apart from the interactive parts of the navbar and footer.
+    static: bool = False
+
 
 def get_path(component_fn: Callable):
     """Get the path for a page based on the file location.
@@ -0,0 +1,369 @@
+"""A compact binary encoding for the state updates sent to the browser.
+
+Reflex sends each state update as JSON, with the full dotted name of every
+substate and var it changes, e.g. `{"delta": {"state.forms_state":
+{"clicked": "Privacy"}}, ...}`. A client that connects with `?delta=binary`
+gets them in a MessagePack subset instead, with two changes per connection:
+
+- Keys are interned. The first time a map key is sent it is written as a
+  string and both ends append it to their key table; after that it is sent as
+  its index in the table, as a MessagePack extension of type 0.
+- Updates of at least `DEFLATE_MIN_SIZE` bytes are deflated on a stream that
+  lasts the whole connection, so repeated content is compressed against the
+  earlier updates, as with permessage-deflate.
+
+The first byte of each message says whether the rest is deflated. Clients
+that don't ask for binary updates keep getting JSON, and an update with a
+value the encoding can't represent is sent as JSON to every client.
+
+Set `PCWEB_BINARY_DELTAS=1` to serve binary updates to the clients that ask.
+"""
+
+import struct
+import zlib
+from typing import Any
+from urllib.parse import parse_qs
+
+import reflex as rx
+from reflex import constants
+from reflex.app import EventNamespace
+from reflex.state import StateUpdate
+from reflex.utils import console
+from reflex.utils.serializers import serialize
+
+from pcweb.build.config import env_flag
+
+BINARY_DELTAS_ENV_VAR = "PCWEB_BINARY_DELTAS"
+
+# The query parameter a client connects with to ask for binary updates.
+DELTA_QUERY_PARAM = "delta"
+BINARY = "binary"
+
+# The first byte of a message.
+PLAIN = 0
+DEFLATED = 1
+
+# Smaller updates aren't worth deflating.
+DEFLATE_MIN_SIZE = 64
+
+# The extension type of an interned key, and the size of the key table.
+KEY_EXT = 0
+MAX_KEYS = 1 << 16
+
+
+# The type bytes and formats of integers, smallest first.
+_UINTS = [(0xCC, ">BB"), (0xCD, ">BH"), (0xCE, ">BI"), (0xCF, ">BQ")]
+_INTS = [(0xD0, ">Bb"), (0xD1, ">Bh"), (0xD2, ">Bi"), (0xD3, ">Bq")]
+
+
+def _pack(value: Any, keys: dict[str, int], out: bytearray):
+    """Write a value to a buffer.
+
+    Args:
+        value: The value to write.
+        keys: The interned keys, added to as new keys are written.
+        out: The buffer to write to.
+
+    Raises:
+        TypeError: If the value has no serializer.
+        ValueError: If an integer is out of range.
+    """
+    if value is None:
+        out.append(0xC0)
+    elif value is True or value is False:
+        out.append(0xC3 if value else 0xC2)
+    elif isinstance(value, int):
+        if -32 <= value < 0x80:
+            out.append(value & 0xFF)
+            return
+        for code, fmt in _UINTS if value >= 0 else _INTS:
+            try:
+                out += struct.pack(fmt, code, value)
+                return
+            except struct.error:
+                continue
+        raise ValueError(f"Integer out of range: {value}.")
+    elif isinstance(value, float):
+        out += struct.pack(">Bd", 0xCB, value)
+    elif isinstance(value, str):
+        data = value.encode("utf-8")
+        if len(data) < 32:
+            out.append(0xA0 | len(data))
+        elif len(data) < 1 << 8:
+            out += struct.pack(">BB", 0xD9, len(data))
+        elif len(data) < 1 << 16:
+            out += struct.pack(">BH", 0xDA, len(data))
+        else:
+            out += struct.pack(">BI", 0xDB, len(data))
+        out += data
+    elif isinstance(value, (list, tuple)):
+        if len(value) < 16:
+            out.append(0x90 | len(value))
+        elif len(value) < 1 << 16:
+            out += struct.pack(">BH", 0xDC, len(value))
+        else:
+            out += struct.pack(">BI", 0xDD, len(value))
+        for item in value:
+            _pack(item, keys, out)
+    elif isinstance(value, dict):
+        if len(value) < 16:
+            out.append(0x80 | len(value))
+        elif len(value) < 1 << 16:
+            out += struct.pack(">BH", 0xDE, len(value))
+        else:
+            out += struct.pack(">BI", 0xDF, len(value))
+        for key, item in value.items():
+            key = str(key)
+            index = keys.get(key)
+            if index is None:
+                if len(keys) < MAX_KEYS:
+                    keys[key] = len(keys)
+                _pack(key, keys, out)
+            elif index < 1 << 8:
+                out += struct.pack(">BbB", 0xD4, KEY_EXT, index)
+            else:
+                out += struct.pack(">BbH", 0xD5, KEY_EXT, index)
+            _pack(item, keys, out)
+    else:
+        serialized = serialize(value)
+        if serialized is None:
+            raise TypeError(f"No serializer for {type(value).__name__}.")
+        _pack(serialized, keys, out)
+
+
+# The formats of the fixed size values, by type byte.
+_FIXED = {
+    0xCA: ">f",
+    0xCB: ">d",
+    0xCC: ">B",
+    0xCD: ">H",
+    0xCE: ">I",
+    0xCF: ">Q",
+    0xD0: ">b",
+    0xD1: ">h",
+    0xD2: ">i",
+    0xD3: ">q",
+}
+
+# The formats of the lengths of strings, arrays and maps, by type byte.
+_LENGTHS = {
+    0xD9: ">B",
+    0xDA: ">H",
+    0xDB: ">I",
+    0xDC: ">H",
+    0xDD: ">I",
+    0xDE: ">H",
+    0xDF: ">I",
+}
+
+
+def _unpack(data: bytes, offset: int, keys: list[str], key: bool = False):
+    """Read a value from a buffer.
+
+    Args:
+        data: The buffer to read from.
+        offset: The position of the value.
+        keys: The interned keys, added to as new keys are read.
+        key: Whether the value is a map key.
+
+    Returns:
+        The value and the position after it.
+
+    Raises:
+        ValueError: If the data isn't valid.
+    """
+    byte = data[offset]
+    offset += 1
+    if byte < 0x80:
+        return byte, offset
+    if byte >= 0xE0:
+        return byte - 0x100, offset
+    if byte in (0xD4, 0xD5) and data[offset] == KEY_EXT:
+        size = 1 if byte == 0xD4 else 2
+        index = int.from_bytes(data[offset + 1 : offset + 1 + size], "big")
+        return keys[index], offset + 1 + size
+    if byte in _FIXED:
+        fmt = _FIXED[byte]
+        return struct.unpack_from(fmt, data, offset)[0], offset + struct.calcsize(fmt)
+
+    length = None
+    if byte in _LENGTHS:
+        fmt = _LENGTHS[byte]
+        length = struct.unpack_from(fmt, data, offset)[0]
+        offset += struct.calcsize(fmt)
+
+    if 0xA0 <= byte < 0xC0 or 0xD9 <= byte <= 0xDB:
+        length = byte & 0x1F if length is None else length
+        value = data[offset : offset + length].decode("utf-8")
+        if key and len(keys) < MAX_KEYS:
+            keys.append(value)
+        return value, offset + length
+    if 0x90 <= byte < 0xA0 or byte in (0xDC, 0xDD):
+        items = []
+        for _ in range(byte & 0x0F if length is None else length):
+            item, offset = _unpack(data, offset, keys)
+            items.append(item)
+        return items, offset
+    if 0x80 <= byte < 0x90 or byte in (0xDE, 0xDF):
+        value = {}
+        for _ in range(byte & 0x0F if length is None else length):
+            name, offset = _unpack(data, offset, keys, key=True)
+            value[name], offset = _unpack(data, offset, keys)
+        return value, offset
+    if byte in (0xC0, 0xC2, 0xC3):
+        return {0xC0: None, 0xC2: False, 0xC3: True}[byte], offset
+    raise ValueError(f"Invalid type byte: {byte:#x}.")
+
+
+def update_dict(update: StateUpdate) -> dict:
+    """Get the fields of a state update as they are sent.
+
+    Args:
+        update: The state update.
+
+    Returns:
+        The fields of the update.
+    """
+    return {
+        "delta": update.delta,
+        "events": [event.dict() for event in update.events],
+        "final": update.final,
+    }
+
+
+class DeltaEncoder:
+    """Encode the state updates sent over one connection."""
+
+    def __init__(self):
+        """Start with an empty key table and deflate stream."""
+        self.keys: dict[str, int] = {}
+        self._deflate = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+
+    def encode(self, update: dict) -> bytes:
+        """Encode a state update.
+
+        Args:
+            update: The fields of the update.
+
+        Returns:
+            The message to send.
+
+        Raises:
+            TypeError: If a value has no serializer.
+            ValueError: If an integer is out of range.
+        """
+        size = len(self.keys)
+        out = bytearray()
+        try:
+            _pack(update, self.keys, out)
+        except (TypeError, ValueError):
+            # The update isn't sent, so drop the keys the client won't know.
+            for key in list(self.keys)[size:]:
+                del self.keys[key]
+            raise
+        if len(out) < DEFLATE_MIN_SIZE:
+            return bytes([PLAIN]) + out
+        data = self._deflate.compress(out) + self._deflate.flush(zlib.Z_SYNC_FLUSH)
+        return bytes([DEFLATED]) + data
+
+
+class DeltaDecoder:
+    """Decode the state updates received over one connection."""
+
+    def __init__(self):
+        """Start with an empty key table and deflate stream."""
+        self.keys: list[str] = []
+        self._inflate = zlib.decompressobj(wbits=-zlib.MAX_WBITS)
+
+    def decode(self, message: bytes) -> dict:
+        """Decode a state update.
+
+        Args:
+            message: The message received.
+
+        Returns:
+            The fields of the update.
+        """
+        data = message[1:]
+        if message[0] == DEFLATED:
+            data = self._inflate.decompress(data)
+        return _unpack(data, 0, self.keys)[0]
+
+
+def wants_binary(environ: dict) -> bool:
+    """Check whether a client asked for binary updates when it connected.
+
+    Args:
+        environ: The environ of the connection.
+
+    Returns:
+        Whether to send the client binary updates.
+    """
+    query = parse_qs(environ.get("QUERY_STRING", ""))
+    return query.get(DELTA_QUERY_PARAM, [""])[0] == BINARY
+
+
+class BinaryDeltaNamespace(EventNamespace):
+    """An event namespace that sends binary updates to the clients that ask."""
+
+    def __init__(self, namespace: str, app: rx.App):
+        """Initialize the event namespace.
+
+        Args:
+            namespace: The namespace.
+            app: The application object.
+        """
+        super().__init__(namespace, app)
+        # The encoder of each client that asked for binary updates.
+        self.encoders: dict[str, DeltaEncoder] = {}
+
+    def on_connect(self, sid, environ):
+        """Set up the encoder of a client that asks for binary updates.
+
+        Args:
+            sid: The Socket.IO session id.
+            environ: The request information, including HTTP headers.
+        """
+        if wants_binary(environ):
+            self.encoders[sid] = DeltaEncoder()
+
+    def on_disconnect(self, sid):
+        """Drop the encoder of a client.
+
+        Args:
+            sid: The Socket.IO session id.
+        """
+        self.encoders.pop(sid, None)
+
+    async def emit_update(self, update: StateUpdate, sid: str) -> None:
+        """Emit an update to the client, as binary if it asked for it.
+
+        Args:
+            update: The state update to send.
+            sid: The Socket.IO session id.
+        """
+        encoder = self.encoders.get(sid)
+        if encoder is not None:
+            try:
+                message = encoder.encode(update_dict(update))
+            except (TypeError, ValueError) as e:
+                console.debug(f"Sending a JSON update: {e}")
+            else:
+                await self.emit(str(constants.SocketEvent.EVENT), message, to=sid)
+                return
+        await super().emit_update(update, sid)
+
+
+def add_binary_deltas(app: rx.App):
+    """Serve binary updates if `PCWEB_BINARY_DELTAS` is set.
+
+    Args:
+        app: The app to serve them from.
+    """
+    if not env_flag(BINARY_DELTAS_ENV_VAR):
+        return
+    # The event namespace is created along with the state.
+    app.enable_state()
+    namespace = BinaryDeltaNamespace(app.event_namespace.namespace, app)
+    app.event_namespace = namespace
+    app.sio.register_namespace(namespace)
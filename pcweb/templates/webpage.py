@@ -1,3 +1,4 @@
+import functools
 from typing import Callable
 
 import reflex as rx
@@ -8,15 +9,19 @@ from pcweb.route import Route
 DEFAULT_TITLE = "Web Apps in Pure Python"
 
 
-def webpage(path: str, title: str = DEFAULT_TITLE, props=None) -> Callable:
+def webpage(
+    path: str, title: str = DEFAULT_TITLE, props=None, static: bool = False
+) -> Callable:
     """A template that most pages on the reflex.dev site should use.
 
-    This template wraps the webpage with the navbar and footer.
+    This template wraps the webpage with the navbar and footer, which are
+    shared by all pages rather than compiled into each of them.
 
     Args:
         path: The path of the page.
         title: The title of the page.
         props: Props to apply to the template.
+        static: Whether the page content depends on no backend state.
 
     Returns:
         A wrapper function that returns the full webpage.
@@ -33,6 +38,7 @@ def webpage(path: str, title: str = DEFAULT_TITLE, props=None) -> Callable:
             The templated route.
         """
 
+        @functools.wraps(contents)
         def wrapper(*children, **props) -> rx.Component:
             """The template component.
 
@@ -44,19 +50,17 @@ def webpage(path: str, title: str = DEFAULT_TITLE, props=None) -> Callable:
                 The component with the template applied.
             """
             # Import here to avoid circular imports.
-            from pcweb.components_webpage.footer import footer
-            from pcweb.components_webpage.navbar import navbar
-            from pcweb.components_webpage.sidebar import sb
+            from pcweb.components_webpage.layout import site_footer, site_navbar
 
             # Wrap the component in the template.
             return rx.flex(
-                navbar(sidebar=sb),
+                site_navbar(),
                 rx.container(
                     margin_top="150px",
                 ),
                 contents(*children, **props),
                 rx.box(flex_grow=1),
-                footer(),
+                site_footer(),
                 font_family=styles.SANS,
                 # background="#131217",
                 align_items="center",
@@ -75,6 +79,7 @@ def webpage(path: str, title: str = DEFAULT_TITLE, props=None) -> Callable:
             path=path,
             title=title,
             component=wrapper,
+            static=static,
         )
 
     return webpage
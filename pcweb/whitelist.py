@@ -1,20 +1,173 @@
+import fnmatch
+import os
+from functools import lru_cache
+
 # A list of whitelist paths that should be built.
 # If the list is empty, all pages will be built.
+# Plain paths match every page that starts with them, e.g. "/docs".
+# Glob patterns match whole paths: "*" matches within one segment and "**"
+# matches any number of segments, e.g. "/docs/*/introduction" or "/blog/**".
 WHITELISTED_PAGES = []
 
+# A list of paths that should not be built, even if they are whitelisted.
+EXCLUDED_PAGES = []
 
-def _check_whitelisted_path(path):
-    if len(WHITELISTED_PAGES) == 0:
-        return True
+# Comma separated patterns that override the lists above, e.g.
+# PCWEB_WHITELIST="/faq,/docs/**" PCWEB_EXCLUDE="/docs/api-reference" reflex run
+WHITELIST_ENV_VAR = "PCWEB_WHITELIST"
+EXCLUDE_ENV_VAR = "PCWEB_EXCLUDE"
+
+GLOB_CHARS = "*?["
+
+# The key that marks the end of a prefix in the prefix trie.
+END = ""
+
+
+class _GlobNode:
+    """A node of the segment trie for glob patterns."""
+
+    def __init__(self, deep: bool = False):
+        # Children keyed by a literal segment.
+        self.literal: dict[str, _GlobNode] = {}
+        # Children keyed by a segment pattern, e.g. "*" or "page-?".
+        self.wild: dict[str, _GlobNode] = {}
+        # The child for a "**" segment.
+        self.deep_child: _GlobNode | None = None
+        # Whether this node is a "**", which matches any number of segments.
+        self.deep = deep
+        # Whether a pattern ends at this node.
+        self.end = False
+
+
+class PathMatcher:
+    """Match paths against plain prefixes and glob patterns.
+
+    Plain prefixes are stored in a trie of characters and glob patterns in a
+    trie of path segments, so matching a path takes time proportional to its
+    length rather than to the number of patterns.
+    """
+
+    def __init__(self, patterns: list[str]):
+        """Compile the patterns.
+
+        Args:
+            patterns: The patterns to match.
+        """
+        self.prefixes: dict = {}
+        self.globs = _GlobNode()
+        self.root = False
+        self.size = 0
+        for pattern in patterns:
+            self.add(pattern)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def add(self, pattern: str):
+        """Add a pattern.
+
+        Args:
+            pattern: A plain path prefix or a glob pattern.
+        """
+        self.size += 1
+        if pattern == "/":
+            # A plain "/" would match every page, so it only matches the root.
+            self.root = True
+        elif not any(char in pattern for char in GLOB_CHARS):
+            node = self.prefixes
+            for char in pattern:
+                node = node.setdefault(char, {})
+            node[END] = True
+        else:
+            node = self.globs
+            for segment in _segments(pattern):
+                if segment == "**":
+                    node.deep_child = node.deep_child or _GlobNode(deep=True)
+                    node = node.deep_child
+                elif any(char in segment for char in GLOB_CHARS):
+                    node = node.wild.setdefault(segment, _GlobNode())
+                else:
+                    node = node.literal.setdefault(segment, _GlobNode())
+            node.end = True
+
+    def match(self, path: str) -> bool:
+        """Check whether a path matches any of the patterns.
+
+        Args:
+            path: The path to check.
 
+        Returns:
+            Whether the path matches.
+        """
+        if path == "/" and self.root:
+            return True
+
+        node = self.prefixes
+        for char in path:
+            node = node.get(char)
+            if node is None:
+                break
+            if END in node:
+                return True
+
+        states = _closure({self.globs})
+        for segment in _segments(path):
+            following = set()
+            for state in states:
+                if state.deep:
+                    following.add(state)
+                child = state.literal.get(segment)
+                if child is not None:
+                    following.add(child)
+                for pattern, child in state.wild.items():
+                    if fnmatch.fnmatchcase(segment, pattern):
+                        following.add(child)
+            states = _closure(following)
+            if not states:
+                return False
+        return any(state.end for state in states)
+
+
+def _segments(path: str) -> list[str]:
+    return [segment for segment in path.split("/") if segment]
+
+
+def _closure(states: set[_GlobNode]) -> set[_GlobNode]:
+    """Add the states reachable by letting each "**" match no segments."""
+    todo = list(states)
+    while todo:
+        child = todo.pop().deep_child
+        if child is not None and child not in states:
+            states.add(child)
+            todo.append(child)
+    return states
+
+
+def _patterns(env_var: str, default: list[str]) -> list[str]:
+    value = os.environ.get(env_var)
+    if value is None:
+        return default
+    return [pattern.strip() for pattern in value.split(",") if pattern.strip()]
+
+
+@lru_cache(maxsize=None)
+def _matchers() -> tuple[PathMatcher, PathMatcher]:
+    return (
+        PathMatcher(_patterns(WHITELIST_ENV_VAR, WHITELISTED_PAGES)),
+        PathMatcher(_patterns(EXCLUDE_ENV_VAR, EXCLUDED_PAGES)),
+    )
+
+
+def _check_whitelisted_path(path):
     # If the path is the root, always build it.
     if path == "/":
         return True
 
-    if len(WHITELISTED_PAGES) == 1 and WHITELISTED_PAGES[0] == "/":
+    whitelist, excluded = _matchers()
+    if excluded.match(path):
         return False
 
-    for whitelisted_path in WHITELISTED_PAGES:
-        if path.startswith(whitelisted_path):
-            return True
-    return False
+    if not whitelist:
+        return True
+
+    return whitelist.match(path)
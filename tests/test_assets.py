@@ -0,0 +1,64 @@
+"""Tests for fingerprinting assets."""
+
+import json
+
+import pytest
+
+from pcweb.build import assets
+
+
+@pytest.fixture
+def assets_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(assets, "ASSETS_DIR", tmp_path)
+    monkeypatch.setattr(
+        assets, "ASSET_MANIFEST", tmp_path / assets.BUILD_DIR / "manifest.json"
+    )
+    monkeypatch.setattr(assets, "_resolved", {})
+    monkeypatch.setattr(assets, "_build_files", {})
+    (tmp_path / "logo.png").write_bytes(b"logo")
+    return tmp_path
+
+
+def test_asset_is_written_after_compile(assets_dir):
+    url = assets.asset("/logo.png")
+    assert url.startswith("/_build/logo.") and url.endswith(".png")
+    # Resolving an asset has no side effect until the compile hook runs.
+    assert not (assets_dir / assets.BUILD_DIR).exists()
+
+    assets.write_asset_manifest()
+    assert (assets_dir / url.lstrip("/")).read_bytes() == b"logo"
+    manifest = json.loads(assets.ASSET_MANIFEST.read_text())
+    assert manifest == {"/logo.png": url}
+
+
+def test_stale_copies_are_pruned(assets_dir):
+    old = assets.asset("/logo.png")
+    assets.write_asset_manifest()
+
+    (assets_dir / "logo.png").write_bytes(b"new logo")
+    assets.build_output.cache_clear()
+    new = assets.asset("/logo.png")
+    assets.write_asset_manifest()
+    assert new != old
+    assert (assets_dir / new.lstrip("/")).exists()
+    assert not (assets_dir / old.lstrip("/")).exists()
+
+
+def test_unresolved_assets_are_kept(assets_dir):
+    url = assets.asset("/logo.png")
+    assets.write_asset_manifest()
+    # A later build that restores the page from the cache doesn't resolve it.
+    assets._resolved.clear()
+    assets._build_files.clear()
+    assets.write_asset_manifest()
+    assert (assets_dir / url.lstrip("/")).exists()
+    assert json.loads(assets.ASSET_MANIFEST.read_text()) == {"/logo.png": url}
+
+
+def test_svg_asset(assets_dir):
+    url = assets.svg_asset("landing-logo", "<svg/>")
+    assert url.startswith("/_build/inline/landing-logo.")
+    assets.write_asset_manifest()
+    assert (assets_dir / url.lstrip("/")).read_text() == "<svg/>"
+    manifest = json.loads(assets.ASSET_MANIFEST.read_text())
+    assert manifest == {"/inline/landing-logo.svg": url}
@@ -0,0 +1,68 @@
+"""Tests for compiling repeated inline styles to atomic classes."""
+
+import reflex as rx
+
+from pcweb.build.atomic import (
+    atomize,
+    class_name,
+    declaration,
+    read_stylesheet,
+    write_stylesheet,
+)
+
+BORDER = "border: 1px solid red"
+
+
+@rx.memo
+def memo_card(title: str) -> rx.Component:
+    return rx.box(rx.text(title), border="1px solid red;")
+
+
+def test_declaration():
+    assert declaration("boxShadow", " none; ") == "box-shadow: none"
+    assert declaration("WebkitBackgroundClip", "text") == (
+        "-webkit-background-clip: text"
+    )
+    assert class_name(BORDER).startswith("a-")
+
+
+def test_min_uses():
+    once = rx.box(color="blue")
+    twice = [rx.box(border="1px solid red"), rx.text(border="1px solid red;")]
+    rules = atomize([once, *twice])
+    assert rules == {class_name(BORDER): BORDER}
+    for node in twice:
+        assert node.class_name == class_name(BORDER)
+        assert "border" not in node.style
+    # Declarations used only once stay inline.
+    assert once.style["color"] == "blue"
+    assert not once.class_name
+    assert atomize([rx.box(border="1px solid red")], min_uses=1)
+
+
+def test_keeps_existing_classes():
+    nodes = [rx.box(class_name="card", border="1px solid red") for _ in range(2)]
+    atomize(nodes)
+    assert nodes[0].class_name == f"card {class_name(BORDER)}"
+
+
+def test_memo_components():
+    page = rx.box(memo_card(title="a"), rx.box(border="1px solid red"))
+    rules = atomize([page])
+    assert rules == {class_name(BORDER): BORDER}
+    memoized = page.children[0]
+    assert class_name(BORDER) in str(memoized.get_component(memoized))
+
+
+def test_stylesheet(tmp_path):
+    path = tmp_path / "atomic.css"
+    name = class_name(BORDER)
+    write_stylesheet({name: BORDER}, path)
+    assert path.read_text() == f".{name}.{name} {{ {BORDER} }}\n"
+    assert read_stylesheet(path) == {name: BORDER}
+
+    other = class_name("color: blue")
+    write_stylesheet({other: "color: blue"}, path, keep_existing=True)
+    assert read_stylesheet(path) == {name: BORDER, other: "color: blue"}
+    write_stylesheet({other: "color: blue"}, path)
+    assert read_stylesheet(path) == {other: "color: blue"}
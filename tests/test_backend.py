@@ -0,0 +1,79 @@
+"""Tests for booting the app as a backend-only worker."""
+
+import asyncio
+import importlib
+import sys
+
+import reflex as rx
+
+from pcweb.build import app as build_app
+from pcweb.build.backend import BACKEND_ONLY_ENV_VAR
+from pcweb.redirects import (
+    REDIRECT_STATUS,
+    REDIRECTS,
+    add_redirects,
+    write_redirect_map,
+)
+
+
+async def get(api, path: str) -> tuple[int, dict[bytes, bytes]]:
+    """Send a GET request to an ASGI app and get the response status and headers."""
+    scope = {
+        "type": "http",
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+        "server": ("testserver", 80),
+        "client": ("testclient", 50000),
+    }
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await api(scope, receive, send)
+    return messages[0]["status"], dict(messages[0]["headers"])
+
+
+def test_backend_only_serves_events(monkeypatch):
+    monkeypatch.setenv(BACKEND_ONLY_ENV_VAR, "1")
+    monkeypatch.delitem(sys.modules, "pcweb.pcweb", raising=False)
+    app = importlib.import_module("pcweb.pcweb").app
+    assert not app.pages
+    assert app.state is not None
+    assert app.event_namespace is not None
+
+
+def test_redirect_pages(monkeypatch):
+    monkeypatch.delenv(BACKEND_ONLY_ENV_VAR, raising=False)
+    app = rx.App()
+    add_redirects(app)
+    for source, target in REDIRECTS:
+        page = str(app.pages[source.strip("/")])
+        assert f'window.location.replace("{target}")' in page
+        assert f"content={{`0; url={target}`}}" in page
+    # The pages redirect in the browser, without a state.
+    assert app.state is None
+
+
+def test_redirect_routes():
+    app = rx.App()
+    add_redirects(app)
+    for source, target in REDIRECTS:
+        status, headers = asyncio.run(get(app.api, source))
+        assert status == REDIRECT_STATUS
+        assert headers[b"location"] == target.encode()
+
+
+def test_redirect_map_hook_is_registered_once():
+    add_redirects(rx.App())
+    add_redirects(rx.App())
+    assert build_app._post_compile_hooks.count(write_redirect_map) == 1
@@ -0,0 +1,91 @@
+"""Tests for the compiled page cache."""
+
+import json
+
+import reflex as rx
+
+from pcweb.build import cache
+from pcweb.route import Route
+
+PREVIOUS = """import {Fragment} from "react"
+import {Text} from "@chakra-ui/react"
+
+export const Old = memo(() => <Text/>)
+export const Shared = memo(() => <Fragment>old</Fragment>)
+"""
+
+FRESH = """import {Fragment, useState} from "react"
+import "focus-visible/dist/focus-visible"
+
+export const Shared = memo(() => <Fragment>new</Fragment>)
+export function New() {
+  return <Fragment/>
+}
+"""
+
+
+def page():
+    return rx.text("Page")
+
+
+def test_merge_modules():
+    merged = cache.merge_modules(PREVIOUS, FRESH)
+    head, _, body = merged.partition("\n\n")
+    assert head.splitlines() == [
+        'import {Fragment, useState} from "react"',
+        'import "focus-visible/dist/focus-visible"',
+        'import {Text} from "@chakra-ui/react"',
+    ]
+    # The fresh definitions win, and the ones only restored pages use stay.
+    assert "<Fragment>new</Fragment>" in body
+    assert "<Fragment>old</Fragment>" not in body
+    assert "export const Old" in body
+    assert "export function New()" in body
+
+
+def test_module_graph(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "PCWEB_ROOT", tmp_path)
+    (tmp_path / "__init__.py").write_text("")
+    (tmp_path / "pages").mkdir()
+    (tmp_path / "pages" / "__init__.py").write_text("from . import faq\n")
+    (tmp_path / "pages" / "faq.py").write_text(
+        "import reflex as rx\n"
+        "from ..styles import colors\n"
+        "def faq():\n"
+        "    from pcweb.templates import webpage\n"
+    )
+    (tmp_path / "styles.py").write_text("")
+    (tmp_path / "templates.py").write_text("from pcweb.styles import *\n")
+    (tmp_path / "unused.py").write_text("")
+
+    assert cache.module_graph("pcweb.pages.faq") == {
+        "pcweb",
+        "pcweb.pages",
+        "pcweb.pages.faq",
+        "pcweb.styles",
+        "pcweb.templates",
+    }
+    assert cache.module_graph("reflex") == set()
+
+
+def test_route_key(monkeypatch):
+    route = Route(path="/page", title="Page", component=page)
+    key = cache.route_key(route)
+    assert cache.route_key(Route(path="/page", title="Page", component=page)) == key
+    assert cache.route_key(Route(path="/page", title="Other", component=page)) != key
+    assert cache.route_key(Route(path="/other", title="Page", component=page)) != key
+    # The build options that change the compiled pages are part of the key.
+    monkeypatch.setenv("PCWEB_ATOMIC_CSS", "1")
+    assert cache.route_key(route) != key
+
+
+def test_cached_page_restores_contributions():
+    tree = rx.fragment(rx.chakra.text("Chakra"), rx.text("Radix"))
+    contributions = json.loads(json.dumps(cache.page_contributions(tree)))
+    placeholder = cache.CachedPage.create(contributions)
+
+    app_wraps = placeholder._get_all_app_wrap_components()
+    assert sorted(app_wraps) == sorted(tree._get_all_app_wrap_components())
+    assert (60, "ChakraProvider") in app_wraps
+    assert placeholder._get_all_imports().keys() == tree._get_all_imports().keys()
+    assert str(placeholder) == "<Fragment/>"
@@ -0,0 +1,60 @@
+"""Tests for state held in the browser."""
+
+import pytest
+import reflex as rx
+from reflex.components.component import StatefulComponent
+
+from pcweb.client_state import ClientStateVar
+
+
+def test_value_hooks():
+    open_ = ClientStateVar("menu_open", False)
+    component = rx.cond(open_.value, rx.text("Menu"))
+    hooks = "\n".join(component._get_all_hooks_internal())
+    assert 'useState(() => refs["_client_state_menu_open"] ?? false)' in hooks
+    assert 'window.addEventListener("client-state", update)' in hooks
+    assert not open_.value._var_data.state
+
+
+def test_setters():
+    open_ = ClientStateVar("menu_open", False)
+    button = rx.button("Menu", on_click=open_.toggle())
+    assert (
+        'refs["_client_state_menu_open"] = !(refs["_client_state_menu_open"] ?? false)'
+        in str(button)
+    )
+    assert 'refs["_client_state_menu_open"] = true' in str(
+        rx.button(on_click=open_.set_value(True))
+    )
+
+
+def test_invalid_name():
+    with pytest.raises(ValueError):
+        ClientStateVar("menu-open")
+
+
+def test_sync():
+    class TabState(rx.State):
+        tab: str = "one"
+
+        def set_tab(self, tab: str):
+            self.tab = tab
+
+    tab = ClientStateVar("tab", "one", sync=TabState.set_tab)
+    button = rx.button(on_click=tab.set_value("two"))
+    assert (
+        'addEvents([Event("state.tab_state.set_tab", '
+        '{tab:refs["_client_state_tab"]})])' in str(button)
+    )
+    assert "addEvents" not in str(
+        rx.button(on_click=ClientStateVar("tab", "one").set_value("two"))
+    )
+
+
+def test_memoized_setter():
+    open_ = ClientStateVar("menu_open", False)
+    button = StatefulComponent.compile_from(
+        rx.button(rx.cond(open_.value, "Close", "Open"), on_click=open_.toggle())
+    )
+    code = button.code
+    assert 'detail: "menu_open"})))' in code
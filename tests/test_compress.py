@@ -0,0 +1,30 @@
+"""Tests for precompressing the export."""
+
+import gzip
+import json
+
+from pcweb.build.compress import COMPRESSION_MANIFEST, compress_export, encodings
+
+
+def test_compress_export(tmp_path):
+    page = "<p>Hello, world!</p>" * 200
+    (tmp_path / "index.html").write_text(page)
+    (tmp_path / "_next").mkdir()
+    (tmp_path / "_next" / "app.js").write_text("console.log(1);" * 100)
+    (tmp_path / "small.css").write_text("p{margin:0}")
+    (tmp_path / "logo.png").write_bytes(b"\x89PNG" * 1000)
+
+    manifest = compress_export(tmp_path, workers=1)
+
+    assert sorted(manifest) == ["/_next/app.js", "/index.html"]
+    assert manifest["/index.html"]["identity"] == len(page)
+    assert set(manifest["/index.html"]) == {"identity", *encodings()}
+    assert gzip.decompress((tmp_path / "index.html.gz").read_bytes()) == page.encode()
+    assert not (tmp_path / "small.css.gz").exists()
+    assert not (tmp_path / "logo.png.gz").exists()
+    assert json.loads((tmp_path / COMPRESSION_MANIFEST).read_text()) == manifest
+
+    # Running again reuses the variants.
+    mtime = (tmp_path / "index.html.gz").stat().st_mtime_ns
+    assert compress_export(tmp_path, workers=1) == manifest
+    assert (tmp_path / "index.html.gz").stat().st_mtime_ns == mtime
@@ -0,0 +1,96 @@
+"""Tests for the critical CSS extraction."""
+
+from pcweb.build.critical import (
+    CRITICAL_ATTRIBUTE,
+    Fold,
+    critical_rules,
+    inline_critical_css,
+    parse_css,
+)
+
+HTML = """<!DOCTYPE html><html><head>
+<link rel="preload" href="/_next/static/css/app.css" as="style"/>
+<link rel="stylesheet" href="/_next/static/css/app.css" data-n-g=""/>
+</head><body><div id="__next"><nav class="navbar rt-Flex"><a href="/">Home</a></nav>
+<p class="footer">Bottom</p></div></body></html>"""
+
+CSS = """/* reset */
+@font-face{font-family:Sans;src:url(/sans.woff2)}
+:root{--accent:red}
+body,html{margin:0}
+.navbar{display:flex}
+.footer{color:gray}
+.dark .navbar > a:hover{color:white}
+.rt-Flex:where(.rt-r-gap-2){gap:8px}
+.rt-Flex:not(.missing){display:flex}
+#__next .missing{display:none}
+@media (min-width:768px){.navbar{padding:1rem}.footer{padding:2rem}}
+@media print{.footer{display:none}}
+"""
+
+
+def _fold(html: str = HTML, limit: int = 3) -> Fold:
+    fold = Fold(limit)
+    fold.feed(html)
+    return fold
+
+
+def test_fold_limits_elements():
+    fold = _fold()
+    assert {"navbar", "rt-Flex"} <= fold.classes
+    assert "footer" not in fold.classes
+    assert "__next" in fold.ids
+
+
+def test_fold_matches_escaped_names():
+    fold = _fold(
+        '<body><div class="md:flex w-1/2 w-0.5 2xl:p-4" id="a:b"></div></body>'
+    )
+    assert fold.matches(r".md\:flex")
+    assert fold.matches(r"div > .w-1\/2")
+    assert fold.matches(r".w-0\.5")
+    assert fold.matches(r".\32xl\:p-4:hover")
+    assert fold.matches(r"#a\:b")
+    assert not fold.matches(r".md\:grid")
+    assert not fold.matches(r".w-1\/3")
+
+
+def test_parse_css_nests_grouping_rules():
+    rules = parse_css(CSS)
+    assert rules[0] == ("@font-face", "font-family:Sans;src:url(/sans.woff2)")
+    assert rules[-2] == (
+        "@media (min-width:768px)",
+        [(".navbar", "padding:1rem"), (".footer", "padding:2rem")],
+    )
+
+
+def test_critical_rules():
+    preludes = [prelude for prelude, _ in critical_rules(parse_css(CSS), _fold())]
+    assert preludes == [
+        "@font-face",
+        ":root",
+        "body,html",
+        ".navbar",
+        ".dark .navbar > a:hover",
+        ".rt-Flex:where(.rt-r-gap-2)",
+        ".rt-Flex:not(.missing)",
+        "@media (min-width:768px)",
+    ]
+
+
+def test_inline_critical_css(tmp_path):
+    (tmp_path / "_next/static/css").mkdir(parents=True)
+    (tmp_path / "_next/static/css/app.css").write_text(".navbar{display:flex}")
+    page = tmp_path / "index.html"
+    page.write_text(HTML)
+
+    assert inline_critical_css(tmp_path, page) == (21, 21)
+    html = page.read_text()
+    assert f"<style {CRITICAL_ATTRIBUTE}>.navbar{{display:flex}}</style>" in html
+    assert 'media="print" onload="this.media=\'all\'"' in html
+    assert (
+        '<noscript><link rel="stylesheet" href="/_next/static/css/app.css" data-n-g=""/>'
+        "</noscript>" in html
+    )
+    # Pages are only processed once.
+    assert inline_critical_css(tmp_path, page) is None
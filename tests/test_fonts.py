@@ -0,0 +1,83 @@
+"""Tests for the self-hosted fonts."""
+
+import json
+import urllib.error
+import urllib.parse
+
+from pcweb.build import fonts
+
+
+def test_font_weights(tmp_path, monkeypatch):
+    monkeypatch.setattr(fonts, "PCWEB_ROOT", tmp_path)
+    (tmp_path / "page.py").write_text(
+        "rx.text('a', font_weight='medium')\n"
+        "rx.heading('b', weight='Light')\n"
+        "style = {'font_weight': 900, 'font-weight': fw['bold'], 'color': '100'}\n"
+    )
+    # The regular weight, the styles' weights and the weights of page.py.
+    assert fonts.font_weights() == [300, 400, 500, 600, 700, 800, 900]
+
+
+def test_site_font_weights():
+    # The footer and the FAQ use the medium weight.
+    assert 500 in fonts.font_weights()
+
+
+def test_font_stylesheets(tmp_path, monkeypatch):
+    monkeypatch.setattr(fonts, "ASSETS_DIR", tmp_path)
+    monkeypatch.setattr(fonts, "FONTS_CSS", tmp_path / "fonts" / "fonts.css")
+    stylesheets = [f"{fonts.GOOGLE_FONTS_CSS}?family=Inter", "/custom.css"]
+    assert fonts.font_stylesheets(stylesheets) == stylesheets
+
+    fonts.FONTS_CSS.parent.mkdir()
+    fonts.FONTS_CSS.write_text("")
+    assert fonts.font_stylesheets(stylesheets) == ["/custom.css", "/fonts/fonts.css"]
+
+
+def test_font_preloads(tmp_path, monkeypatch):
+    monkeypatch.setattr(fonts, "FONTS_MANIFEST", tmp_path / "fonts.json")
+    assert fonts.font_preloads() == []
+
+    fonts.FONTS_MANIFEST.write_text(json.dumps({"preload": ["/fonts/sans.woff2"]}))
+    [link] = fonts.font_preloads()
+    assert str(link) == (
+        "<link as={`font`} crossOrigin={`anonymous`} href={`/fonts/sans.woff2`} "
+        "rel={`preload`} type={`font/woff2`}/>"
+    )
+
+
+def _face_css(family: str, weight: int, styles: list[str]) -> str:
+    return "\n".join(
+        f"/* latin */\n@font-face {{\n  font-family: '{family}';\n"
+        f"  font-style: {style};\n  font-weight: {weight};\n"
+        f"  src: url(https://fonts.gstatic.com/{style}.woff2) format('woff2');\n"
+        "  unicode-range: U+0000-00FF;\n}"
+        for style in styles
+    )
+
+
+def test_font_faces(monkeypatch):
+    requested = []
+
+    def fetch(url):
+        requested.append(urllib.parse.unquote(url))
+        return _face_css("Sans", 600, ["normal", "italic"]).encode()
+
+    monkeypatch.setattr(fonts, "_fetch", fetch)
+    faces = fonts.font_faces("Sans", 600)
+    assert requested == [f"{fonts.GOOGLE_FONTS_CSS}?family=Sans:ital,wght@0,600;1,600"]
+    assert [face["font-style"] for face in faces] == ["normal", "italic"]
+    assert faces[1]["url"] == "https://fonts.gstatic.com/italic.woff2"
+
+
+def test_font_faces_without_italics(monkeypatch):
+    def fetch(url):
+        if "ital" in url:
+            raise urllib.error.HTTPError(url, 400, "Bad Request", {}, None)
+        return _face_css("Mono", 500, ["normal"]).encode()
+
+    monkeypatch.setattr(fonts, "_fetch", fetch)
+    assert [face["font-style"] for face in fonts.font_faces("Mono", 500)] == ["normal"]
+
+    monkeypatch.setattr(fonts, "_fetch", lambda url: fetch(url + "ital"))
+    assert fonts.font_faces("Mono", 100) == []
@@ -0,0 +1,81 @@
+"""Tests for the icon sprite."""
+
+import ast
+
+import pytest
+
+from pcweb.build import icons
+from pcweb.components_webpage import icon as icon_module
+
+MODULE = """
+import reflex as rx
+
+
+def item(text, url, tag):
+    return rx.link(icon(tag, size=20), text, href=url)
+
+
+def page():
+    return rx.box(
+        rx.icon("sun"),
+        icon(tag="chevron_down"),
+        item("Docs", "/docs", "book-open"),
+        item("FAQ", "/faq", tag="list-todo"),
+        icon(dynamic),
+    )
+"""
+
+LUCIDE_MODULE = """
+import createLucideIcon from '../createLucideIcon.js';
+
+const Sun = createLucideIcon("Sun", [
+  ["circle", { cx: "12", cy: "12", r: "4", key: "4exip2" }],
+  ["path", { d: "M12 2v2", key: "tus03m" }]
+]);
+
+export { Sun as default };
+"""
+
+
+@pytest.mark.parametrize(
+    "tag,expected",
+    [("sun", "sun"), ("chevron_down", "chevron-down"), ("ListChecks", "list-checks")],
+)
+def test_icon_name(tag, expected):
+    assert icons.icon_name(tag) == expected
+
+
+def test_module_icons():
+    assert icons._module_icons(ast.parse(MODULE)) == {
+        "sun",
+        "chevron-down",
+        "book-open",
+        "list-todo",
+    }
+
+
+def test_write_sprite(tmp_path, monkeypatch):
+    monkeypatch.setattr(icons, "LUCIDE_ICONS_DIR", tmp_path)
+    monkeypatch.setattr(icons, "SPRITE_FILE", tmp_path / "icons" / "sprite.svg")
+    (tmp_path / "sun.js").write_text(LUCIDE_MODULE)
+
+    assert icons.icon_symbol("sun") == (
+        '<symbol id="sun" viewBox="0 0 24 24">'
+        '<circle cx="12" cy="12" r="4"/><path d="M12 2v2"/></symbol>'
+    )
+    icons.write_sprite(["sun"])
+    assert icons.sprite_icons() == {"sun"}
+    with pytest.raises(FileNotFoundError):
+        icons.icon_symbol("moon")
+    icons.sprite_icons.cache_clear()
+
+
+def test_icon_props(monkeypatch):
+    monkeypatch.setattr(icon_module, "sprite_icons", lambda: frozenset({"sun"}))
+    monkeypatch.setattr(icon_module, "asset", lambda url: "/_build/sprite.svg")
+    sun = icon_module.icon(
+        "sun", size=16, class_name="spin", custom_attrs={"strokeWidth": "1"}
+    )
+    assert sun.class_name == "lucide lucide-sun spin"
+    assert sun.custom_attrs["width"] == "16"
+    assert sun.custom_attrs["strokeWidth"] == "1"
@@ -0,0 +1,62 @@
+"""Tests for the responsive image variants."""
+
+import pytest
+
+from pcweb.build import assets, images
+from pcweb.components_webpage.image import responsive_image
+
+Image = pytest.importorskip("PIL.Image")
+
+
+@pytest.fixture
+def hero(tmp_path, monkeypatch):
+    for module in (assets, images):
+        monkeypatch.setattr(module, "ASSETS_DIR", tmp_path)
+    monkeypatch.setattr(assets, "_resolved", {})
+    monkeypatch.setattr(assets, "_build_files", {})
+    monkeypatch.setattr(images, "IMAGES_CACHE", tmp_path / "cache")
+    monkeypatch.setattr(images, "_requested", {})
+    Image.new("RGBA", (1000, 500), "violet").save(tmp_path / "hero.png")
+    (tmp_path / "logo.svg").write_text("<svg/>")
+    return tmp_path / "hero.png"
+
+
+def test_image_variants(hero):
+    variants = images.image_variants("/hero.png")
+    assert list(variants) == list(images.supported_formats())
+    for fmt, urls in variants.items():
+        # The image is never scaled up.
+        assert [width for _, width in urls] == [320, 640, 960, 1000]
+        assert all(url.startswith("/_build/images/hero.") for url, _ in urls)
+        assert all(url.endswith(f"w.{fmt}") for url, _ in urls)
+    assert images.image_variants("/logo.svg") == {}
+
+
+def test_generate_image_variants(hero):
+    variants = images.image_variants("/hero.png")
+    images.generate_image_variants(workers=1)
+    for urls in variants.values():
+        for url, width in urls:
+            with Image.open(hero.parent / url.lstrip("/")) as variant:
+                assert variant.size == (width, width // 2)
+
+    # The variants are encoded once, then copied from the cache.
+    hero.unlink()
+    (hero.parent / assets.BUILD_DIR).rename(hero.parent / "old")
+    images.generate_image_variants(workers=1)
+    for urls in variants.values():
+        assert all((hero.parent / url.lstrip("/")).exists() for url, _ in urls)
+
+
+def test_responsive_image_srcset(hero):
+    picture = str(responsive_image("/hero.png", sizes="50vw"))
+    for fmt, urls in images.image_variants("/hero.png").items():
+        srcset = ", ".join(f"{url} {width}w" for url, width in urls)
+        assert f"srcSet={{`{srcset}`}}" in picture
+        assert f"type={{`image/{fmt}`}}" in picture
+    assert "sizes={`50vw`}" in picture
+    assert f"src={{`{assets.asset('/hero.png')}`}}" in picture
+
+    # Other images are served from their fingerprinted file.
+    logo = str(responsive_image("/logo.svg"))
+    assert logo == f"<img src={{`{assets.asset('/logo.svg')}`}}/>"
@@ -0,0 +1,25 @@
+"""Tests for the navbar and footer shared by every page."""
+
+import re
+
+import reflex as rx
+from reflex.compiler import compiler
+
+from pcweb import styles
+from pcweb.components_webpage.layout import site_footer, site_navbar
+
+MARKER = {"outline": "1px solid pink"}
+
+
+def test_memo_components_apply_app_style(monkeypatch):
+    monkeypatch.setattr(styles, "BASE_STYLE", {**styles.BASE_STYLE, rx.box: MARKER})
+    page = rx.box(site_navbar(), rx.text("Page"), site_footer())
+
+    path, code, _ = compiler.compile_components(page._get_all_custom_components())
+    assert path.endswith("components.js")
+    _, *definitions = re.split(r"export const (\w+)", code)
+    memos = dict(zip(definitions[::2], definitions[1::2]))
+    assert memos.keys() == {"SiteNavbar", "SiteFooter"}
+    # Reflex only styles the pages, so the memo components style themselves.
+    for memo in memos.values():
+        assert '"outline": "1px solid pink"' in memo
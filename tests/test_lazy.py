@@ -0,0 +1,35 @@
+"""Tests for components loaded from their own module."""
+
+import pytest
+import reflex as rx
+
+from pcweb.components_webpage import lazy as lazy_module
+from pcweb.components_webpage.lazy import lazy, prefetch, write_lazy_modules
+
+
+def test_lazy_module(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(lazy_module, "_branches", {})
+    component = lazy(rx.text("Dashboard"), "dashboard_demo")
+    module = tmp_path / ".web" / "components" / "lazy" / "dashboard_demo.js"
+    # Nothing is written while the page is built.
+    assert not (tmp_path / ".web").exists()
+
+    write_lazy_modules()
+    assert "export default function Component()" in module.read_text()
+    assert "import('/components/lazy/dashboard_demo')" in "".join(
+        component._get_all_dynamic_imports()
+    )
+    assert str(component) == "<LazyDashboardDemo/>"
+
+
+def test_prefetch():
+    button = rx.button(on_mouse_enter=prefetch("dashboard_demo"))
+    assert "onMouseEnter={() => import('/components/lazy/dashboard_demo')}" in str(
+        button
+    )
+
+
+def test_invalid_name():
+    with pytest.raises(ValueError):
+        lazy(rx.text("Dashboard"), "../dashboard")
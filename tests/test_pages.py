@@ -0,0 +1,66 @@
+"""Tests for the route manifest and the page lookups."""
+
+import pytest
+
+import pcweb.pages
+from pcweb.build import manifest
+
+PAGE = """from pcweb.route import Route
+
+
+def webpage(path, title=None):
+    return lambda component: Route(path=path, title=title, component=component)
+
+
+@webpage("/{name}", "{title}")
+def {name}():
+    return None
+"""
+
+
+@pytest.fixture
+def pages_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(manifest, "PCWEB_ROOT", tmp_path / "pcweb")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    pages_dir = tmp_path / "test_manifest_pages"
+    pages_dir.mkdir()
+    (pages_dir / "__init__.py").write_text("")
+    for name, title in (("zebra", "Zebra"), ("about", "About"), ("faq", "FAQ")):
+        (pages_dir / f"{name}.py").write_text(PAGE.format(name=name, title=title))
+    monkeypatch.setattr(
+        pcweb.pages,
+        "load_manifest",
+        lambda: manifest.load_manifest(pages_dir / "manifest.json"),
+    )
+    return pages_dir
+
+
+def test_load_manifest_without_file(pages_dir):
+    entries = manifest.load_manifest(pages_dir / "manifest.json")
+    assert [entry["path"] for entry in entries] == ["/about", "/faq", "/zebra"]
+    assert entries[0] == {
+        "path": "/about",
+        "module": "test_manifest_pages.about",
+        "attr": "about",
+        "title": "About",
+    }
+    assert not (pages_dir / "manifest.json").exists()
+
+
+def test_get_routes(pages_dir):
+    routes = pcweb.pages.get_routes()
+    assert [route.path for route in routes] == ["/about", "/faq", "/zebra"]
+    routes = pcweb.pages.get_routes(include=lambda path: path != "/faq")
+    assert [route.title for route in routes] == ["About", "Zebra"]
+
+
+def test_get_route(pages_dir):
+    assert pcweb.pages.get_route("/faq").title == "FAQ"
+    with pytest.raises(KeyError):
+        pcweb.pages.get_route("/missing")
+
+
+def test_page_path(pages_dir):
+    assert pcweb.pages.page_path("zebra") == "/zebra"
+    with pytest.raises(KeyError):
+        pcweb.pages.page_path("missing")
@@ -0,0 +1,70 @@
+"""Tests for compiling the pages across a worker pool."""
+
+import concurrent.futures
+import os
+import platform
+
+import pytest
+import reflex as rx
+import reflex.app
+import rich.progress
+
+from pcweb.build.parallel import use_compile_workers
+
+
+class ExecutorChosen(Exception):
+    pass
+
+
+class Progress(rich.progress.Progress):
+    """A progress bar that isn't shown, so a compile may stop midway."""
+
+    def start(self):
+        pass
+
+
+def _executor(kind):
+    def create(max_workers=None, **kwargs):
+        raise ExecutorChosen(kind, max_workers)
+
+    return create
+
+
+@pytest.fixture
+def compile_env(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(reflex.app, "Progress", Progress)
+    monkeypatch.delenv("REFLEX_COMPILE_PROCESSES", raising=False)
+    monkeypatch.delenv("REFLEX_COMPILE_THREADS", raising=False)
+    monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", _executor("process"))
+    monkeypatch.setattr(concurrent.futures, "ThreadPoolExecutor", _executor("thread"))
+
+
+def _chosen_executor() -> tuple[str, int | None]:
+    app = rx.App()
+    app.add_page(rx.text("Page"), "/")
+    with pytest.raises(ExecutorChosen) as chosen:
+        app.compile_()
+    return chosen.value.args
+
+
+@pytest.mark.parametrize(
+    "system, variable, executor",
+    [
+        ("Linux", "REFLEX_COMPILE_PROCESSES", "process"),
+        ("Darwin", "REFLEX_COMPILE_PROCESSES", "process"),
+        ("Windows", "REFLEX_COMPILE_THREADS", "thread"),
+    ],
+)
+def test_use_compile_workers(compile_env, monkeypatch, system, variable, executor):
+    monkeypatch.setattr(platform, "system", lambda: system)
+    use_compile_workers(3)
+    assert os.environ[variable] == "3"
+    assert _chosen_executor() == (executor, 3)
+
+
+def test_use_compile_workers_keeps_set_variables(compile_env, monkeypatch):
+    monkeypatch.setattr(platform, "system", lambda: "Linux")
+    monkeypatch.setenv("REFLEX_COMPILE_PROCESSES", "2")
+    use_compile_workers(3)
+    assert _chosen_executor() == ("process", 2)
@@ -0,0 +1,36 @@
+"""Tests for the build profiler."""
+
+import json
+
+import reflex as rx
+
+from pcweb.build.profiler import BuildProfiler
+from pcweb.route import Route
+
+
+def page():
+    return rx.box(rx.heading("Page"), rx.text("Text"))
+
+
+def test_profile_route(tmp_path):
+    profiler = BuildProfiler(tmp_path / "profile")
+    component = profiler.construct(Route(path="/page", title="Page", component=page))
+    with profiler.measure("/page", "add_page"):
+        str(component)
+    profiler.write()
+
+    report = json.loads((tmp_path / "profile" / "build-profile.json").read_text())
+    [route] = report["routes"]
+    assert route["path"] == "/page"
+    assert route["nodes"] == 5
+    for phase in ("construct", "add_page"):
+        assert set(route[phase]) == {"seconds", "allocated_bytes", "peak_bytes"}
+        assert route[phase]["seconds"] >= 0
+
+    folded = (tmp_path / "profile" / "build-profile.folded").read_text()
+    stacks = [line.rpartition(" ") for line in folded.splitlines()]
+    assert [stack for stack, _, _ in stacks] == [
+        "pcweb;/page;construct",
+        "pcweb;/page;add_page",
+    ]
+    assert all(weight.isdigit() for _, _, weight in stacks)
@@ -0,0 +1,44 @@
+"""Tests for the bounded file scheduler."""
+
+import threading
+import time
+
+import pytest
+
+from pcweb.build.scheduler import FileScheduler
+
+
+def test_map_bounds_open_files(tmp_path):
+    paths = [tmp_path / f"{index}.txt" for index in range(20)]
+    for path in paths:
+        path.write_text(path.stem)
+    files = FileScheduler(max_open=3, concurrency=8)
+    assert files.concurrency == 3
+
+    lock = threading.Lock()
+    open_files = peak = 0
+
+    def read(path):
+        nonlocal open_files, peak
+        with files.open(path) as file:
+            with lock:
+                open_files += 1
+                peak = max(peak, open_files)
+            time.sleep(0.01)
+            with lock:
+                open_files -= 1
+            return file.read().decode()
+
+    assert files.map(read, paths) == [path.stem for path in paths]
+    assert 1 < peak <= 3
+
+
+def test_map_raises_errors(tmp_path):
+    files = FileScheduler(max_open=2)
+    (tmp_path / "present.txt").write_text("")
+    with pytest.raises(FileNotFoundError):
+        files.map(files.read, [tmp_path / "present.txt", tmp_path / "missing.txt"])
+    # The slot of the failed open is released.
+    assert files._free == 2
+    files.copy(tmp_path / "present.txt", tmp_path / "copy" / "present.txt")
+    assert (tmp_path / "copy" / "present.txt").exists()
@@ -0,0 +1,82 @@
+"""Tests for the static server."""
+
+import asyncio
+import gzip
+
+import pytest
+
+from pcweb.build.compress import compress_export
+from pcweb.build.serve import StaticServer, accepted_encodings
+
+PAGE = "<html><body>" + "<p>Hello</p>" * 200 + "</body></html>"
+
+
+@pytest.fixture
+def export_dir(tmp_path):
+    (tmp_path / "index.html").write_text(PAGE)
+    (tmp_path / "faq.html").write_text("<p>FAQ</p>")
+    (tmp_path / "404.html").write_text("<p>Not found</p>")
+    (tmp_path / "_next" / "static").mkdir(parents=True)
+    (tmp_path / "_next" / "static" / "app.js").write_text("1;")
+    (tmp_path / "_redirects").write_text("/docs /docs/intro 308\n")
+    (tmp_path / "_headers").write_text("/faq\n  Cache-Control: public, max-age=0\n")
+    compress_export(tmp_path, workers=1)
+    return tmp_path
+
+
+async def _requests(export_dir, *requests):
+    server = await StaticServer(export_dir).start("127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    responses = []
+    for path, headers in requests:
+        lines = [f"GET {path} HTTP/1.1", "Host: test"]
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode())
+        head = (await reader.readuntil(b"\r\n\r\n")).decode()
+        status_line, *header_lines = head.strip().split("\r\n")
+        response = dict(line.split(": ", 1) for line in header_lines)
+        body = await reader.readexactly(int(response.get("Content-Length", 0)))
+        responses.append((int(status_line.split()[1]), response, body))
+    writer.close()
+    server.close()
+    await server.wait_closed()
+    return responses
+
+
+def test_accepted_encodings():
+    assert accepted_encodings("gzip, deflate, br;q=0.9") == {"gzip", "deflate", "br"}
+    assert accepted_encodings("br;q=0, gzip") == {"gzip"}
+
+
+def test_serve(export_dir):
+    plain, compressed, not_modified, page, asset, missing, redirect = asyncio.run(
+        _requests(
+            export_dir,
+            ("/", {}),
+            ("/", {"Accept-Encoding": "gzip"}),
+            ("/?ref=1", {"If-None-Match": "abc, " + '"0-0"'}),
+            ("/faq", {}),
+            ("/_next/static/app.js", {}),
+            ("/../secret", {}),
+            ("/docs", {}),
+        )
+    )
+    assert plain[0] == 200 and plain[2] == PAGE.encode()
+    assert plain[1]["Vary"] == "Accept-Encoding"
+
+    assert compressed[1]["Content-Encoding"] == "gzip"
+    assert gzip.decompress(compressed[2]) == PAGE.encode()
+    assert compressed[1]["ETag"] != plain[1]["ETag"]
+
+    assert not_modified[0] == 200
+    (revalidated,) = asyncio.run(
+        _requests(export_dir, ("/", {"If-None-Match": plain[1]["ETag"]}))
+    )
+    assert revalidated[0] == 304 and revalidated[2] == b""
+
+    assert page[1]["Cache-Control"] == "public, max-age=0"
+    assert page[1]["Content-Type"] == "text/html; charset=utf-8"
+    assert "immutable" in asset[1]["Cache-Control"]
+    assert missing[0] == 404 and missing[2] == b"<p>Not found</p>"
+    assert redirect[0] == 308 and redirect[1]["Location"] == "/docs/intro"
@@ -0,0 +1,62 @@
+"""Tests for the static page checks and their headers."""
+
+import pytest
+import reflex as rx
+
+from pcweb.build import ssg
+from pcweb.build.export import read_headers
+from pcweb.components_webpage.navbar.navbar import NavbarState
+from pcweb.route import Route
+
+
+class CounterState(rx.State):
+    count: int = 0
+
+
+def page():
+    return rx.text("Page")
+
+
+ROUTE = Route(path="/page", title="Page", component=page, static=True)
+
+
+def test_check_static():
+    ssg.check_static(
+        ROUTE, rx.box(rx.heading("Docs"), rx.text(NavbarState.search_input))
+    )
+
+    with pytest.raises(ValueError, match="count comes from"):
+        ssg.check_static(ROUTE, rx.box(rx.text(CounterState.count)))
+    with pytest.raises(ValueError, match="only renders in the browser"):
+        ssg.check_static(ROUTE, rx.box(rx.plotly()))
+
+
+def test_export_static_pages(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        ssg,
+        "load_manifest",
+        lambda: (
+            {"path": "/docs", "static": True},
+            {"path": "/blank", "static": True},
+            {"path": "/state"},
+            {"path": "/left-out", "static": True},
+        ),
+    )
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "index.html").write_text(
+        '<body><div id="__next"><h1>Docs</h1></div></body>'
+    )
+    (tmp_path / "blank.html").write_text('<body><div id="__next"></div></body>')
+    (tmp_path / "state.html").write_text('<body><div id="__next">State</div></body>')
+    (tmp_path / "_headers").write_text("/_build/*\n  Cache-Control: immutable\n")
+
+    assert ssg.export_static_pages(tmp_path) == 1
+    assert read_headers(tmp_path) == {
+        "/_build/*": {"Cache-Control": "immutable"},
+        "/docs": {"Cache-Control": ssg.STATIC_CACHE_CONTROL},
+    }
+    assert (
+        (tmp_path / "_headers")
+        .read_text()
+        .endswith(f"/docs\n  Cache-Control: {ssg.STATIC_CACHE_CONTROL}\n")
+    )
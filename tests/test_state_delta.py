@@ -0,0 +1,57 @@
+"""Tests for the binary state updates."""
+
+import datetime
+
+import pytest
+
+from pcweb.state_delta import DEFLATED, PLAIN, DeltaDecoder, DeltaEncoder, wants_binary
+
+UPDATE = {
+    "delta": {
+        "state.forms_state": {
+            "clicked": "Privacy",
+            "values": [0, -1, 200, -200, 70_000, -(2**40), 1.5, None, True, "x" * 40],
+        }
+    },
+    "events": [],
+    "final": True,
+}
+
+
+def test_round_trip():
+    encoder, decoder = DeltaEncoder(), DeltaDecoder()
+    messages = [encoder.encode(UPDATE) for _ in range(3)]
+    assert [decoder.decode(message) for message in messages] == [UPDATE] * 3
+    # The keys are interned and the repeated content is deflated away.
+    assert messages[0][0] == DEFLATED
+    assert len(messages[2]) < len(messages[0]) // 2
+
+
+def test_interned_keys():
+    encoder, decoder = DeltaEncoder(), DeltaDecoder()
+    update = {"delta": {"state.index_state": {"signed_up": True}}}
+    first, second = encoder.encode(update), encoder.encode(update)
+    assert first[0] == second[0] == PLAIN
+    assert b"state.index_state" in first and b"state.index_state" not in second
+    assert decoder.decode(first) == decoder.decode(second) == update
+
+
+def test_serialized_values():
+    encoder, decoder = DeltaEncoder(), DeltaDecoder()
+    update = {"delta": {"state": {"day": datetime.date(2024, 1, 2)}}}
+    assert decoder.decode(encoder.encode(update)) == {
+        "delta": {"state": {"day": "2024-01-02"}}
+    }
+
+
+def test_unsupported_value():
+    encoder, decoder = DeltaEncoder(), DeltaDecoder()
+    with pytest.raises(TypeError):
+        encoder.encode({"new_key": object()})
+    # The keys of the failed update weren't sent, so they aren't interned.
+    assert decoder.decode(encoder.encode({"new_key": 1})) == {"new_key": 1}
+
+
+def test_wants_binary():
+    assert wants_binary({"QUERY_STRING": "EIO=4&transport=websocket&delta=binary"})
+    assert not wants_binary({"QUERY_STRING": "EIO=4&transport=websocket"})
@@ -0,0 +1,80 @@
+"""Tests for the per-event state loading plans."""
+
+import asyncio
+
+import reflex as rx
+from reflex.event import Event
+
+from pcweb.build.states import (
+    StateMetricsMiddleware,
+    event_metrics,
+    event_plan,
+    handler_access,
+)
+
+
+class PlanState(rx.State):
+    count: int = 0
+    items: list[str] = []
+
+    def increment(self):
+        self.count += 1
+
+    def add_item(self, item: str):
+        self.items.append(item)
+
+    def reset_count(self):
+        self._set_count(0)
+
+    def _set_count(self, count: int):
+        self.count = count
+
+    async def copy_count(self):
+        other = await self.get_state(OtherPlanState)
+        other.value = self.count
+
+
+class PlanChildState(PlanState):
+    @rx.cached_var
+    def doubled(self) -> int:
+        return self.count * 2
+
+
+class OtherPlanState(rx.State):
+    value: int = 0
+
+
+def test_handler_access():
+    assert handler_access(PlanState, "increment")["writes"] == {"count"}
+    assert handler_access(PlanState, "add_item")["writes"] == {"items"}
+    assert handler_access(PlanState, "reset_count")["writes"] == {"count"}
+    assert handler_access(PlanState, "set_items")["writes"] == {"items"}
+    access = handler_access(PlanState, "copy_count")
+    assert access["reads"] == {"count"}
+    assert access["states"] == {OtherPlanState}
+
+
+def test_event_plan():
+    plan = event_plan(PlanState, "increment")
+    assert plan["states"] == [
+        "state",
+        "state.plan_state",
+        "state.plan_state.plan_child_state",
+    ]
+    assert plan["computed_vars"] == ["state.plan_state.plan_child_state.doubled"]
+    assert event_plan(PlanState, "add_item")["states"] == ["state", "state.plan_state"]
+    assert event_plan(PlanState, "copy_count")["states"] == [
+        "state",
+        "state.plan_state",
+        "state.other_plan_state",
+    ]
+
+
+def test_metrics_middleware():
+    state = rx.State(_reflex_internal_init=True)
+    event = Event(token="token", name="state.plan_state.add_item", payload={})
+    update = asyncio.run(StateMetricsMiddleware().preprocess(None, state, event))
+    assert update is None
+    metrics = event_metrics["state.plan_state.add_item"]
+    assert metrics["events"] == 1
+    assert 0 < metrics["planned"] < metrics["loaded"]
@@ -0,0 +1,122 @@
+"""Tests for the SVG optimizer."""
+
+import re
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import pytest
+
+from pcweb.build.svg import (
+    NUMBER_PATTERN,
+    format_number,
+    normalize,
+    optimize,
+    round_numbers,
+    round_path,
+    viewbox_precision,
+)
+
+SVG = """<svg width=10 height= 10 viewBox="0 0 10 10" xmlns="http://www.w3.org/2000/svg">
+<g filter="url(#used)">
+<path d="M0.123456 1L2 3Z" fill="red"/>
+<path d="M0.123456 1L2 3Z" stroke="blue"/>
+<path d="M4 4H5" stroke="green"/>
+</g>
+<defs>
+<filter id="used"><feBlend in="SourceGraphic"/></filter>
+<filter id="unused"><feBlend in="SourceGraphic"/></filter>
+<linearGradient id="base"><stop offset="1"/></linearGradient>
+<linearGradient id="derived" href="#base"/>
+</defs>
+</svg>
+"""
+
+
+@pytest.mark.parametrize(
+    "number,expected",
+    [
+        ("1.23456", "1.23"),
+        ("2.000", "2"),
+        ("0.400024", "0.4"),
+        ("-0.001", "0"),
+        ("120", "120"),
+        ("1e-5", "0"),
+    ],
+)
+def test_format_number(number, expected):
+    assert format_number(number) == expected
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("M1-0.001L2 3", "M1 0L2 3"),
+        ("M1.5.5l2-.004", "M1.5 0.5l2 0"),
+        ("M1-2.5-.5", "M1-2.5-0.5"),
+        ("M1 -0.001", "M1 0"),
+    ],
+)
+def test_round_numbers_keeps_separators(value, expected):
+    assert round_numbers(value) == expected
+
+
+def test_round_numbers_keeps_path_numbers():
+    svg = Path("assets/companies/dark/reddit.svg").read_text()
+    for value in re.findall(r' d="([^"]*)"', svg):
+        count = len(NUMBER_PATTERN.findall(value))
+        assert len(NUMBER_PATTERN.findall(round_numbers(value))) == count
+
+
+@pytest.mark.parametrize(
+    "data,expected",
+    [
+        # The arc flags are single digits, even without a separator.
+        ("M0 0a2 2 0 012-2", "M0 0a2 2 0 0 1 2-2"),
+        ("M0,0 A2.004,2 0 1,1 2-2z", "M0 0A2 2 0 1 1 2-2z"),
+        ("M0 0a1 1 0 1 0 1 1 1 1 0 0 1 2 2", "M0 0a1 1 0 1 0 1 1 1 1 0 0 1 2 2"),
+        ("M 1 1e-5 L .5-.004", "M1 0L0.5 0"),
+        # Invalid arc flags are left alone.
+        ("M0 0a1 1 0 2 0 1 1", "M0 0a1 1 0 2 0 1 1"),
+    ],
+)
+def test_round_path(data, expected):
+    assert round_path(data) == expected
+
+
+@pytest.mark.parametrize(
+    "viewbox,expected", [("0 0 24 24", 2), ("0 0 1 0.5", 3), ("0 0 837 250", 1)]
+)
+def test_viewbox_precision(viewbox, expected):
+    assert viewbox_precision(ET.fromstring(f'<svg viewBox="{viewbox}"/>')) == expected
+    assert viewbox_precision(ET.fromstring("<svg/>")) == 2
+
+
+def test_optimize_small_viewbox():
+    svg = '<svg viewBox="0 0 1 1"><path d="M0.12345 0.5L1 1"/></svg>'
+    assert 'd="M0.123 0.5L1 1"' in optimize(svg)
+
+
+def test_normalize_quotes_attributes():
+    assert normalize("<svg width=837 height= 250>") == '<svg width="837" height="250">'
+
+
+def test_optimize():
+    root = ET.fromstring(optimize(SVG, id_prefix="p"))
+    ns = {"svg": "http://www.w3.org/2000/svg"}
+
+    # The repeated path is defined once and used twice.
+    shared = root.findall("svg:defs/svg:path", ns)
+    assert [path.get("d") for path in shared] == ["M0.12 1L2 3Z"]
+    uses = root.findall(".//svg:use", ns)
+    assert [use.get("href") for use in uses] == ["#p0", "#p0"]
+    assert [use.get("fill") or use.get("stroke") for use in uses] == ["red", "blue"]
+    assert len(root.findall(".//svg:g/svg:path", ns)) == 1
+
+    # Only the definitions nothing refers to are removed.
+    ids = [child.get("id") for child in root.find("svg:defs", ns)]
+    assert sorted(ids) == ["p0", "used"]
+
+
+def test_optimize_removes_empty_defs():
+    svg = '<svg xmlns="http://www.w3.org/2000/svg"><defs><filter id="a"/></defs></svg>'
+    assert optimize(svg) == '<svg xmlns="http://www.w3.org/2000/svg" />'
@@ -0,0 +1,67 @@
+"""Tests for choosing which pages to build."""
+
+import pytest
+
+from pcweb import whitelist
+from pcweb.whitelist import PathMatcher, _check_whitelisted_path
+
+
+@pytest.mark.parametrize(
+    "patterns,path,expected",
+    [
+        (["/docs"], "/docs", True),
+        (["/docs"], "/docs/getting-started/introduction", True),
+        (["/docs/getting"], "/docs/getting-started", True),
+        (["/docs"], "/faq", False),
+        (["/"], "/", True),
+        (["/"], "/faq", False),
+        (["/docs/*"], "/docs/library", True),
+        (["/docs/*"], "/docs/library/forms", False),
+        (["/docs/*/forms"], "/docs/library/forms", True),
+        (["/docs/**"], "/docs", True),
+        (["/docs/**"], "/docs/library/forms/button", True),
+        (["/docs/**/button"], "/docs/library/forms/button", True),
+        (["/docs/**/button"], "/docs/library/forms/input", False),
+        (["/blog/20??-*"], "/blog/2024-launch", True),
+        (["/blog/20??-*"], "/blog/launch", False),
+    ],
+)
+def test_path_matcher(patterns, path, expected):
+    assert PathMatcher(patterns).match(path) is expected
+
+
+@pytest.fixture
+def patterns(monkeypatch):
+    def set_patterns(include=None, exclude=None):
+        for env_var, value in (
+            (whitelist.WHITELIST_ENV_VAR, include),
+            (whitelist.EXCLUDE_ENV_VAR, exclude),
+        ):
+            if value is None:
+                monkeypatch.delenv(env_var, raising=False)
+            else:
+                monkeypatch.setenv(env_var, value)
+        whitelist._matchers.cache_clear()
+
+    yield set_patterns
+    whitelist._matchers.cache_clear()
+
+
+def test_empty_whitelist_builds_everything(patterns):
+    patterns()
+    assert _check_whitelisted_path("/")
+    assert _check_whitelisted_path("/faq")
+
+
+def test_root_is_always_built(patterns):
+    patterns(include="/faq", exclude="/**")
+    assert _check_whitelisted_path("/")
+    assert not _check_whitelisted_path("/faq")
+
+
+def test_env_overrides(patterns):
+    patterns(include="/docs/**,/faq", exclude="/docs/api-reference")
+    assert _check_whitelisted_path("/faq")
+    assert _check_whitelisted_path("/docs/library")
+    assert not _check_whitelisted_path("/docs/api-reference/app")
+    assert not _check_whitelisted_path("/changelog")